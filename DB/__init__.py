@@ -12,6 +12,12 @@ from DB.tables.services import ServicesTable
 from DB.tables.slots import SlotsTable
 from DB.tables.users import UsersTable
 from DB.tables.masters import MastersTable
+from DB.tables.reminders import RemindersTable
+from DB.tables.schedule import ScheduleTable
+from DB.tables.changelog import ChangelogTable
+from DB.tables.pool import read_pragmas
+
+logger = logging.getLogger(__name__)
 
 
 # logger = logging.getLogger(__name__)
@@ -56,7 +62,10 @@ def init_database():
           PhotosTable() as photos_db,
           AppointmentsTable() as appointments_db,
           AppointmentPhotosTable() as appointments_photos_db,
-          MastersTable() as masters_db):
+          MastersTable() as masters_db,
+          RemindersTable() as reminders_db,
+          ScheduleTable() as schedule_db,
+          ChangelogTable() as changelog_db):
         users_db.create_table()
         queries_db.create_table()
         slots_db.create_table()
@@ -65,3 +74,10 @@ def init_database():
         appointments_db.create_table()
         appointments_photos_db.create_table()
         masters_db.create_table()
+        reminders_db.create_table()
+        schedule_db.create_table()
+        changelog_db.create_table()  # Триггеры на таблицы выше - создавать последней
+        users_db.cursor.execute('ANALYZE')  # Статистика для планировщика, чтобы выбирались индексы по времени слотов
+        logger.info('SQLite settings: %s',
+                    ', '.join(f'{k}={v}' for k, v in read_pragmas(users_db.conn).items()))
+        logger.info('Slot index loaded: %d slots', slots_db.load_slot_index())
@@ -0,0 +1,88 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, Generic, Type, TypeVar
+
+from DB.cache import get_calendar_cache, get_master_registry, get_services_catalog, get_user_cache
+from DB.tables.appointment_photos import AppointmentPhotosTable
+from DB.tables.appointments import AppointmentsTable
+from DB.tables.base import BaseTable, DB_PATH
+from DB.tables.masters import MastersTable
+from DB.tables.photos import PhotosTable
+from DB.tables.queries import QueriesTable
+from DB.tables.reminders import RemindersTable
+from DB.tables.schedule import ScheduleTable
+from DB.tables.services import ServicesTable
+from DB.tables.slots import SlotsTable
+from DB.tables.users import UsersTable
+
+T = TypeVar('T', bound=BaseTable)
+R = TypeVar('R')
+
+DB_WORKERS = 4
+
+_executor = ThreadPoolExecutor(max_workers=DB_WORKERS, thread_name_prefix='db')
+
+
+async def run_in_db(func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """Выполняет синхронную функцию работы с БД в отдельном потоке, не блокируя event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
+
+
+class AsyncTable(Generic[T]):
+    """Асинхронный доступ к таблице.
+
+    Любой метод таблицы можно вызвать через await: ``await aio.users.get_user(user_id)``.
+    Каждый вызов открывает таблицу (соединение берётся из пула) в потоке БД,
+    выполняет метод и фиксирует транзакцию так же, как ``with XTable()``.
+    """
+
+    def __init__(self, table_cls: Type[T], db_name: str = DB_PATH):
+        self._table_cls = table_cls
+        self._db_name = db_name
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        if not callable(getattr(self._table_cls, name, None)):
+            raise AttributeError(f'{self._table_cls.__name__} has no method «{name}»')
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(lambda table: getattr(table, name)(*args, **kwargs))
+
+        call.__name__ = name
+        return call
+
+    async def run(self, func: Callable[[T], R]) -> R:
+        """Выполняет несколько операций над таблицей в одной транзакции"""
+        def job() -> R:
+            with self._table_cls(self._db_name) as table:
+                return func(table)
+
+        return await run_in_db(job)
+
+
+users: AsyncTable[UsersTable] = AsyncTable(UsersTable)
+queries: AsyncTable[QueriesTable] = AsyncTable(QueriesTable)
+slots: AsyncTable[SlotsTable] = AsyncTable(SlotsTable)
+services: AsyncTable[ServicesTable] = AsyncTable(ServicesTable)
+photos: AsyncTable[PhotosTable] = AsyncTable(PhotosTable)
+appointments: AsyncTable[AppointmentsTable] = AsyncTable(AppointmentsTable)
+appointment_photos: AsyncTable[AppointmentPhotosTable] = AsyncTable(AppointmentPhotosTable)
+masters: AsyncTable[MastersTable] = AsyncTable(MastersTable)
+reminders: AsyncTable[RemindersTable] = AsyncTable(RemindersTable)
+schedule: AsyncTable[ScheduleTable] = AsyncTable(ScheduleTable)
+
+users_cache = get_user_cache(DB_PATH)  # Чтение без обращения к потоку БД, если пользователь уже в кэше
+master_registry = get_master_registry(DB_PATH)
+calendar_cache = get_calendar_cache(DB_PATH)
+services_catalog = get_services_catalog(DB_PATH)
+
+
+async def is_master(user_id: int) -> bool:
+    """Является ли пользователь мастером (из реестра в памяти, если он загружен)"""
+    cached = master_registry.is_master(user_id)
+    return cached if cached is not None else await masters.is_master(user_id)
+
+
+def shutdown():
+    _executor.shutdown(wait=True)
@@ -0,0 +1,174 @@
+import gzip
+import json
+import logging
+import shutil
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from DB.tables.base import DB_PATH
+from DB.tables.changelog import ChangelogTable
+from DB.tables.pool import get_pool
+from config.const import BACKUP_FULL_EVERY_DAYS, BACKUP_KEEP, BACKUP_PAGES_STEP, BASE_DIR
+
+logger = logging.getLogger(__name__)
+
+BACKUPS_DIR = BASE_DIR / 'backups'
+FULL_SUFFIX = '.db.gz'
+DELTA_SUFFIX = '.delta.gz'
+_STAMP_FORMAT = '%Y-%m-%d_%H-%M-%S'
+
+_backup_lock = threading.Lock()  # Полный бэкап и дельта не снимаются одновременно
+
+
+@dataclass
+class BackupResult:
+    path: Path
+    size: int  # Байт в сжатом файле
+    db_size: int  # Байт в копии БД (для дельты - в JSON) до сжатия
+    duration: float  # Секунд
+    is_full: bool = True
+
+
+def _compress(src: Path, dst: Path, chunk_size: int = 1024 * 1024):
+    with open(src, 'rb') as f_in, gzip.open(dst, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out, chunk_size)
+
+
+def _stamp(path: Path, prefix: str) -> str:
+    """Время создания из имени <prefix>_<время>.<тип>.gz, строки сравниваются хронологически"""
+    return path.name[len(prefix) + 1:].split('.', 1)[0]
+
+
+def full_backups(backups_dir: Path, prefix: str):
+    """Полные бэкапы от старых к новым (включая .sql.gz старого формата)"""
+    return sorted((p for p in backups_dir.glob(f'{prefix}_*.gz') if not p.name.endswith(DELTA_SUFFIX)),
+                  key=lambda p: _stamp(p, prefix))
+
+
+def delta_backups(backups_dir: Path, prefix: str):
+    return sorted(backups_dir.glob(f'{prefix}_*{DELTA_SUFFIX}'), key=lambda p: _stamp(p, prefix))
+
+
+def _apply_retention(backups_dir: Path, prefix: str, keep: int):
+    """Хранит keep последних полных бэкапов и дельты к ним"""
+    fulls = full_backups(backups_dir, prefix)
+    old, kept = (fulls[:-keep], fulls[-keep:]) if keep else (fulls, [])
+    if kept:
+        oldest_kept = _stamp(kept[0], prefix)
+        old += [p for p in delta_backups(backups_dir, prefix) if _stamp(p, prefix) < oldest_kept]
+    for path in old:
+        path.unlink()
+        logger.info('Backup %s removed by retention policy', path.name)
+
+
+def _has_changelog(conn: sqlite3.Connection) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'changelog'").fetchone() is not None
+
+
+def backup_database(db_name: str = DB_PATH,
+                    backups_dir: Path = BACKUPS_DIR,
+                    keep: int = BACKUP_KEEP,
+                    pages: int = BACKUP_PAGES_STEP) -> BackupResult:
+    """Снимает копию работающей БД и сжимает её в backups_dir/<имя>_<время>.db.gz.
+
+    Копирование идёт через SQLite backup API порциями по pages страниц, между которыми
+    БД доступна другим соединениям. Целостность проверяется на копии, а не на рабочей БД.
+    Журнал изменений, вошедших в копию, очищается - следующая дельта считается от неё.
+    Хранятся keep последних копий. Функция блокирующая - вызывать в отдельном потоке.
+    """
+    with _backup_lock:
+        started = time.monotonic()
+        backups_dir.mkdir(exist_ok=True)
+        prefix = Path(db_name).stem
+        name = f'{prefix}_{datetime.now().strftime(_STAMP_FORMAT)}'
+        snapshot = backups_dir / f'{name}.db.tmp'
+        archive = backups_dir / f'{name}{FULL_SUFFIX}'
+
+        pool = get_pool(db_name)
+        source = pool.acquire()
+        try:
+            # Изменения, записанные в журнал во время копирования, попадут и в следующую дельту - это безопасно
+            changelog_up_to = source.execute('SELECT COALESCE(MAX(id), 0) FROM changelog').fetchone()[0] \
+                if _has_changelog(source) else None
+            target = sqlite3.connect(snapshot)
+            try:
+                source.backup(target, pages=pages, sleep=0.005)
+                result = target.execute('PRAGMA integrity_check').fetchone()[0]
+            finally:
+                target.close()
+            if result != 'ok':
+                raise ValueError(f'Database integrity check failed: {result}')
+
+            db_size = snapshot.stat().st_size
+            _compress(snapshot, archive)
+        except Exception:
+            archive.unlink(missing_ok=True)
+            raise
+        finally:
+            pool.release(source)
+            snapshot.unlink(missing_ok=True)
+
+        if changelog_up_to is not None:
+            with ChangelogTable(db_name) as changelog_db:
+                changelog_db.purge(changelog_up_to)
+
+        _apply_retention(backups_dir, prefix, keep)
+        backup = BackupResult(archive, archive.stat().st_size, db_size, time.monotonic() - started)
+        logger.info('Backup %s created: %d bytes (%d uncompressed) in %.1fs',
+                    archive.name, backup.size, backup.db_size, backup.duration)
+        return backup
+
+
+def backup_changes(db_name: str = DB_PATH, backups_dir: Path = BACKUPS_DIR) -> Optional[BackupResult]:
+    """Сохраняет изменения с прошлого бэкапа в backups_dir/<имя>_<время>.delta.gz.
+
+    Дельта содержит текущее состояние каждой изменённой строки отслеживаемых таблиц
+    (None - строка удалена), поэтому её повторное применение безопасно.
+    Возвращает None, если изменений не было.
+    """
+    with _backup_lock:
+        started = time.monotonic()
+        with ChangelogTable(db_name) as changelog_db:
+            up_to, changes = changelog_db.collect_changes()
+        if not changes:
+            return None
+
+        backups_dir.mkdir(exist_ok=True)
+        prefix = Path(db_name).stem
+        name = f'{prefix}_{datetime.now().strftime(_STAMP_FORMAT)}'
+        archive = backups_dir / f'{name}{DELTA_SUFFIX}'
+        data = json.dumps({'changes': changes}, ensure_ascii=False).encode()
+        tmp = archive.with_suffix('.tmp')
+        with gzip.open(tmp, 'wb') as f:
+            f.write(data)
+        tmp.replace(archive)
+
+        with ChangelogTable(db_name) as changelog_db:
+            changelog_db.purge(up_to)
+
+        backup = BackupResult(archive, archive.stat().st_size, len(data), time.monotonic() - started, is_full=False)
+        logger.info('Incremental backup %s created: %d rows, %d bytes in %.1fs', archive.name,
+                    sum(len(rows) for rows in changes.values()), backup.size, backup.duration)
+        return backup
+
+
+def run_backup(db_name: str = DB_PATH,
+               backups_dir: Path = BACKUPS_DIR,
+               full_every: timedelta = timedelta(days=BACKUP_FULL_EVERY_DAYS)) -> Optional[BackupResult]:
+    """Полный бэкап, если последнему больше full_every, иначе - дельта изменений"""
+    prefix = Path(db_name).stem
+    fulls = full_backups(backups_dir, prefix) if backups_dir.exists() else []
+    last_full = None
+    if fulls:
+        try:
+            last_full = datetime.strptime(_stamp(fulls[-1], prefix), _STAMP_FORMAT)
+        except ValueError:  # Бэкап старого формата - следующий будет полным
+            pass
+    if last_full is None or datetime.now() - last_full >= full_every:
+        return backup_database(db_name, backups_dir)
+    return backup_changes(db_name, backups_dir)
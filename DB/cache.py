@@ -0,0 +1,237 @@
+import threading
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+from DB.models import Master, ServiceModel, UserModel
+from config.const import CALENDAR_CACHE_SIZE, CALENDAR_CACHE_TTL, USER_CACHE_SIZE, USER_CACHE_TTL
+from utils.cache import TTLCache
+from utils.interval_tree import IntervalTree
+
+_user_caches: Dict[str, TTLCache[int, UserModel]] = {}
+_master_registries: Dict[str, 'MasterRegistry'] = {}
+_calendar_caches: Dict[str, 'CalendarCache'] = {}
+_services_catalogs: Dict[str, 'ServicesCatalog'] = {}
+_slot_indexes: Dict[str, 'SlotIndex'] = {}
+_lock = threading.Lock()
+
+
+def get_user_cache(db_name: str) -> TTLCache[int, UserModel]:
+    """Кэш пользователей по user_id для файла БД.
+
+    Заполняется и обновляется только в UsersTable (write-through), снаружи его можно лишь читать.
+    Закэшированные модели общие для всех читателей и не должны изменяться.
+    """
+    cache = _user_caches.get(db_name)
+    if cache is None:
+        with _lock:
+            cache = _user_caches.setdefault(db_name, TTLCache('users', USER_CACHE_SIZE, USER_CACHE_TTL))
+    return cache
+
+
+class MasterRegistry:
+    """Список мастеров в памяти.
+
+    Загружается MastersTable целиком при первом обращении.
+    Изменение состава мастеров или их профилей сбрасывает список.
+    Текущее состояние ленты мастера обновляется на месте, без сброса.
+    Номер версии не даёт сохранить список, прочитанный до изменения во время загрузки.
+    """
+
+    def __init__(self):
+        self._masters: Optional[Dict[int, Master]] = None
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> Tuple[Optional[Dict[int, Master]], int]:
+        """Текущий список (None, если не загружен) и его версия"""
+        with self._lock:
+            return self._masters, self._version
+
+    def fill(self, masters: Dict[int, Master], version: int):
+        with self._lock:
+            if version == self._version:
+                self._masters = masters
+
+    def invalidate(self):
+        with self._lock:
+            self._masters = None
+            self._version += 1
+
+    def patch(self, master_id: int, **changes: Any):
+        """Обновляет поля мастера в загруженном списке, не сбрасывая его"""
+        with self._lock:
+            if self._masters is not None and master_id in self._masters:
+                masters = dict(self._masters)  # Выданные ранее словари не меняются
+                masters[master_id] = replace(masters[master_id], **changes)
+                self._masters = masters
+            self._version += 1
+
+    def is_master(self, user_id: int) -> Optional[bool]:
+        """Является ли пользователь мастером. None - реестр ещё не загружен, нужно спросить MastersTable"""
+        masters = self._masters
+        return None if masters is None else user_id in masters
+
+    def all(self) -> Optional[List[Master]]:
+        masters = self._masters
+        return None if masters is None else list(masters.values())
+
+
+def get_master_registry(db_name: str) -> MasterRegistry:
+    """Реестр мастеров для файла БД"""
+    registry = _master_registries.get(db_name)
+    if registry is None:
+        with _lock:
+            registry = _master_registries.setdefault(db_name, MasterRegistry())
+    return registry
+
+
+class CalendarCache:
+    """Данные календаря по месяцам: время доступных слотов и подтверждённых записей.
+
+    Заполняется при построении календаря и сбрасывается целиком при изменении слотов или записей
+    в SlotsTable и AppointmentsTable. Хранятся сырые времена, а не готовые даты, чтобы отсечение
+    прошедшего выполнялось при каждом чтении. Версия, как в MasterRegistry, не даёт сохранить
+    данные, прочитанные до изменения.
+    """
+
+    def __init__(self, maxsize: int = CALENDAR_CACHE_SIZE, ttl: float = CALENDAR_CACHE_TTL):
+        self._data: TTLCache[Hashable, Any] = TTLCache('calendar', maxsize, ttl)
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[Optional[Any], int]:
+        """Данные по ключу (None - нет в кэше) и версия, которую нужно передать в fill"""
+        with self._lock:
+            version = self._version
+        return self._data.get(key), version
+
+    def fill(self, key: Hashable, value: Any, version: int):
+        with self._lock:
+            if version == self._version:
+                self._data.set(key, value)
+
+    def invalidate(self):
+        with self._lock:
+            self._version += 1
+            self._data.clear()
+
+
+def get_calendar_cache(db_name: str) -> CalendarCache:
+    """Кэш календаря для файла БД"""
+    cache = _calendar_caches.get(db_name)
+    if cache is None:
+        with _lock:
+            cache = _calendar_caches.setdefault(db_name, CalendarCache())
+    return cache
+
+
+@dataclass(frozen=True)
+class ServicesSnapshot:
+    """Неизменяемый список услуг. Модели общие для всех читателей и не должны изменяться"""
+    version: int
+    services: Tuple[ServiceModel, ...]  # Все услуги по возрастанию ID
+    active: Tuple[ServiceModel, ...] = field(init=False)
+    by_id: Mapping[int, ServiceModel] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'active', tuple(s for s in self.services if s.is_active))
+        object.__setattr__(self, 'by_id', MappingProxyType({s.id: s for s in self.services}))
+
+
+class ServicesCatalog:
+    """Каталог услуг в памяти.
+
+    ServicesTable загружает его целиком при первом чтении и сразу перестраивает после каждого
+    изменения услуг. Версия растёт при каждом изменении, по ней клавиатуры и данные FSM
+    проверяют, не устарели ли они. Снимок заменяется целиком, поэтому читатель всегда видит
+    согласованный список.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[ServicesSnapshot] = None
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def snapshot(self) -> Tuple[Optional[ServicesSnapshot], int]:
+        """Текущий снимок (None, если не загружен или устарел) и версия для fill"""
+        with self._lock:
+            return self._snapshot, self._version
+
+    def fill(self, services: List[ServiceModel], version: int) -> ServicesSnapshot:
+        """Публикует загруженный список, если с начала загрузки услуги не менялись"""
+        snapshot = ServicesSnapshot(version, tuple(sorted(services, key=lambda s: s.id)))
+        with self._lock:
+            if version == self._version:
+                self._snapshot = snapshot
+        return snapshot
+
+    def invalidate(self):
+        with self._lock:
+            self._snapshot = None
+            self._version += 1
+
+
+def get_services_catalog(db_name: str) -> ServicesCatalog:
+    """Каталог услуг для файла БД"""
+    catalog = _services_catalogs.get(db_name)
+    if catalog is None:
+        with _lock:
+            catalog = _services_catalogs.setdefault(db_name, ServicesCatalog())
+    return catalog
+
+
+class SlotIndex:
+    """Интервалы неудалённых слотов в памяти для проверки пересечений за O(log n).
+
+    Загружается SlotsTable целиком при старте (или при первой проверке) и обновляется ей после
+    добавления и удаления слотов. Проверка и запись слота выполняются под lock, чтобы два
+    пересекающихся слота не были добавлены одновременно из разных потоков.
+    """
+
+    def __init__(self):
+        self._tree: Optional[IntervalTree[int]] = None
+        self.lock = threading.RLock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._tree is not None
+
+    def __len__(self) -> int:
+        tree = self._tree
+        return 0 if tree is None else len(tree)
+
+    def load(self, slots: Iterable[Tuple[datetime, datetime, int]]):
+        """Заменяет содержимое индекса: (начало, конец, ID слота)"""
+        tree = IntervalTree(slots)
+        with self.lock:
+            self._tree = tree
+
+    def find_overlap(self, start: datetime, end: datetime) -> Optional[Tuple[datetime, datetime, int]]:
+        """Слот, пересекающийся с интервалом, или None. Индекс должен быть загружен"""
+        with self.lock:
+            return self._tree.find_overlap(start, end)
+
+    def add(self, slot_id: int, start: datetime, end: datetime):
+        with self.lock:
+            if self._tree is not None:
+                self._tree.add(start, end, slot_id)
+
+    def remove(self, slot_id: int):
+        with self.lock:
+            if self._tree is not None:
+                self._tree.remove(slot_id)
+
+
+def get_slot_index(db_name: str) -> SlotIndex:
+    """Индекс слотов для файла БД"""
+    index = _slot_indexes.get(db_name)
+    if index is None:
+        with _lock:
+            index = _slot_indexes.setdefault(db_name, SlotIndex())
+    return index
@@ -1,7 +1,7 @@
 import logging
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional, List, Any, Dict
+from datetime import date, datetime, time, timedelta
+from typing import Optional, List, Any, Dict, Iterator, Tuple
 
 from pydantic import BaseModel
 
@@ -50,6 +50,8 @@ class Pagination:
     per_page: int
     total_items: int
     total_pages: int
+    first_key: Optional[int] = None  # ID первой и последней строки страницы - якоря для соседних страниц
+    last_key: Optional[int] = None
 
     @property
     def has_prev(self) -> bool:
@@ -90,6 +92,38 @@ class SlotModel:
         return f'{start}{PHRASES_RU.icon.time_separator}{end}'
 
 
+Window = Tuple[time, time]  # Начало и конец слота
+
+
+@dataclass
+class ScheduleTemplate:
+    """Недельный шаблон расписания.
+
+    weekdays - окна слотов по дню недели (0 - понедельник), exceptions - окна на отдельные даты,
+    заменяющие окна дня недели (пустой список - выходной).
+    """
+    weekdays: Dict[int, List[Window]]
+    exceptions: Dict[date, List[Window]]
+
+    def expand(self, start: date, end: date) -> Iterator[Tuple[datetime, datetime]]:
+        """Слоты с даты start по end включительно в порядке времени"""
+        # Окна переводятся в смещения от полуночи один раз, а не для каждого дня
+        def offsets(windows: List[Window]) -> List[Tuple[timedelta, timedelta]]:
+            return [(datetime.combine(date.min, s) - datetime.min, datetime.combine(date.min, e) - datetime.min)
+                    for s, e in sorted(windows)]
+
+        by_weekday = [offsets(self.weekdays.get(weekday, [])) for weekday in range(7)]
+        by_day = {day: offsets(windows) for day, windows in self.exceptions.items() if start <= day <= end}
+
+        midnight = datetime.combine(start, time.min)
+        weekday = start.weekday()
+        for i in range((end - start).days + 1):
+            day_offsets = by_day.get(start + timedelta(days=i)) if by_day else None
+            for s, e in by_weekday[(weekday + i) % 7] if day_offsets is None else day_offsets:
+                yield midnight + s, midnight + e
+            midnight += timedelta(days=1)
+
+
 @dataclass
 class PhotoModel:
     """Класс для представления фото референсов"""
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, List, Optional
+
+from DB.aio import run_in_db
+from DB.models import QueryModel
+from DB.tables.base import DB_PATH
+from DB.tables.queries import QueriesTable
+from config.const import QUERY_LOG_BATCH_SIZE, QUERY_LOG_FLUSH_SECONDS, QUERY_LOG_MAX_QUEUE
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class QueryLogWriter:
+    """Отложенная запись журнала запросов пользователей.
+
+    add() только кладёт запрос в буфер. Буфер сбрасывается в БД одной транзакцией,
+    когда в нём набирается batch_size записей или проходит flush_interval секунд, и при stop().
+    Если БД не успевает, записи сверх max_queue отбрасываются (метрика query_log_dropped).
+    """
+
+    def __init__(self,
+                 db_name: str = DB_PATH,
+                 batch_size: int = QUERY_LOG_BATCH_SIZE,
+                 flush_interval: float = QUERY_LOG_FLUSH_SECONDS,
+                 max_queue: int = QUERY_LOG_MAX_QUEUE):
+        self.db_name = db_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+
+        self._buffer: Deque[QueryModel] = deque()
+        self._full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def add(self, query: QueryModel):
+        if len(self._buffer) >= self.max_queue:
+            metrics.inc('query_log_dropped')
+            return
+        if query.query_date is None:
+            query.query_date = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._buffer.append(query)
+        metrics.set('query_log_queue_depth', len(self._buffer))
+        if len(self._buffer) >= self.batch_size:
+            self._full.set()
+
+    def _write(self, batch: List[QueryModel]) -> int:
+        with QueriesTable(self.db_name) as queries_db:
+            return queries_db.add_queries(batch)
+
+    async def flush(self):
+        async with self._flush_lock:
+            while self._buffer:
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                try:
+                    await run_in_db(self._write, batch)
+                except Exception as e:
+                    logger.error('Failed to write %d queries: %s', len(batch), e)
+                    room = self.max_queue - len(self._buffer)
+                    self._buffer.extendleft(reversed(batch[:room]))  # Повторим при следующем сбросе
+                    metrics.inc('query_log_dropped', max(len(batch) - room, 0))
+                    break
+                else:
+                    metrics.inc('query_log_written', len(batch))
+                finally:
+                    metrics.set('query_log_queue_depth', len(self._buffer))
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            await self.flush()
+
+    def start(self):
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Останавливает фоновый сброс, дождавшись записи остатка буфера"""
+        if self._task is not None:
+            self._stopping = True
+            self._full.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+
+query_log = QueryLogWriter()
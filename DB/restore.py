@@ -0,0 +1,78 @@
+"""Восстановление БД из полного бэкапа и дельт изменений к нему.
+
+    python -m DB.restore --backups backups --out restored.db [--until 2025-01-31_03-00-00]
+"""
+import argparse
+import gzip
+import json
+import logging
+import shutil
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+from DB.backup import _has_changelog, _stamp, delta_backups, full_backups
+from DB.tables.changelog import TRACKED_TABLES
+
+logger = logging.getLogger(__name__)
+
+
+def _apply_delta(conn: sqlite3.Connection, changes: dict):
+    for table, rows in changes.items():
+        if table not in TRACKED_TABLES:
+            raise ValueError(f'Unknown table in delta: {table}')
+        columns = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+        for row_id, row in rows.items():
+            if row is None:
+                conn.execute(f'DELETE FROM {table} WHERE rowid = ?', (int(row_id),))
+                continue
+            unknown = set(row) - columns
+            if unknown:
+                raise ValueError(f'Unknown columns in delta for {table}: {", ".join(sorted(unknown))}')
+            conn.execute(f'INSERT OR REPLACE INTO {table} (rowid, {", ".join(row)}) '
+                         f'VALUES (?, {", ".join("?" * len(row))})', (int(row_id), *row.values()))
+
+
+def restore(backups_dir: Path, target: Path, prefix: str = 'z_users', until: Optional[str] = None) -> int:
+    """Собирает БД в target: последний полный бэкап не позже until и дельты после него.
+
+    :param until: Время в формате имён бэкапов (%Y-%m-%d_%H-%M-%S), по умолчанию - последний бэкап
+    :return: Количество применённых дельт
+    """
+    fulls = [p for p in full_backups(backups_dir, prefix)
+             if p.name.endswith('.db.gz') and (until is None or _stamp(p, prefix) <= until)]
+    if not fulls:
+        raise FileNotFoundError(f'No full backups of {prefix} in {backups_dir}')
+    base = fulls[-1]
+    base_stamp = _stamp(base, prefix)
+
+    with gzip.open(base, 'rb') as f_in, open(target, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+
+    deltas = [p for p in delta_backups(backups_dir, prefix)
+              if _stamp(p, prefix) > base_stamp and (until is None or _stamp(p, prefix) <= until)]
+    conn = sqlite3.connect(target)
+    try:
+        conn.execute('PRAGMA foreign_keys = OFF')  # Дельта упорядочена по таблицам, а не по времени изменений
+        for delta in deltas:
+            with gzip.open(delta, 'rt', encoding='utf-8') as f:
+                _apply_delta(conn, json.load(f)['changes'])
+        if _has_changelog(conn):
+            conn.execute('DELETE FROM changelog')  # Записи от применения дельт, журнал живой БД начнётся заново
+        conn.commit()
+    finally:
+        conn.close()
+    logger.info('Restored %s from %s and %d deltas', target, base.name, len(deltas))
+    return len(deltas)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Восстановление БД из бэкапов')
+    parser.add_argument('--backups', type=Path, default=Path('backups'), help='Каталог с бэкапами')
+    parser.add_argument('--out', type=Path, required=True, help='Файл восстановленной БД')
+    parser.add_argument('--prefix', default='z_users', help='Имя БД в названиях бэкапов')
+    parser.add_argument('--until', help='Восстановить на момент (%%Y-%%m-%%d_%%H-%%M-%%S)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    restore(args.backups, args.out, args.prefix, args.until)
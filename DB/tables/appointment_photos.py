@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, Iterable, List
 
 from DB.models import PhotoModel
 from DB.tables.base import BaseTable
@@ -6,6 +6,7 @@ from DB.tables.base import BaseTable
 
 class AppointmentPhotosTable(BaseTable):
     __tablename__ = 'appointment_photos'
+    __batch_size = 500  # Не больше параметров в одном IN (...), чем допускает SQLite
 
     def create_table(self) -> None:
         """Создание таблицы appointment_photos с индексами"""
@@ -60,3 +61,25 @@ class AppointmentPhotosTable(BaseTable):
             file_unique_id=row['file_unique_id'],
             caption=row['caption']
         ) for row in self.cursor]
+
+    def get_photos_by_appointments(self, appointment_ids: Iterable[int]) -> Dict[int, List[PhotoModel]]:
+        """Возвращает фото сразу для нескольких записей: {appointment_id: [фото]}"""
+        ids = list(dict.fromkeys(appointment_ids))
+        photos: Dict[int, List[PhotoModel]] = {}
+        for i in range(0, len(ids), self.__batch_size):
+            batch = ids[i:i + self.__batch_size]
+            query = f"""
+            SELECT ap.appointment_id, p.* 
+            FROM {self.__tablename__} ap
+            JOIN photos p ON ap.photo_id = p.id
+            WHERE ap.appointment_id IN ({', '.join('?' * len(batch))})
+            """
+            self.cursor.execute(query, batch)
+            for row in self.cursor:
+                photos.setdefault(row['appointment_id'], []).append(PhotoModel(
+                    id=row['id'],
+                    telegram_file_id=row['telegram_file_id'],
+                    file_unique_id=row['file_unique_id'],
+                    caption=row['caption']
+                ))
+        return photos
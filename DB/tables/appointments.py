@@ -1,9 +1,10 @@
-from datetime import datetime, timedelta, timezone, date
-from typing import Optional, Set, Tuple, List
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple, List
 
-from DB.models import AppointmentModel, UserModel, SlotModel, ServiceModel, Pagination, ClientWithStats, ClientStats
+from DB.cache import get_calendar_cache
+from DB.models import AppointmentModel, UserModel, SlotModel, ServiceModel, Pagination, ClientWithStats, ClientStats, PhotoModel
 from DB.tables.appointment_photos import AppointmentPhotosTable
-from DB.tables.base import BaseTable
+from DB.tables.base import BaseTable, DB_PATH, SeekKey
 from config.const import PENDING, COMPLETED, CONFIRMED, CANCELLED, REJECTED
 
 
@@ -11,6 +12,15 @@ class AppointmentsTable(BaseTable):
     __tablename__ = 'appointments'
     __valid_statuses = {PENDING, CONFIRMED, CANCELLED, COMPLETED, REJECTED}
     __timezone_offset = timezone(timedelta(hours=3))  # Для MSK (UTC+3)
+    __seek_by_update = SeekKey(key='a.updated_at', row_id='a.id', descending=True,
+                               anchor_key='SELECT updated_at FROM appointments WHERE id = ?')
+    __seek_by_slot = SeekKey(key='sl.start_time', row_id='a.id',
+                             anchor_key='SELECT sl2.start_time FROM appointments a2 '
+                                        'JOIN slots sl2 ON a2.slot_id = sl2.id WHERE a2.id = ?')
+
+    def __init__(self, db_name: str = DB_PATH):
+        super().__init__(db_name)
+        self._calendar = get_calendar_cache(db_name)
 
     def _parse_datetime(self, dt_str: Optional[str]) -> Optional[datetime]:
         if not dt_str:
@@ -20,6 +30,13 @@ class AppointmentsTable(BaseTable):
             dt = dt.replace(tzinfo=timezone.utc)
         return dt.astimezone(self.__timezone_offset)
 
+    def _load_photos(self, appointment_ids: List[int]) -> Dict[int, List[PhotoModel]]:
+        """Фото для всех записей выборки одним запросом"""
+        if not appointment_ids:
+            return {}
+        with AppointmentPhotosTable(self.db_name) as app_ph_db:
+            return app_ph_db.get_photos_by_appointments(appointment_ids)
+
     def create_table(self) -> None:
         """Создание таблицы appointments с индексами и триггером"""
         self.cursor.executescript(f'''
@@ -40,6 +57,7 @@ class AppointmentsTable(BaseTable):
             CREATE INDEX IF NOT EXISTS idx_appointments_client ON {self.__tablename__}(client_id);
             CREATE INDEX IF NOT EXISTS idx_appointments_slot ON {self.__tablename__}(slot_id);
             CREATE INDEX IF NOT EXISTS idx_appointments_status ON {self.__tablename__}(status);
+            CREATE INDEX IF NOT EXISTS idx_appointments_updated ON {self.__tablename__}(updated_at, id);
 
             CREATE TRIGGER IF NOT EXISTS update_appointments_timestamp
             AFTER UPDATE ON {self.__tablename__}
@@ -76,6 +94,7 @@ class AppointmentsTable(BaseTable):
         """
         self.cursor.execute(query, (client_id, slot_id, service_id, comment, status))
         self.conn.commit()
+        self._calendar.invalidate()
         appointment_id = self.cursor.lastrowid
         self._log('CREATE_APPOINTMENT',
                   client_id=client_id,
@@ -110,7 +129,7 @@ class AppointmentsTable(BaseTable):
         if not row:
             return None
 
-        with AppointmentPhotosTable() as app_ph_db:
+        with AppointmentPhotosTable(self.db_name) as app_ph_db:
             return AppointmentModel(
                 appointment_id=row['id'],
                 client=UserModel(user_id=row['client_id'],
@@ -169,12 +188,21 @@ class AppointmentsTable(BaseTable):
         result = self.cursor.fetchone()
         return result['count'] if result else 0
 
-    def get_client_appointments(self, client_id: int, page: int = 1, only_future: bool = True) -> tuple[Optional[AppointmentModel], Pagination]:
+    def get_client_appointments(self,
+                                client_id: int,
+                                page: int = 1,
+                                only_future: bool = True,
+                                anchor: Optional[int] = None,
+                                step: int = 1,
+                                total: Optional[int] = None) -> tuple[Optional[AppointmentModel], Pagination]:
         """Возвращает список актуальных записей клиента с постраничной навигацией.
         Args:
             client_id: ID клиента
             page: Номер страницы
             only_future: Если True, возвращает только будущие записи (end_time >= now)
+            anchor: ID записи с соседней страницы (keyset-пагинация)
+            step: 1 - страница после якоря, -1 - до него
+            total: Известное общее количество записей, чтобы не пересчитывать его
         """
         now = datetime.now(self.__timezone_offset)
         per_page = 1
@@ -192,19 +220,21 @@ class AppointmentsTable(BaseTable):
             base_conditions += " AND sl.end_time >= ?"
             params.append(now)
 
-        count_query = f"""
-            SELECT COUNT(*) as total
-            FROM {self.__tablename__} a
-            LEFT JOIN slots sl ON a.slot_id = sl.id
-            WHERE {base_conditions}
-            """
-        self.cursor.execute(count_query, params)
-        total_items = self.cursor.fetchone()['total']
-
-        pagination.total_items = total_items
-        pagination.total_pages = max(1, (total_items + per_page - 1) // per_page)
-
-        query = f"""
+        if total is None:
+            count_query = f"""
+                SELECT COUNT(*) as total
+                FROM {self.__tablename__} a
+                LEFT JOIN slots sl ON a.slot_id = sl.id
+                WHERE {base_conditions}
+                """
+            self.cursor.execute(count_query, params)
+            total = self.cursor.fetchone()['total']
+
+        pagination.total_items = total
+        pagination.total_pages = max(1, (total + per_page - 1) // per_page)
+
+        rows = self._fetch_page(
+            select=f"""
             SELECT 
                 a.*, 
                 s.name as service_name, 
@@ -216,17 +246,18 @@ class AppointmentsTable(BaseTable):
             LEFT JOIN services s ON a.service_id = s.id
             LEFT JOIN slots sl ON a.slot_id = sl.id
             LEFT JOIN users u ON a.client_id = u.user_id
-            WHERE {base_conditions}
-            ORDER BY sl.start_time ASC
-            LIMIT ? OFFSET ?
-            """
-        params.extend([per_page, pagination.offset])
-        self.cursor.execute(query, params)
+            WHERE {base_conditions}""",
+            params=params,
+            seek=self.__seek_by_slot,
+            pagination=pagination,
+            anchor=anchor,
+            step=step
+        )
 
-        row = self.cursor.fetchone()
+        row = rows[0] if rows else None
         app = None
         if row:
-            with AppointmentPhotosTable() as app_ph_db:
+            with AppointmentPhotosTable(self.db_name) as app_ph_db:
                 app = AppointmentModel(
                     appointment_id=row['id'],
                     client=UserModel(
@@ -269,6 +300,7 @@ class AppointmentsTable(BaseTable):
         """
         self.cursor.execute(query, (status, appointment_id))
         self.conn.commit()
+        self._calendar.invalidate()
         self._log('UPDATE_APPOINTMENT_STATUS',
                   appointment_id=appointment_id,
                   status=status)
@@ -294,7 +326,7 @@ class AppointmentsTable(BaseTable):
         if not row:
             return None
 
-        with AppointmentPhotosTable() as app_ph_db:
+        with AppointmentPhotosTable(self.db_name) as app_ph_db:
             return AppointmentModel(
                 appointment_id=row['id'],
                 client=UserModel(
@@ -369,39 +401,47 @@ class AppointmentsTable(BaseTable):
         rows = self.cursor.fetchall()
 
         appointments = []
-        with AppointmentPhotosTable() as app_ph_db:
-            for row in rows:
-                appointment = AppointmentModel(
-                    appointment_id=row['id'],
-                    client=UserModel(
-                        user_id=row['client_id'],
-                        username=row['username'],
-                        first_name=row['first_name'],
-                        last_name=row['last_name'],
-                        contact=row['contact']
-                    ),
-                    slot=SlotModel(
-                        id=row['slot_id'],
-                        start_time=datetime.fromisoformat(row['start_time']),
-                        end_time=datetime.fromisoformat(row['end_time']),
-                        is_available=False
-                    ),
-                    service=ServiceModel(
-                        id=row['service_id'],
-                        name=row['service_name']
-                    ),
-                    comment=row['comment'],
-                    status=row['status'],
-                    created_at=self._parse_datetime(row['created_at']),
-                    updated_at=self._parse_datetime(row['updated_at']),
-                    photos=app_ph_db.get_appointment_photos(row['id'])
-                )
-                appointments.append(appointment)
+        photos_by_app = self._load_photos([row['id'] for row in rows])
+        for row in rows:
+            appointment = AppointmentModel(
+                appointment_id=row['id'],
+                client=UserModel(
+                    user_id=row['client_id'],
+                    username=row['username'],
+                    first_name=row['first_name'],
+                    last_name=row['last_name'],
+                    contact=row['contact']
+                ),
+                slot=SlotModel(
+                    id=row['slot_id'],
+                    start_time=datetime.fromisoformat(row['start_time']),
+                    end_time=datetime.fromisoformat(row['end_time']),
+                    is_available=False
+                ),
+                service=ServiceModel(
+                    id=row['service_id'],
+                    name=row['service_name']
+                ),
+                comment=row['comment'],
+                status=row['status'],
+                created_at=self._parse_datetime(row['created_at']),
+                updated_at=self._parse_datetime(row['updated_at']),
+                photos=photos_by_app.get(row['id'], [])
+            )
+            appointments.append(appointment)
 
         return appointments
 
-    def get_master_actions(self, page: int = 1, per_page: int = 10) -> tuple[list[AppointmentModel], Pagination]:
-        """Возвращает список всех записей (со всеми статусами) с пагинацией, отсортированный от новых к старым"""
+    def get_master_actions(self,
+                           page: int = 1,
+                           per_page: int = 10,
+                           anchor: Optional[int] = None,
+                           step: int = 1,
+                           total: Optional[int] = None) -> tuple[list[AppointmentModel], Pagination]:
+        """Возвращает список всех записей (со всеми статусами) с пагинацией, отсортированный от новых к старым
+
+        anchor/step/total - см. get_client_appointments
+        """
         pagination = Pagination(
             page=page,
             per_page=per_page,
@@ -409,60 +449,63 @@ class AppointmentsTable(BaseTable):
             total_pages=0
         )
 
-        count_query = f"SELECT COUNT(*) as total FROM {self.__tablename__}"
-        self.cursor.execute(count_query)
-        total_items = self.cursor.fetchone()['total']
+        if total is None:
+            count_query = f"SELECT COUNT(*) as total FROM {self.__tablename__}"
+            self.cursor.execute(count_query)
+            total = self.cursor.fetchone()['total']
 
-        pagination.total_items = total_items
-        pagination.total_pages = max(1, (total_items + per_page - 1) // per_page)
+        pagination.total_items = total
+        pagination.total_pages = max(1, (total + per_page - 1) // per_page)
 
-        query = f"""
-        SELECT 
-            a.*, 
-            s.name as service_name, 
-            sl.start_time, 
-            sl.end_time, 
-            u.*
-        FROM {self.__tablename__} a
-        LEFT JOIN services s ON a.service_id = s.id
-        LEFT JOIN slots sl ON a.slot_id = sl.id
-        LEFT JOIN users u ON a.client_id = u.user_id
-        ORDER BY a.updated_at DESC
-        LIMIT ? OFFSET ?
-        """
-
-        self.cursor.execute(query, (per_page, pagination.offset))
-        rows = self.cursor.fetchall()
+        rows = self._fetch_page(
+            select=f"""
+            SELECT 
+                a.*, 
+                s.name as service_name, 
+                sl.start_time, 
+                sl.end_time, 
+                u.*
+            FROM {self.__tablename__} a
+            LEFT JOIN services s ON a.service_id = s.id
+            LEFT JOIN slots sl ON a.slot_id = sl.id
+            LEFT JOIN users u ON a.client_id = u.user_id
+            WHERE 1""",
+            params=(),
+            seek=self.__seek_by_update,
+            pagination=pagination,
+            anchor=anchor,
+            step=step
+        )
 
         appointments = []
-        with AppointmentPhotosTable() as app_ph_db:
-            for row in rows:
-                appointment = AppointmentModel(
-                    appointment_id=row['id'],
-                    client=UserModel(
-                        user_id=row['client_id'],
-                        username=row['username'],
-                        first_name=row['first_name'],
-                        last_name=row['last_name'],
-                        contact=row['contact']
-                    ),
-                    slot=SlotModel(
-                        id=row['slot_id'],
-                        start_time=datetime.fromisoformat(row['start_time']),
-                        end_time=datetime.fromisoformat(row['end_time']),
-                        is_available=False
-                    ),
-                    service=ServiceModel(
-                        id=row['service_id'],
-                        name=row['service_name']
-                    ),
-                    comment=row['comment'],
-                    status=row['status'],
-                    created_at=self._parse_datetime(row['created_at']),
-                    updated_at=self._parse_datetime(row['updated_at']),
-                    photos=app_ph_db.get_appointment_photos(row['id'])
-                )
-                appointments.append(appointment)
+        photos_by_app = self._load_photos([row['id'] for row in rows])
+        for row in rows:
+            appointment = AppointmentModel(
+                appointment_id=row['id'],
+                client=UserModel(
+                    user_id=row['client_id'],
+                    username=row['username'],
+                    first_name=row['first_name'],
+                    last_name=row['last_name'],
+                    contact=row['contact']
+                ),
+                slot=SlotModel(
+                    id=row['slot_id'],
+                    start_time=datetime.fromisoformat(row['start_time']),
+                    end_time=datetime.fromisoformat(row['end_time']),
+                    is_available=False
+                ),
+                service=ServiceModel(
+                    id=row['service_id'],
+                    name=row['service_name']
+                ),
+                comment=row['comment'],
+                status=row['status'],
+                created_at=self._parse_datetime(row['created_at']),
+                updated_at=self._parse_datetime(row['updated_at']),
+                photos=photos_by_app.get(row['id'], [])
+            )
+            appointments.append(appointment)
 
         return appointments, pagination
 
@@ -472,7 +515,10 @@ class AppointmentsTable(BaseTable):
             from_time: datetime,
             to_time: datetime,
             page: int = 1,
-            per_page: int = 1
+            per_page: int = 1,
+            anchor: Optional[int] = None,
+            step: int = 1,
+            total: Optional[int] = None
     ) -> Tuple[List[AppointmentModel], Pagination]:
         """Возвращает список записей по статусу и временному интервалу с пагинацией.
 
@@ -482,6 +528,9 @@ class AppointmentsTable(BaseTable):
             to_time: Конец временного интервала (включительно)
             page: Номер страницы (начинается с 1)
             per_page: Количество записей на странице
+            anchor: ID записи с соседней страницы (keyset-пагинация)
+            step: 1 - страница после якоря, -1 - до него
+            total: Известное общее количество записей, чтобы не пересчитывать его
 
         Returns:
             Кортеж (список AppointmentModel, объект Pagination)
@@ -502,117 +551,78 @@ class AppointmentsTable(BaseTable):
             total_pages=0
         )
 
-        count_query = f"""
-        SELECT COUNT(*) as total
-        FROM {self.__tablename__} a
-        LEFT JOIN slots sl ON a.slot_id = sl.id
-        WHERE a.status = ? 
-        AND sl.start_time >= ? 
-        AND sl.start_time <= ?
-        """
-
-        self.cursor.execute(count_query, (status, from_time, to_time))
-        total_items = self.cursor.fetchone()['total']
+        if total is None:
+            count_query = f"""
+            SELECT COUNT(*) as total
+            FROM {self.__tablename__} a
+            LEFT JOIN slots sl ON a.slot_id = sl.id
+            WHERE a.status = ? 
+            AND sl.start_time >= ? 
+            AND sl.start_time <= ?
+            """
 
-        pagination.total_items = total_items
-        pagination.total_pages = max(1, (total_items + per_page - 1) // per_page)
+            self.cursor.execute(count_query, (status, from_time, to_time))
+            total = self.cursor.fetchone()['total']
 
-        query = f"""
-        SELECT 
-            a.*, 
-            s.name as service_name, 
-            sl.start_time, 
-            sl.end_time, 
-            u.*
-        FROM {self.__tablename__} a
-        LEFT JOIN services s ON a.service_id = s.id
-        LEFT JOIN slots sl ON a.slot_id = sl.id
-        LEFT JOIN users u ON a.client_id = u.user_id
-        WHERE a.status = ? 
-        AND sl.start_time >= ? 
-        AND sl.start_time <= ?
-        ORDER BY sl.start_time ASC
-        LIMIT ? OFFSET ?
-        """
+        pagination.total_items = total
+        pagination.total_pages = max(1, (total + per_page - 1) // per_page)
 
-        params = (
-            status,
-            from_time,
-            to_time,
-            per_page,
-            pagination.offset
+        rows = self._fetch_page(
+            select=f"""
+            SELECT 
+                a.*, 
+                s.name as service_name, 
+                sl.start_time, 
+                sl.end_time, 
+                u.*
+            FROM {self.__tablename__} a
+            LEFT JOIN services s ON a.service_id = s.id
+            LEFT JOIN slots sl ON a.slot_id = sl.id
+            LEFT JOIN users u ON a.client_id = u.user_id
+            WHERE a.status = ? 
+            AND sl.start_time >= ? 
+            AND sl.start_time <= ?""",
+            params=(status, from_time, to_time),
+            seek=self.__seek_by_slot,
+            pagination=pagination,
+            anchor=anchor,
+            step=step
         )
 
-        self.cursor.execute(query, params)
-        rows = self.cursor.fetchall()
-
         appointments = []
-        with AppointmentPhotosTable() as app_ph_db:
-            for row in rows:
-                appointment = AppointmentModel(
-                    appointment_id=row['id'],
-                    client=UserModel(
-                        user_id=row['client_id'],
-                        username=row['username'],
-                        first_name=row['first_name'],
-                        last_name=row['last_name'],
-                        contact=row['contact']
-                    ),
-                    slot=SlotModel(
-                        id=row['slot_id'],
-                        start_time=datetime.fromisoformat(row['start_time']),
-                        end_time=datetime.fromisoformat(row['end_time']),
-                        is_available=False
-                    ),
-                    service=ServiceModel(
-                        id=row['service_id'],
-                        name=row['service_name']
-                    ),
-                    comment=row['comment'],
-                    status=row['status'],
-                    created_at=self._parse_datetime(row['created_at']),
-                    updated_at=self._parse_datetime(row['updated_at']),
-                    photos=app_ph_db.get_appointment_photos(row['id'])
-                )
-                appointments.append(appointment)
+        photos_by_app = self._load_photos([row['id'] for row in rows])
+        for row in rows:
+            appointment = AppointmentModel(
+                appointment_id=row['id'],
+                client=UserModel(
+                    user_id=row['client_id'],
+                    username=row['username'],
+                    first_name=row['first_name'],
+                    last_name=row['last_name'],
+                    contact=row['contact']
+                ),
+                slot=SlotModel(
+                    id=row['slot_id'],
+                    start_time=datetime.fromisoformat(row['start_time']),
+                    end_time=datetime.fromisoformat(row['end_time']),
+                    is_available=False
+                ),
+                service=ServiceModel(
+                    id=row['service_id'],
+                    name=row['service_name']
+                ),
+                comment=row['comment'],
+                status=row['status'],
+                created_at=self._parse_datetime(row['created_at']),
+                updated_at=self._parse_datetime(row['updated_at']),
+                photos=photos_by_app.get(row['id'], [])
+            )
+            appointments.append(appointment)
 
         return appointments, pagination
 
-    def get_booked_slot_dates(self, status: str, from_time: datetime, to_time: datetime) -> Set[date]:
-        """Возвращает множество start_time всех слотов, соответствующих условиям.
-
-        Args:
-            status: Статус записи (например, CONFIRMED)
-            from_time: Начало периода (включительно)
-            to_time: Конец периода (включительно)
-
-        Returns:
-            Множество datetime объектов start_time без дубликатов.
-
-        Raises:
-            ValueError: Если статус некорректен или временной интервал невалиден.
-        """
-        if status not in self.__valid_statuses:
-            raise ValueError(f"Invalid status. Allowed: {self.__valid_statuses}")
-
-        if from_time > to_time:
-            raise ValueError("from_time must be <= to_time")
-
-        query = f"""
-        SELECT DISTINCT sl.start_time
-        FROM {self.__tablename__} a
-        JOIN slots sl ON a.slot_id = sl.id
-        WHERE a.status = ?
-        AND sl.end_time >= ?
-        AND sl.start_time <= ?
-        """
-
-        self.cursor.execute(query, (status, from_time, to_time))
-        rows = self.cursor.fetchall()
-
-        return {datetime.fromisoformat(row['start_time']).date() for row in rows}
-
-    def count_appointments_by_status_and_time(self, status: str, from_time: datetime, to_time: datetime) -> int:
+    def get_slot_times_by_status(self, status: str, from_time: datetime, to_time: datetime) -> List[Tuple[datetime, datetime]]:
+        """Начало и конец слота каждой записи со статусом status, пересекающейся с периодом (границы включительно)"""
         if status not in self.__valid_statuses:
             raise ValueError(f"Invalid status. Allowed: {self.__valid_statuses}")
 
@@ -620,18 +630,17 @@ class AppointmentsTable(BaseTable):
             raise ValueError("from_time must be <= to_time")
 
         query = f"""
-        SELECT COUNT(*) as count
+        SELECT sl.start_time, sl.end_time
         FROM {self.__tablename__} a
         JOIN slots sl ON a.slot_id = sl.id
         WHERE a.status = ?
         AND sl.end_time >= ? AND sl.start_time <= ?
+        ORDER BY sl.start_time
         """
 
-        params = (status, from_time, to_time)
-
-        self.cursor.execute(query, params)
-        result = self.cursor.fetchone()
-        return result['count'] if result else 0
+        self.cursor.execute(query, (status, from_time, to_time))
+        return [(datetime.fromisoformat(row['start_time']), datetime.fromisoformat(row['end_time']))
+                for row in self.cursor.fetchall()]
 
     def count_clients(self) -> int:
         """
@@ -683,90 +692,69 @@ class AppointmentsTable(BaseTable):
             - Объект Pagination с информацией о пагинации
         """
 
-        total_items = self.count_clients()
-
         pagination = Pagination(
             page=page,
             per_page=per_page,
-            total_items=total_items,
-            total_pages=max(1, (total_items + per_page - 1) // per_page)
+            total_items=0,
+            total_pages=1
         )
 
-        clients_query = f"""
-        SELECT DISTINCT u.*
+        statuses = sorted(self.__valid_statuses)
+        by_status_columns = ',\n'.join(
+            f"COUNT(CASE WHEN a.status = '{status}' THEN 1 END) AS status_{status}" for status in statuses)
+        # Статистика, сортировка и пагинация клиентов считаются одним запросом,
+        # общее количество клиентов - оконной функцией по сгруппированным строкам
+        query = f"""
+        SELECT 
+            u.user_id, u.username, u.first_name, u.last_name, u.contact,
+            COUNT(*) AS total,
+            {by_status_columns},
+            COUNT(CASE WHEN a.status = 'confirmed' AND sl.end_time < datetime('now') THEN 1 END) AS past_confirmed,
+            COUNT(CASE WHEN a.status = 'confirmed' AND sl.end_time >= datetime('now') THEN 1 END) AS upcoming,
+            MIN(sl.start_time) AS first_appointment,
+            MAX(sl.start_time) AS last_appointment,
+            COUNT(*) OVER () AS total_clients
         FROM {self.__tablename__} a
         JOIN users u ON a.client_id = u.user_id
-        ORDER BY u.user_id
+        LEFT JOIN slots sl ON a.slot_id = sl.id
+        GROUP BY u.user_id
+        ORDER BY total DESC, u.user_id
         LIMIT ? OFFSET ?
         """
-        self.cursor.execute(clients_query, (per_page, pagination.offset))
-        client_rows = self.cursor.fetchall()
-
-        clients_with_stats = []
+        self.cursor.execute(query, (per_page, pagination.offset))
+        rows = self.cursor.fetchall()
 
-        for client_row in client_rows:
-            client_id = client_row['user_id']
+        if rows:
+            total_items = rows[0]['total_clients']
+        elif page > 1:  # Страница за пределами списка - количество клиентов считается отдельно
+            total_items = self.count_clients()
+        else:
+            total_items = 0
+        pagination.total_items = total_items
+        pagination.total_pages = max(1, (total_items + per_page - 1) // per_page)
 
+        clients_with_stats = []
+        for row in rows:
             user = UserModel(
-                user_id=client_id,
-                username=client_row['username'],
-                first_name=client_row['first_name'],
-                last_name=client_row['last_name'],
-                contact=client_row['contact']
+                user_id=row['user_id'],
+                username=row['username'],
+                first_name=row['first_name'],
+                last_name=row['last_name'],
+                contact=row['contact']
+            )
+            stats = ClientStats(
+                total=row['total'],
+                completed=row[f'status_{COMPLETED}'] + row['past_confirmed'],
+                upcoming=row['upcoming'],
+                pending=row[f'status_{PENDING}'],
+                cancelled=row[f'status_{CANCELLED}'],
+                rejected=row[f'status_{REJECTED}'],
+                first_appointment=datetime.fromisoformat(row['first_appointment']) if row['first_appointment'] else None,
+                last_appointment=datetime.fromisoformat(row['last_appointment']) if row['last_appointment'] else None,
+                by_status={status: row[f'status_{status}'] for status in statuses if row[f'status_{status}']}
             )
-
-            stats_query = f"""
-            SELECT 
-                status,
-                COUNT(*) as count,
-                SUM(CASE WHEN sl.end_time < datetime('now') AND status = 'confirmed' THEN 1 ELSE 0 END) as completed_count,
-                SUM(CASE WHEN sl.end_time >= datetime('now') AND status = 'confirmed' THEN 1 ELSE 0 END) as upcoming_count,
-                MIN(sl.start_time) as first_appointment,
-                MAX(sl.start_time) as last_appointment
-            FROM {self.__tablename__} a
-            LEFT JOIN slots sl ON a.slot_id = sl.id
-            WHERE a.client_id = ?
-            GROUP BY status
-            """
-
-            self.cursor.execute(stats_query, (client_id,))
-            status_rows = self.cursor.fetchall()
-
-            stats = ClientStats()
-
-            for row in status_rows:
-                status = row['status']
-                count = row['count']
-
-                stats.total += count
-                stats.by_status[status] = count
-
-                if status == 'completed':
-                    stats.completed += count
-                elif status == 'confirmed':
-                    stats.upcoming += row['upcoming_count']
-                    stats.completed += row['completed_count']
-                elif status == 'pending':
-                    stats.pending = count
-                elif status == 'cancelled':
-                    stats.cancelled = count
-                elif status == 'rejected':
-                    stats.rejected = count
-
-                if row['first_appointment']:
-                    first_appt = datetime.fromisoformat(row['first_appointment'])
-                    if stats.first_appointment is None or first_appt < stats.first_appointment:
-                        stats.first_appointment = first_appt
-
-                if row['last_appointment']:
-                    last_appt = datetime.fromisoformat(row['last_appointment'])
-                    if stats.last_appointment is None or last_appt > stats.last_appointment:
-                        stats.last_appointment = last_appt
-
             clients_with_stats.append(ClientWithStats(user=user, stats=stats))
 
-        clients_with_stats.sort(key=lambda x: x.stats.total, reverse=True)
-
         return clients_with_stats, pagination
 
     @property
@@ -1,17 +1,37 @@
 import logging
 import os
 import sqlite3
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence
+
+from DB.models import Pagination
+from DB.tables.pool import get_pool
 
 logger = logging.getLogger(__name__)
 
+DB_PATH = f'{os.path.dirname(__file__)}/z_users.db'
+
+
+@dataclass(frozen=True)
+class SeekKey:
+    """Порядок списка для keyset-пагинации: (key, row_id) и подзапрос, возвращающий key строки-якоря"""
+    key: str  # Столбец сортировки, например 'u.registration_date'
+    row_id: str  # Уникальный столбец, разрешающий равенство key, например 'u.user_id'
+    anchor_key: str  # Подзапрос с одним параметром - id якоря
+    descending: bool = False
+
+    @property
+    def column(self) -> str:
+        return self.row_id.split('.')[-1]
+
 
 class BaseTable:
     __tablename__: str
 
-    def __init__(self, db_name: str = f'{os.path.dirname(__file__)}/z_users.db'):
-        self.conn = sqlite3.connect(db_name)
-        self.conn.row_factory = sqlite3.Row
+    def __init__(self, db_name: str = DB_PATH):
+        self.db_name = db_name
+        self._pool = get_pool(db_name)
+        self.conn = self._pool.acquire()
         self.cursor = self.conn.cursor()
 
     def __enter__(self):
@@ -20,11 +40,14 @@ class BaseTable:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Вызывается при выходе из контекстного менеджера"""
         if self.conn:
-            if exc_type is not None:  # Если произошло исключение
-                self.conn.rollback()
-            else:
-                self.conn.commit()
-            self.conn.close()
+            try:
+                if exc_type is not None:  # Если произошло исключение
+                    self.conn.rollback()
+                else:
+                    self.conn.commit()
+            finally:
+                self.cursor.close()
+                self._pool.release(self.conn)  # Соединение возвращается в пул, а не закрывается
         self.conn = None
         self.cursor = None
 
@@ -42,6 +65,50 @@ class BaseTable:
         self.cursor.execute(query, (value,))
         return bool(self.cursor.fetchone())
 
+    def _fetch_page(self,
+                    select: str,
+                    params: Sequence[Any],
+                    seek: SeekKey,
+                    pagination: Pagination,
+                    anchor: Optional[int] = None,
+                    step: int = 1,
+                    group_by: str = '') -> List[sqlite3.Row]:
+        """Возвращает строки страницы и записывает в pagination ключи её первой и последней строки.
+
+        Если передан anchor (ID первой/последней строки соседней страницы), страница
+        ищется по индексу сразу после (step > 0) или до (step < 0) якоря, без OFFSET.
+        Если якоря нет или он устарел (строка удалена), используется OFFSET по номеру страницы.
+
+        :param select: Запрос до конца условия WHERE, без GROUP BY/ORDER BY/LIMIT
+        """
+        rows = []
+        if anchor:
+            forward = step >= 0
+            desc = seek.descending == forward  # Назад по списку - обход в обратном порядке
+            direction = 'DESC' if desc else 'ASC'
+            self.cursor.execute(f'''
+                {select} AND ({seek.key}, {seek.row_id}) {'<' if desc else '>'} (({seek.anchor_key}), ?)
+                {group_by}
+                ORDER BY {seek.key} {direction}, {seek.row_id} {direction}
+                LIMIT ?''', (*params, anchor, anchor, pagination.per_page))
+            rows = self.cursor.fetchall()
+            if not forward:
+                rows.reverse()
+
+        if not rows:
+            direction = 'DESC' if seek.descending else 'ASC'
+            self.cursor.execute(f'''
+                {select}
+                {group_by}
+                ORDER BY {seek.key} {direction}, {seek.row_id} {direction}
+                LIMIT ? OFFSET ?''', (*params, pagination.per_page, pagination.offset))
+            rows = self.cursor.fetchall()
+
+        if rows:
+            pagination.first_key = rows[0][seek.column]
+            pagination.last_key = rows[-1][seek.column]
+        return rows
+
     @property
     def tablename(self) -> str:
         return self.__tablename__
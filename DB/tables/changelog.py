@@ -0,0 +1,71 @@
+from typing import Any, Dict, Optional, Tuple
+
+from DB.tables.base import BaseTable
+
+# Таблицы, изменения которых попадают в инкрементальные бэкапы. Строки различаются по rowid, поэтому
+# таблицы должны быть обычными (не WITHOUT ROWID)
+TRACKED_TABLES = ('users', 'slots', 'services', 'appointments', 'masters',
+                  'photos', 'appointment_photos', 'reminders_log', 'schedule_windows', 'schedule_exceptions')
+
+Changes = Dict[str, Dict[int, Optional[Dict[str, Any]]]]  # Таблица -> rowid -> текущая строка (None - удалена)
+
+
+class ChangelogTable(BaseTable):
+    """Журнал изменённых строк для инкрементальных бэкапов.
+
+    Триггеры записывают только таблицу и rowid изменённой строки, содержимое читается при снятии дельты,
+    поэтому несколько изменений одной строки дают одну запись в дельте.
+    Создавать после всех отслеживаемых таблиц.
+    """
+    __tablename__ = 'changelog'
+
+    def create_table(self):
+        """Создание таблицы changelog и триггеров на отслеживаемых таблицах"""
+        triggers = '\n'.join(f'''
+        CREATE TRIGGER IF NOT EXISTS changelog_{table}_{op.lower()}
+        AFTER {op} ON {table}
+        BEGIN
+            INSERT INTO {self.__tablename__} (tbl, row_id) VALUES ('{table}', {'OLD' if op == 'DELETE' else 'NEW'}.rowid);
+        END;''' for table in TRACKED_TABLES for op in ('INSERT', 'UPDATE', 'DELETE'))
+
+        self.cursor.executescript(f'''
+        CREATE TABLE IF NOT EXISTS {self.__tablename__} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            tbl TEXT NOT NULL,
+            row_id INTEGER NOT NULL
+        );
+        {triggers}
+        ''')
+        self.conn.commit()
+        self._log('CREATE_TABLE')
+
+    def last_id(self) -> int:
+        self.cursor.execute(f'SELECT COALESCE(MAX(id), 0) FROM {self.__tablename__}')
+        return self.cursor.fetchone()[0]
+
+    def collect_changes(self, batch_size: int = 500) -> Tuple[int, Changes]:
+        """Текущее состояние всех изменённых строк и ID последней учтённой записи журнала"""
+        up_to = self.last_id()
+        self.cursor.execute(f'SELECT DISTINCT tbl, row_id FROM {self.__tablename__} WHERE id <= ?', (up_to,))
+        changed: Dict[str, list] = {}
+        for row in self.cursor.fetchall():
+            changed.setdefault(row['tbl'], []).append(row['row_id'])
+
+        changes: Changes = {}
+        for table, row_ids in changed.items():
+            if table not in TRACKED_TABLES:
+                continue
+            rows = dict.fromkeys(row_ids)
+            for i in range(0, len(row_ids), batch_size):
+                batch = row_ids[i:i + batch_size]
+                self.cursor.execute(f'SELECT rowid AS _rowid, * FROM {table} '
+                                    f'WHERE rowid IN ({", ".join("?" * len(batch))})', batch)
+                for row in self.cursor.fetchall():
+                    rows[row['_rowid']] = {key: row[key] for key in row.keys() if key != '_rowid'}
+            changes[table] = rows
+        return up_to, changes
+
+    def purge(self, up_to: int):
+        """Удаляет записи журнала, вошедшие в бэкап"""
+        self.cursor.execute(f'DELETE FROM {self.__tablename__} WHERE id <= ?', (up_to,))
+        self.conn.commit()
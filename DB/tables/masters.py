@@ -1,13 +1,18 @@
 import sqlite3
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from DB.cache import get_master_registry
 from DB.models import Master, UserModel
-from DB.tables.base import BaseTable
+from DB.tables.base import BaseTable, DB_PATH
 
 
 class MastersTable(BaseTable):
     __tablename__ = 'masters'
 
+    def __init__(self, db_name: str = DB_PATH):
+        super().__init__(db_name)
+        self._registry = get_master_registry(db_name)
+
     def create_table(self):
         """Создание таблицы masters"""
         self.cursor.executescript(f'''
@@ -46,6 +51,7 @@ class MastersTable(BaseTable):
             '''
             self.cursor.execute(query, (user_id, is_master))
             self.conn.commit()
+            self._registry.invalidate()
             self._log('SET_MASTER_SUCCESS', user_id=user_id, is_master=is_master)
             return True
         except sqlite3.Error as e:
@@ -53,42 +59,45 @@ class MastersTable(BaseTable):
             self.conn.rollback()
             return False
 
-    def get_all_masters(self) -> List[Master]:
+    def _masters(self) -> Dict[int, Master]:
+        """Мастера по ID из реестра, при необходимости загружает их из БД"""
+        masters, version = self._registry.snapshot()
+        if masters is not None:
+            return masters
+
         query = f'''
         SELECT m.*, u.*
         FROM {self.__tablename__} m
         LEFT JOIN users u ON m.id = u.user_id
         WHERE is_master = TRUE
         '''
+        self.cursor.execute(query)
+        masters = {row['id']: Master(
+            user=UserModel(
+                user_id=row['id'],
+                username=row['username'],
+                first_name=row['first_name'],
+                last_name=row['last_name'],
+                contact=row['contact'],
+                is_admin=bool(row['is_admin'])),
+            specialization=row['specialization'],
+            is_master=row['is_master'],
+            message_id=row['message_id'],
+            current_app_id=row['current_app_id'],
+            msg_to_delete=row['msg_to_delete']
+        ) for row in self.cursor.fetchall()}
+        self._registry.fill(masters, version)
+        return masters
 
+    def get_all_masters(self) -> List[Master]:
         try:
-            self.cursor.execute(query)
-            rows = self.cursor.fetchall()
-
-            masters = []
-            for row in rows:
-                master = Master(
-                    user=UserModel(
-                        user_id=row['id'],
-                        username=row['username'],
-                        first_name=row['first_name'],
-                        last_name=row['last_name'],
-                        contact=row['contact']),
-                    specialization=row['specialization'],
-                    is_master=row['is_master'],
-                    message_id=row['message_id'],
-                    current_app_id=row['current_app_id'],
-                    msg_to_delete=row['msg_to_delete']
-                )
-                masters.append(master)
-            return masters
-
+            return list(self._masters().values())
         except sqlite3.Error as e:
             self._log('GET_ALL_MASTERS_ERROR', error=str(e))
             return []
 
     def get_master(self, master_id: int) -> Optional[Master]:
-        """Получает message_id для указанного мастера.
+        """Получает мастера по ID.
 
         Args:
             master_id: ID мастера
@@ -96,31 +105,11 @@ class MastersTable(BaseTable):
         Returns:
             Master: Master если найден, иначе None
         """
-        query = f"""
-            SELECT m.*, u.*
-            FROM {self.__tablename__} m
-            LEFT JOIN users u ON m.id = u.user_id
-            WHERE id = ? AND is_master = TRUE
-        """
-        self.cursor.execute(query, (master_id,))
-        row = self.cursor.fetchone()
-
-        if row:
-            return Master(
-                user=UserModel(
-                    user_id=row['id'],
-                    username=row['username'],
-                    first_name=row['first_name'],
-                    last_name=row['last_name'],
-                    contact=row['contact'],
-                    is_admin=row['is_admin']),
-                specialization=row['specialization'],
-                is_master=row['is_master'],
-                message_id=row['message_id'],
-                current_app_id=row['current_app_id'],
-                msg_to_delete=row['msg_to_delete']
-            )
-        return None
+        return self._masters().get(master_id)
+
+    def is_master(self, user_id: int) -> bool:
+        """Является ли пользователь мастером"""
+        return user_id in self._masters()
 
     def update_current_state(self,
                              master_id: int,
@@ -150,6 +139,8 @@ class MastersTable(BaseTable):
             """
             self.cursor.execute(query, (message_id, current_app_id, msg_to_delete, master_id))
             self.conn.commit()
+            self._registry.patch(master_id, message_id=message_id, current_app_id=current_app_id,
+                                 msg_to_delete=msg_to_delete)
             self._log('UPDATE_MESSAGE_ID_SUCCESS',
                       master_id=master_id,
                       current_app_id=current_app_id,
@@ -0,0 +1,208 @@
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Deque, Dict, Optional
+
+from config import config, DBConfig
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(sqlite3.OperationalError):
+    """Не удалось получить соединение из пула за отведённое время"""
+
+
+_PRAGMA_CHOICES = {
+    'journal_mode': {'DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'},
+    'synchronous': {'OFF', 'NORMAL', 'FULL', 'EXTRA'},
+    'temp_store': {'DEFAULT', 'FILE', 'MEMORY'},
+}
+_PRAGMA_INTS = ('busy_timeout', 'cache_size', 'mmap_size')
+
+
+def apply_pragmas(conn: sqlite3.Connection, cfg: DBConfig):
+    """Применяет профиль PRAGMA к только что открытому соединению"""
+    for name, choices in _PRAGMA_CHOICES.items():
+        value = getattr(cfg, name)
+        if value not in choices:
+            raise ValueError(f'Invalid {name}={value!r}. Allowed values: {choices}')
+        conn.execute(f'PRAGMA {name} = {value}')
+    for name in _PRAGMA_INTS:
+        conn.execute(f'PRAGMA {name} = {int(getattr(cfg, name))}')
+
+
+def read_pragmas(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """Текущие значения PRAGMA соединения (для отчёта при старте)"""
+    return {name: conn.execute(f'PRAGMA {name}').fetchone()[0]
+            for name in (*_PRAGMA_CHOICES, *_PRAGMA_INTS)}
+
+
+@dataclass
+class PoolStats:
+    """Статистика пула соединений"""
+    size: int = 0  # Открытые соединения (свободные + выданные)
+    idle: int = 0
+    in_use: int = 0
+    created: int = 0
+    reused: int = 0
+    closed: int = 0
+    overflow: int = 0  # Временные соединения сверх pool_size
+    waits: int = 0
+    timeouts: int = 0
+    health_check_failures: int = 0
+
+
+class ConnectionPool:
+    """Ограниченный пул SQLite-соединений.
+
+    Соединение, выданное через acquire(), принадлежит одному потоку до вызова release().
+    Свободные соединения переиспользуются (LIFO), перед выдачей долго простаивавшее
+    соединение проверяется запросом ``SELECT 1``. Если все pool_size соединений заняты,
+    открываются временные (до max_overflow), которые закрываются при возврате.
+    on_connect вызывается один раз для каждого нового соединения.
+    """
+
+    def __init__(self,
+                 db_name: str,
+                 pool_size: int = 5,
+                 max_overflow: int = 10,
+                 timeout: float = 5.0,
+                 health_check_interval: float = 60.0,
+                 on_connect: Optional[Callable[[sqlite3.Connection], None]] = None):
+        self.db_name = db_name
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.on_connect = on_connect
+
+        self._idle: Deque[sqlite3.Connection] = deque()
+        self._owners: Dict[int, int] = {}  # id(conn) -> ident потока-владельца
+        self._last_used: Dict[int, float] = {}
+        self._opened = 0
+        self._stats = PoolStats()
+        self._cond = threading.Condition()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_name, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        if self.on_connect:
+            try:
+                self.on_connect(conn)
+            except Exception:
+                conn.close()
+                raise
+        self._stats.created += 1
+        return conn
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        if time.monotonic() - self._last_used.get(id(conn), 0) < self.health_check_interval:
+            return True
+        try:
+            conn.execute('SELECT 1').fetchone()
+            return True
+        except sqlite3.Error as e:
+            self._stats.health_check_failures += 1
+            logger.warning('Pool connection to %s failed health check: %s', self.db_name, e)
+            return False
+
+    def _close(self, conn: sqlite3.Connection):
+        self._last_used.pop(id(conn), None)
+        self._opened -= 1
+        self._stats.closed += 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _checkout(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        self._owners[id(conn)] = threading.get_ident()
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Выдаёт соединение текущему потоку"""
+        deadline = None
+        with self._cond:
+            while True:
+                while self._idle:
+                    conn = self._idle.pop()
+                    if self._is_healthy(conn):
+                        self._stats.reused += 1
+                        return self._checkout(conn)
+                    self._close(conn)
+
+                if self._opened < self.pool_size + self.max_overflow:
+                    conn = self._connect()
+                    self._opened += 1
+                    if self._opened > self.pool_size:
+                        self._stats.overflow += 1
+                    return self._checkout(conn)
+
+                if deadline is None:
+                    deadline = time.monotonic() + self.timeout
+                    self._stats.waits += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats.timeouts += 1
+                    raise PoolTimeoutError(
+                        f'No free connection to {self.db_name} in {self.timeout}s '
+                        f'(pool_size={self.pool_size}, max_overflow={self.max_overflow})')
+                self._cond.wait(remaining)
+
+    def release(self, conn: sqlite3.Connection):
+        """Возвращает соединение в пул. Незавершённая транзакция откатывается"""
+        if conn.in_transaction:
+            conn.rollback()
+        with self._cond:
+            owner = self._owners.pop(id(conn), None)
+            if owner is None:
+                logger.warning('Connection %s is not checked out from pool %s', id(conn), self.db_name)
+                return
+            if owner != threading.get_ident():
+                logger.warning('Connection %s released by a thread that does not own it', id(conn))
+
+            if len(self._idle) < self.pool_size:
+                self._last_used[id(conn)] = time.monotonic()
+                self._idle.append(conn)
+            else:
+                self._close(conn)
+            self._cond.notify()
+
+    def close_all(self):
+        """Закрывает свободные соединения. Выданные закроются при возврате"""
+        with self._cond:
+            while self._idle:
+                self._close(self._idle.pop())
+
+    def stats(self) -> PoolStats:
+        with self._cond:
+            stats = PoolStats(**asdict(self._stats))
+            stats.size = self._opened
+            stats.idle = len(self._idle)
+            stats.in_use = len(self._owners)
+            return stats
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_name: str) -> ConnectionPool:
+    """Возвращает общий для процесса пул соединений к файлу БД"""
+    pool: Optional[ConnectionPool] = _pools.get(db_name)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(db_name)
+            if pool is None:
+                pool = _pools[db_name] = ConnectionPool(
+                    db_name, on_connect=lambda conn: apply_pragmas(conn, config.db))
+    return pool
+
+
+def close_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close_all()
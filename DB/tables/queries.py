@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
-from DB.tables.base import BaseTable
+from DB.tables.base import BaseTable, SeekKey
 from DB.models import UserModel, QueryModel, Pagination
 
 from utils.format_string import clear_string
@@ -9,6 +9,8 @@ from utils.format_string import clear_string
 
 class QueriesTable(BaseTable):
     __tablename__ = 'queries'
+    __seek = SeekKey(key='q.query_date', row_id='q.query_id', descending=True,
+                     anchor_key='SELECT query_date FROM queries WHERE query_id = ?')
 
     def create_table(self):
         """Создание таблицы queries"""
@@ -21,6 +23,8 @@ class QueriesTable(BaseTable):
             FOREIGN KEY (user_id) REFERENCES users (user_id)
         )''')
         self.cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_user_queries ON {self.__tablename__}(user_id)')
+        self.cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_user_queries_date '
+                            f'ON {self.__tablename__}(user_id, query_date, query_id)')
         self.conn.commit()
         self._log('CREATE_TABLE')
 
@@ -34,6 +38,23 @@ class QueriesTable(BaseTable):
         self._log('ADD_QUERY', query_id=query_id, user_id=query.user_id)
         return self.get_query(query_id)
 
+    def add_queries(self, queries: Sequence[QueryModel]) -> int:
+        """Добавляет пачку запросов одной транзакцией.
+
+        query_date - время в UTC, как у CURRENT_TIMESTAMP; если не задано, берётся время вставки.
+        """
+        self.cursor.executemany(f'''
+        INSERT INTO {self.__tablename__} (user_id, query_text, query_date)
+        VALUES (?, ?, COALESCE(?, CURRENT_TIMESTAMP))''', [
+            (query.user_id,
+             clear_string(query.query_text),
+             query.query_date.strftime('%Y-%m-%d %H:%M:%S') if query.query_date else None)
+            for query in queries
+        ])
+        self.conn.commit()
+        self._log('ADD_QUERIES', count=len(queries))
+        return len(queries)
+
     def get_query(self, query_id: int) -> Optional[QueryModel]:
         """Получение запроса по ID"""
         self.cursor.execute(f'''
@@ -65,8 +86,19 @@ class QueriesTable(BaseTable):
             )
         return None
 
-    def get_user_queries(self, user_id: int, page: int = 1, per_page: int = 10) -> Tuple[List[QueryModel], Pagination]:
-        """Получение запросов пользователя с постраничной навигацией"""
+    def get_user_queries(self,
+                         user_id: int,
+                         page: int = 1,
+                         per_page: int = 10,
+                         anchor: Optional[int] = None,
+                         step: int = 1,
+                         total: Optional[int] = None) -> Tuple[List[QueryModel], Pagination]:
+        """Получение запросов пользователя с постраничной навигацией
+
+        :param anchor: query_id крайнего запроса соседней страницы (keyset-пагинация)
+        :param step: 1 - страница после якоря, -1 - до него
+        :param total: Известное общее количество запросов, чтобы не пересчитывать его
+        """
 
         pagination = Pagination(
             page=page,
@@ -75,16 +107,20 @@ class QueriesTable(BaseTable):
             total_pages=0
         )
 
-        self.cursor.execute(f'''
+        rows = self._fetch_page(
+            select=f'''
             SELECT 
                 q.query_id, q.user_id, q.query_text, q.query_date,
                 u.username, u.first_name, u.last_name, u.is_admin
             FROM {self.__tablename__} q
             LEFT JOIN users u ON q.user_id = u.user_id
-            WHERE q.user_id = ?
-            ORDER BY q.query_date DESC
-            LIMIT ? OFFSET ?
-        ''', (user_id, pagination.per_page, pagination.offset))
+            WHERE q.user_id = ?''',
+            params=(user_id,),
+            seek=self.__seek,
+            pagination=pagination,
+            anchor=anchor,
+            step=step
+        )
 
         queries = [
             QueryModel(
@@ -103,17 +139,18 @@ class QueriesTable(BaseTable):
                     last_name=row['last_name'],
                     is_admin=bool(row['is_admin'])
                 )
-            ) for row in self.cursor
+            ) for row in rows
         ]
 
-        self.cursor.execute(
-            f'SELECT COUNT(*) as total FROM {self.__tablename__} WHERE user_id = ?',
-            (user_id,)
-        )
-        total_queries = self.cursor.fetchone()['total']
+        if total is None:
+            self.cursor.execute(
+                f'SELECT COUNT(*) as total FROM {self.__tablename__} WHERE user_id = ?',
+                (user_id,)
+            )
+            total = self.cursor.fetchone()['total']
 
-        pagination.total_items = total_queries
-        pagination.total_pages = (total_queries + per_page - 1) // per_page
+        pagination.total_items = total
+        pagination.total_pages = (total + per_page - 1) // per_page
 
         return queries, pagination
 
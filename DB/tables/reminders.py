@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+from DB.tables.base import BaseTable
+from config.const import CONFIRMED
+
+Reminder = Tuple[int, str, datetime]  # (ID записи, вид напоминания, когда отправить)
+
+
+class RemindersTable(BaseTable):
+    """Журнал отправленных напоминаний о записях.
+
+    Сами напоминания не хранятся: они вычисляются из подтверждённых записей и времени их слотов,
+    а журнал защищает от повторной отправки после перезапуска.
+    """
+    __tablename__ = 'reminders_log'
+
+    def create_table(self):
+        """Создание таблицы reminders_log"""
+        self.cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {self.__tablename__} (
+            appointment_id INTEGER NOT NULL,
+            kind TEXT NOT NULL,
+            sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (appointment_id, kind),
+            FOREIGN KEY (appointment_id) REFERENCES appointments(id) ON DELETE CASCADE
+        )''')
+        self.conn.commit()
+        self._log('CREATE_TABLE')
+
+    def get_due_reminders(self,
+                          offsets: Dict[str, int],
+                          from_time: datetime,
+                          to_time: datetime,
+                          now: datetime) -> List[Reminder]:
+        """Неотправленные напоминания подтверждённых будущих записей, время отправки которых в (from_time, to_time].
+
+        Args:
+            offsets: Вид напоминания -> за сколько минут до начала записи его отправить
+        """
+        if not offsets:
+            return []
+        kinds = ', '.join('(?, ?)' for _ in offsets)
+        self.cursor.execute(f'''
+        WITH kinds(kind, minutes) AS (VALUES {kinds})
+        SELECT a.id, k.kind, datetime(sl.start_time, '-' || k.minutes || ' minutes') AS remind_at
+        FROM kinds k
+        JOIN slots sl ON sl.start_time > datetime(?, '+' || k.minutes || ' minutes')
+                     AND sl.start_time <= datetime(?, '+' || k.minutes || ' minutes')
+                     AND sl.start_time > ?
+        JOIN appointments a ON a.slot_id = sl.id AND a.status = ?
+        LEFT JOIN {self.__tablename__} r ON r.appointment_id = a.id AND r.kind = k.kind
+        WHERE r.appointment_id IS NULL''',
+                            (*(value for item in offsets.items() for value in item), from_time, to_time, now, CONFIRMED))
+        return [(row['id'], row['kind'], datetime.fromisoformat(row['remind_at'])) for row in self.cursor.fetchall()]
+
+    def mark_sent(self, reminders: Iterable[Tuple[int, str]]) -> int:
+        """Отмечает напоминания отправленными одной транзакцией"""
+        reminders = list(reminders)
+        self.cursor.executemany(f'''
+        INSERT OR IGNORE INTO {self.__tablename__} (appointment_id, kind) VALUES (?, ?)''', reminders)
+        self.conn.commit()
+        self._log('MARK_SENT', count=len(reminders))
+        return len(reminders)
+
+    def purge_past(self, now: datetime) -> int:
+        """Удаляет отметки о напоминаниях по записям, которые уже начались или удалены.
+
+        get_due_reminders выбирает только будущие записи, поэтому такие отметки больше не нужны.
+        """
+        self.cursor.execute(f'''
+        DELETE FROM {self.__tablename__}
+        WHERE appointment_id NOT IN (
+            SELECT a.id FROM appointments a
+            JOIN slots sl ON sl.id = a.slot_id
+            WHERE sl.start_time > ?
+        )''', (now,))
+        deleted = self.cursor.rowcount
+        self.conn.commit()
+        if deleted > 0:
+            self._log('PURGE_PAST', count=deleted)
+        return deleted
@@ -0,0 +1,101 @@
+from datetime import date, time
+from typing import Dict, List, Optional
+
+from DB.models import ScheduleTemplate, Window
+from DB.tables.base import BaseTable
+
+# Шаблон по умолчанию: три окна, вторник и суббота - выходные
+DEFAULT_WINDOWS = [(time(11, 0), time(14, 0)), (time(14, 30), time(17, 30)), (time(18, 0), time(21, 0))]
+DEFAULT_WEEKDAYS = (0, 2, 3, 4, 6)
+
+
+class ScheduleTable(BaseTable):
+    """Шаблон расписания для генерации слотов.
+
+    schedule_windows - окна по дням недели (0 - понедельник), schedule_exceptions - окна на отдельные даты.
+    Строка исключения без времени означает выходной.
+    """
+    __tablename__ = 'schedule_windows'
+    __exceptions = 'schedule_exceptions'
+
+    def create_table(self):
+        """Создание таблиц шаблона расписания и заполнение шаблоном по умолчанию, если он пуст"""
+        self.cursor.executescript(f'''
+        CREATE TABLE IF NOT EXISTS {self.__tablename__} (
+            weekday INTEGER NOT NULL CHECK (weekday BETWEEN 0 AND 6),
+            start_time TEXT NOT NULL,  -- HH:MM
+            end_time TEXT NOT NULL,
+            PRIMARY KEY (weekday, start_time)
+        );
+
+        CREATE TABLE IF NOT EXISTS {self.__exceptions} (
+            day DATE NOT NULL,
+            start_time TEXT,  -- NULL - выходной
+            end_time TEXT,
+            UNIQUE (day, start_time)
+        );
+        ''')
+        self.cursor.execute(f'SELECT 1 FROM {self.__tablename__} LIMIT 1')
+        if not self.cursor.fetchone():
+            self.cursor.executemany(
+                f'INSERT INTO {self.__tablename__} (weekday, start_time, end_time) VALUES (?, ?, ?)',
+                [(weekday, s.strftime('%H:%M'), e.strftime('%H:%M'))
+                 for weekday in DEFAULT_WEEKDAYS for s, e in DEFAULT_WINDOWS])
+        self.conn.commit()
+        self._log('CREATE_TABLE')
+
+    @staticmethod
+    def _check_windows(windows: List[Window]):
+        for start, end in windows:
+            if end <= start:
+                raise ValueError(f"Window end {end} must be later than start {start}")
+        ordered = sorted(windows)
+        for (_, prev_end), (start, _) in zip(ordered, ordered[1:]):
+            if start < prev_end:
+                raise ValueError(f"Windows overlap at {start}")
+
+    def get_template(self, from_day: Optional[date] = None) -> ScheduleTemplate:
+        """Шаблон расписания с исключениями начиная с from_day (по умолчанию - все)"""
+        weekdays: Dict[int, List[Window]] = {}
+        self.cursor.execute(f'SELECT weekday, start_time, end_time FROM {self.__tablename__}')
+        for row in self.cursor.fetchall():
+            weekdays.setdefault(row['weekday'], []).append(
+                (time.fromisoformat(row['start_time']), time.fromisoformat(row['end_time'])))
+
+        exceptions: Dict[date, List[Window]] = {}
+        self.cursor.execute(f'SELECT day, start_time, end_time FROM {self.__exceptions} WHERE day >= ?',
+                            (from_day or date.min,))
+        for row in self.cursor.fetchall():
+            windows = exceptions.setdefault(date.fromisoformat(row['day']), [])
+            if row['start_time'] is not None:
+                windows.append((time.fromisoformat(row['start_time']), time.fromisoformat(row['end_time'])))
+        return ScheduleTemplate(weekdays, exceptions)
+
+    def set_weekday(self, weekday: int, windows: List[Window]) -> None:
+        """Заменяет окна дня недели (пустой список - выходной)"""
+        if not 0 <= weekday <= 6:
+            raise ValueError("Weekday must be between 0 and 6")
+        self._check_windows(windows)
+        self.cursor.execute(f'DELETE FROM {self.__tablename__} WHERE weekday = ?', (weekday,))
+        self.cursor.executemany(
+            f'INSERT INTO {self.__tablename__} (weekday, start_time, end_time) VALUES (?, ?, ?)',
+            [(weekday, s.strftime('%H:%M'), e.strftime('%H:%M')) for s, e in windows])
+        self.conn.commit()
+        self._log('SET_WEEKDAY', weekday=weekday, windows=len(windows))
+
+    def set_day(self, day: date, windows: List[Window]) -> None:
+        """Задаёт окна на дату вместо окон её дня недели (пустой список - выходной)"""
+        self._check_windows(windows)
+        self.cursor.execute(f'DELETE FROM {self.__exceptions} WHERE day = ?', (day,))
+        self.cursor.executemany(
+            f'INSERT INTO {self.__exceptions} (day, start_time, end_time) VALUES (?, ?, ?)',
+            [(day, s.strftime('%H:%M'), e.strftime('%H:%M')) for s, e in windows] or [(day, None, None)])
+        self.conn.commit()
+        self._log('SET_DAY', day=day, windows=len(windows))
+
+    def clear_day(self, day: date) -> bool:
+        """Возвращает дате окна её дня недели"""
+        self.cursor.execute(f'DELETE FROM {self.__exceptions} WHERE day = ?', (day,))
+        self.conn.commit()
+        self._log('CLEAR_DAY', day=day)
+        return self.cursor.rowcount > 0
@@ -1,12 +1,17 @@
 from typing import List, Optional
 
+from DB.cache import ServicesSnapshot, get_services_catalog
 from DB.models import ServiceModel
-from DB.tables.base import BaseTable
+from DB.tables.base import BaseTable, DB_PATH
 
 
 class ServicesTable(BaseTable):
     __tablename__ = 'services'
 
+    def __init__(self, db_name: str = DB_PATH):
+        super().__init__(db_name)
+        self._catalog = get_services_catalog(db_name)
+
     def create_table(self):
         """Создание таблицы services"""
         self.cursor.execute(f'''
@@ -30,47 +35,44 @@ class ServicesTable(BaseTable):
         self.cursor.execute(query, (service.name, service.description, service.duration, service.price))
         self._log('ADD_SERVICE', name=service.name, price=service.price)
         self.conn.commit()
-        return self.cursor.lastrowid
+        service_id = self.cursor.lastrowid
+        self._changed()
+        return service_id
 
-    def get_active_services(self) -> List[ServiceModel]:
-        """Возвращает список активных услуг."""
-        query = f"SELECT * FROM {self.__tablename__} WHERE is_active = TRUE"
-        self.cursor.execute(query)
-        return [ServiceModel(
+    def _snapshot(self) -> ServicesSnapshot:
+        """Каталог услуг из памяти, при необходимости загружает его из БД"""
+        snapshot, version = self._catalog.snapshot()
+        if snapshot is not None:
+            return snapshot
+
+        self.cursor.execute(f"SELECT * FROM {self.__tablename__}")
+        return self._catalog.fill([ServiceModel(
             id=row['id'],
             name=row['name'],
             description=row['description'],
             duration=row['duration'],
             price=row['price'],
             is_active=bool(row['is_active'])
-        ) for row in self.cursor]
+        ) for row in self.cursor], version)
+
+    def _changed(self):
+        """Перестраивает каталог после изменения услуг"""
+        self._catalog.invalidate()
+        self._snapshot()
+
+    def get_snapshot(self) -> ServicesSnapshot:
+        return self._snapshot()
+
+    def get_active_services(self) -> List[ServiceModel]:
+        """Возвращает список активных услуг."""
+        return list(self._snapshot().active)
 
     def get_all_services(self) -> List[ServiceModel]:
         """Возвращает список услуг."""
-        query = f"SELECT * FROM {self.__tablename__}"
-        self.cursor.execute(query)
-        return [ServiceModel(
-            id=row['id'],
-            name=row['name'],
-            description=row['description'],
-            duration=row['duration'],
-            price=row['price'],
-            is_active=bool(row['is_active'])
-        ) for row in self.cursor]
+        return list(self._snapshot().services)
 
     def get_service(self, service_id) -> Optional[ServiceModel]:
-        query = f"SELECT * FROM {self.__tablename__} WHERE id = ?"
-        self.cursor.execute(query, (service_id,))
-        row = self.cursor.fetchone()
-        if not row:
-            return None
-        return ServiceModel(
-            id=row['id'],
-            name=row['name'],
-            description=row['description'],
-            duration=row['duration'],
-            price=row['price'],
-            is_active=bool(row['is_active']))
+        return self._snapshot().by_id.get(service_id)
 
     def toggle_service_active(self, service_id: int, is_active: bool) -> None:
         """Активирует/деактивирует услугу."""
@@ -79,6 +81,7 @@ class ServicesTable(BaseTable):
         query = f"UPDATE {self.__tablename__} SET is_active = ? WHERE id = ?"
         self.cursor.execute(query, (int(is_active), service_id))
         self.conn.commit()
+        self._changed()
         self._log('TOGGLE_SERVICE_ACTIVE', service_id=service_id, is_active=is_active)
 
     def update_service(self, service: ServiceModel) -> None:
@@ -104,6 +107,7 @@ class ServicesTable(BaseTable):
             service.id
         ))
         self.conn.commit()
+        self._changed()
         self._log('UPDATE_SERVICE', service_id=service.id)
 
 
@@ -1,15 +1,24 @@
 from datetime import datetime, date, timedelta, time, timezone
-from typing import Optional, List, Union, Tuple
+from typing import Dict, Optional, List, Sequence, Union, Tuple
 
+from DB import cache
 from DB.models import SlotModel
-from DB.tables.base import BaseTable
+from DB.tables.base import BaseTable, DB_PATH
+from utils.interval_tree import IntervalTree
 
 
 class SlotsTable(BaseTable):
     __tablename__ = 'slots'
+    # Прошедший слот недоступен, даже если периодическая очистка ещё не сняла с него is_available
+    __not_past = "start_time >= datetime('now', '+3 hours')"
+
+    def __init__(self, db_name: str = DB_PATH):
+        super().__init__(db_name)
+        self._calendar = cache.get_calendar_cache(db_name)  # Через модуль: DB.cache импортирует этот модуль через utils
+        self._index = cache.get_slot_index(db_name)
 
     def create_table(self):
-        """Создание таблицы slots с триггером для автоматического обновления статуса"""
+        """Создание таблицы slots с индексами и триггером для автоматического обновления статуса"""
         __timezone_offset = timezone(timedelta(hours=3))  # Для MSK (UTC+3)
         self.cursor.executescript(f'''
         CREATE TABLE IF NOT EXISTS {self.__tablename__} (
@@ -20,6 +29,12 @@ class SlotsTable(BaseTable):
             is_deleted BOOLEAN NOT NULL DEFAULT 0
         );
 
+        -- Поиск свободных слотов по времени: индекс покрывает все столбцы таблицы
+        CREATE INDEX IF NOT EXISTS idx_slots_availability
+        ON {self.__tablename__}(is_deleted, is_available, start_time, end_time);
+
+        CREATE INDEX IF NOT EXISTS idx_slots_start_time ON {self.__tablename__}(start_time, is_deleted);
+
         CREATE TRIGGER IF NOT EXISTS update_past_slots
         AFTER INSERT ON {self.__tablename__}
         BEGIN
@@ -40,7 +55,8 @@ class SlotsTable(BaseTable):
         self.conn.commit()
         self._log('CREATE_TABLE')
 
-    def _update_past_slots_status(self):
+    def sweep_past_slots(self) -> int:
+        """Снимает доступность с прошедших слотов. Вызывается планировщиком, а не при чтении"""
         query = f"""
         UPDATE {self.__tablename__}
         SET is_available = 0
@@ -51,35 +67,65 @@ class SlotsTable(BaseTable):
         updated = self.cursor.rowcount
         self.conn.commit()
         if updated > 0:
+            self._calendar.invalidate()
             self._log('UPDATE_PAST_SLOTS', count=updated)
         return updated
 
+    def load_slot_index(self) -> int:
+        """Загружает в память интервалы неудалённых слотов, если они ещё не загружены. Возвращает их число"""
+        with self._index.lock:
+            if not self._index.loaded:
+                self.cursor.execute(f'SELECT id, start_time, end_time FROM {self.__tablename__} WHERE is_deleted = 0')
+                self._index.load((datetime.fromisoformat(row['start_time']), datetime.fromisoformat(row['end_time']),
+                                  row['id']) for row in self.cursor.fetchall())
+                self._log('LOAD_SLOT_INDEX')
+            return len(self._index)
+
+    def check_slots(self, slots: Sequence[Tuple[datetime, datetime]]) -> List[Optional[str]]:
+        """Текст ошибки для каждого слота списка (None - слот можно добавить).
+
+        Слот нельзя добавить, если время задано неверно или он пересекается с существующим
+        слотом либо со слотом выше в списке. Касание концами пересечением не считается.
+        """
+        self.load_slot_index()
+        batch = IntervalTree()  # Принятые слоты списка
+        errors: List[Optional[str]] = []
+        for i, (start_time, end_time) in enumerate(slots):
+            if not isinstance(start_time, datetime) or not isinstance(end_time, datetime):
+                error = "Неверные параметры времени"
+            elif end_time <= start_time:
+                error = "Время окончания должно быть позже времени начала"
+            else:
+                overlap = self._index.find_overlap(start_time, end_time) or batch.find_overlap(start_time, end_time)
+                if overlap is None:
+                    error = None
+                    batch.add(start_time, end_time, i)
+                elif overlap[0] == start_time:
+                    error = "Интервал с таким временем начала уже существует"
+                else:
+                    error = (f"Интервал пересекается со слотом {overlap[0].strftime('%d.%m.%Y %H:%M')}-"
+                             f"{overlap[1].strftime('%H:%M')}")
+            errors.append(error)
+        return errors
+
     def add_slot(self, start_time: datetime, end_time: datetime) -> Tuple[bool, Union[int, str]]:
         """Добавляет новый слот для записи и возвращает его ID."""
         try:
-            if not isinstance(start_time, datetime) or not isinstance(end_time, datetime):
-                return False, "Неверные параметры времени"
-
-            if end_time <= start_time:
-                print(end_time, start_time)
-                return False, "Время окончания должно быть позже времени начала"
-
-            query_check = f"""
-                SELECT id FROM {self.__tablename__} 
-                WHERE start_time = ? AND is_deleted = 0
-                """
-            self.cursor.execute(query_check, (start_time,))
-            if self.cursor.fetchone():
-                return False, "Интервал с таким временем начала уже существует"
-
-            query_insert = f"""
-                INSERT INTO {self.__tablename__} (start_time, end_time)
-                VALUES (?, ?)
-                """
-            self.cursor.execute(query_insert, (start_time, end_time))
-            self.conn.commit()
-
-            slot_id = self.cursor.lastrowid
+            with self._index.lock:
+                error = self.check_slots([(start_time, end_time)])[0]
+                if error:
+                    return False, error
+
+                query_insert = f"""
+                    INSERT INTO {self.__tablename__} (start_time, end_time)
+                    VALUES (?, ?)
+                    """
+                self.cursor.execute(query_insert, (start_time, end_time))
+                self.conn.commit()
+                slot_id = self.cursor.lastrowid
+                self._index.add(slot_id, start_time, end_time)
+            self._calendar.invalidate()
+
             self._log('ADD_SLOT', start_time=start_time, end_time=end_time)
             return True, slot_id
 
@@ -89,24 +135,76 @@ class SlotsTable(BaseTable):
             self._log('ADD_SLOT_ERROR', error=error_msg)
             return False, error_msg
 
+    def _existing_start_times(self, start_times: List[datetime], batch_size: int = 500) -> Dict[datetime, int]:
+        """ID неудалённых слотов с указанным временем начала"""
+        existing = {}
+        for i in range(0, len(start_times), batch_size):
+            batch = start_times[i:i + batch_size]
+            self.cursor.execute(f"""
+                SELECT id, start_time FROM {self.__tablename__}
+                WHERE is_deleted = 0 AND start_time IN ({', '.join('?' * len(batch))})
+                """, batch)
+            existing.update((datetime.fromisoformat(row['start_time']), row['id']) for row in self.cursor.fetchall())
+        return existing
+
+    def add_slots(self, slots: List[Tuple[datetime, datetime]]) -> List[Tuple[bool, Union[int, str], datetime, datetime]]:
+        """Добавляет слоты одной транзакцией.
+
+        Проверки те же, что в add_slot (см. check_slots), слоты, не прошедшие проверку, пропускаются.
+        Возвращает для каждого слота в порядке списка (успех, ID или текст ошибки, начало, конец).
+        """
+        results: List[Optional[Tuple[bool, Union[int, str], datetime, datetime]]] = [None] * len(slots)
+        valid: Dict[datetime, int] = {}  # Начало слота -> индекс в списке
+        try:
+            with self._index.lock:
+                for i, error in enumerate(self.check_slots(slots)):
+                    if error:
+                        results[i] = (False, error, *slots[i])
+                    else:
+                        valid[slots[i][0]] = i
+
+                if valid:
+                    self.cursor.executemany(f"""
+                        INSERT INTO {self.__tablename__} (start_time, end_time)
+                        VALUES (?, ?)
+                        """, [slots[i] for i in valid.values()])
+                    slot_ids = self._existing_start_times(list(valid))
+                    self.conn.commit()
+                    for start_time, i in valid.items():
+                        self._index.add(slot_ids[start_time], *slots[i])
+                        results[i] = (True, slot_ids[start_time], *slots[i])
+            if valid:
+                self._calendar.invalidate()
+                self._log('ADD_SLOTS', count=len(valid))
+
+        except Exception as e:
+            self.conn.rollback()
+            error_msg = f"Error adding slots: {str(e)}"
+            self._log('ADD_SLOTS_ERROR', error=error_msg)
+            for i in valid.values():
+                results[i] = (False, error_msg, *slots[i])
+
+        return results
+
     def is_available(self, slot_id: int) -> Optional[bool]:
-        self._update_past_slots_status()
         query = f"""
-            SELECT * FROM {self.__tablename__} 
+            SELECT is_available AND NOT is_deleted AND {self.__not_past} AS is_open
+            FROM {self.__tablename__} 
             WHERE id = ?
             """
 
         self.cursor.execute(query, (slot_id,))
         row = self.cursor.fetchone()
         if row:
-            return bool(row['is_available']) and not bool(row['is_deleted'])
+            return bool(row['is_open'])
         else:
             return None
 
     def get_slot(self, slot_id: int) -> Optional[SlotModel]:
         """Возвращает слот, если он не удален."""
         query = f"""
-            SELECT * FROM {self.__tablename__} 
+            SELECT id, start_time, end_time, is_available AND {self.__not_past} AS is_available
+            FROM {self.__tablename__} 
             WHERE id = ? AND is_deleted = 0
             """
         self.cursor.execute(query, (slot_id,))
@@ -125,13 +223,12 @@ class SlotsTable(BaseTable):
 
     def get_available_slots(self, from_time: Optional[datetime] = None, to_time: Optional[datetime] = None) -> List[SlotModel]:
         """Возвращает список доступных слотов."""
-        self._update_past_slots_status()
         if from_time and to_time and to_time < from_time:
             raise ValueError("Конечное время не может быть раньше начального")
 
         query = f"""
             SELECT * FROM {self.__tablename__} 
-            WHERE is_available = TRUE AND is_deleted = 0
+            WHERE is_available = TRUE AND is_deleted = 0 AND {self.__not_past}
             """
 
         params = []
@@ -172,10 +269,9 @@ class SlotsTable(BaseTable):
         Returns:
             Optional[datetime]: Дата начала первого свободного слота или None, если свободных слотов нет.
         """
-        self._update_past_slots_status()
         query = f"""
             SELECT start_time FROM {self.__tablename__} 
-            WHERE is_available = TRUE and is_deleted = 0
+            WHERE is_available = TRUE and is_deleted = 0 AND {self.__not_past}
             ORDER BY start_time ASC
             LIMIT 1
         """
@@ -206,6 +302,7 @@ class SlotsTable(BaseTable):
         query = f'UPDATE {self.__tablename__} SET is_available = ? WHERE id = ?'
         self.cursor.execute(query, (available, slot_id))
         self.conn.commit()
+        self._calendar.invalidate()
 
         action = 'FREE SLOT' if available else 'RESERVE SLOT'
         self._log(f'{action} (ID: {slot_id})',
@@ -237,8 +334,11 @@ class SlotsTable(BaseTable):
                 return False, "Невозможно удалить занятый слот"
 
             query = f"UPDATE {self.__tablename__} SET is_deleted = 1, is_available = FALSE WHERE id = ?"
-            self.cursor.execute(query, (slot_id,))
-            self.conn.commit()
+            with self._index.lock:
+                self.cursor.execute(query, (slot_id,))
+                self.conn.commit()
+                self._index.remove(slot_id)
+            self._calendar.invalidate()
 
             self._log('SOFT_DELETE_SLOT', slot_id=slot_id)
             return True, "Слот успешно удален"
@@ -2,12 +2,20 @@ import sqlite3
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
 
-from DB.tables.base import BaseTable
+from DB.cache import get_master_registry, get_user_cache
+from DB.tables.base import BaseTable, DB_PATH, SeekKey
 from DB.models import UserModel, Pagination
 
 
 class UsersTable(BaseTable):
     __tablename__ = 'users'
+    __seek = SeekKey(key='u.registration_date', row_id='u.user_id', descending=True,
+                     anchor_key='SELECT registration_date FROM users WHERE user_id = ?')
+
+    def __init__(self, db_name: str = DB_PATH):
+        super().__init__(db_name)
+        self._cache = get_user_cache(db_name)
+        self._masters = get_master_registry(db_name)
 
     def create_table(self):
         """Создание таблицы users"""
@@ -22,6 +30,8 @@ class UsersTable(BaseTable):
             contact TEXT,
             registration_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )''')
+        self.cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_users_registration '
+                            f'ON {self.__tablename__}(registration_date, user_id)')
         self.conn.commit()
         self._log('CREATE_TABLE')
 
@@ -44,40 +54,58 @@ class UsersTable(BaseTable):
                                     (user.username, user.first_name, user.last_name, user.user_id))
                 self.conn.commit()
                 self._log('UPDATE_USER', user_id=user.user_id)
-        else:
-            self.cursor.execute(f'''
-                INSERT INTO {self.__tablename__} (user_id, username, first_name, last_name, is_admin)
-                VALUES (?, ?, ?, ?, ?)''',
-                                (user.user_id, user.username, user.first_name, user.last_name, int(user.is_admin)))
-            self.conn.commit()
-            self._log('ADD_USER', user_id=user.user_id)
+                return self._refresh(user.user_id)
+            return existing_user
 
-        return self.get_user(user.user_id)
+        self.cursor.execute(f'''
+            INSERT INTO {self.__tablename__} (user_id, username, first_name, last_name, is_admin)
+            VALUES (?, ?, ?, ?, ?)''',
+                            (user.user_id, user.username, user.first_name, user.last_name, int(user.is_admin)))
+        self.conn.commit()
+        self._log('ADD_USER', user_id=user.user_id)
+        return self._refresh(user.user_id)
 
     def is_exists(self, user_id: int) -> bool:
         self.cursor.execute(f'SELECT COUNT(*) FROM {self.__tablename__} WHERE user_id = ?', (user_id,))
         return self.cursor.fetchone()[0] > 0
 
     def get_user(self, user_id: int) -> Optional[UserModel]:
-        """Получение пользователя по ID"""
+        """Получение пользователя по ID (из кэша, если он там есть)"""
+        user = self._cache.get(user_id)
+        if user is None:
+            user = self._load_user(user_id)
+        return user
+
+    def _load_user(self, user_id: int) -> Optional[UserModel]:
+        """Читает пользователя из БД и обновляет кэш"""
         self.cursor.execute(f'SELECT * FROM {self.__tablename__} WHERE user_id = ?', (user_id,))
         row = self.cursor.fetchone()
-        if row:
-            return UserModel(
-                user_id=row['user_id'],
-                username=row['username'],
-                first_name=row['first_name'],
-                last_name=row['last_name'],
-                is_admin=bool(row['is_admin']),
-                is_banned=bool(row['is_banned']),
-                registration_date=(
-                    datetime.fromisoformat(row['registration_date']) + timedelta(hours=3)
-                    if row['registration_date']
-                    else None
-                ),
-                contact=row['contact']
-            )
-        return None
+        if row is None:
+            self._cache.pop(user_id)
+            return None
+
+        user = UserModel(
+            user_id=row['user_id'],
+            username=row['username'],
+            first_name=row['first_name'],
+            last_name=row['last_name'],
+            is_admin=bool(row['is_admin']),
+            is_banned=bool(row['is_banned']),
+            registration_date=(
+                datetime.fromisoformat(row['registration_date']) + timedelta(hours=3)
+                if row['registration_date']
+                else None
+            ),
+            contact=row['contact']
+        )
+        self._cache.set(user_id, user)
+        return user
+
+    def _refresh(self, user_id: int) -> Optional[UserModel]:
+        """Обновляет кэши после изменения пользователя"""
+        if self._masters.is_master(user_id) is not False:  # В реестре мастеров лежит копия профиля
+            self._masters.invalidate()
+        return self._load_user(user_id)
 
     def update_user(self, user: UserModel) -> Optional[UserModel]:
         """Обновление информации о пользователе"""
@@ -88,7 +116,7 @@ class UsersTable(BaseTable):
                             (user.username, user.first_name, user.last_name, int(user.is_admin), user.user_id))
         self.conn.commit()
         self._log('UPDATE_USER', user_id=user.user_id)
-        return self.get_user(user.user_id)
+        return self._refresh(user.user_id)
 
     def delete_user(self, user_id: int) -> bool:
         """Удаление пользователя"""
@@ -96,12 +124,23 @@ class UsersTable(BaseTable):
         self.cursor.execute('DELETE FROM queries WHERE user_id = ?', (user_id,))
         self.conn.commit()
         deleted = self.cursor.rowcount > 0
+        self._refresh(user_id)
         if deleted:
             self._log('DELETE_USER', user_id=user_id)
         return deleted
 
-    def get_all_users(self, page: int = 1, per_page: int = 10) -> Tuple[List[UserModel], Pagination]:
-        """Получение пользователей с постраничной навигацией"""
+    def get_all_users(self,
+                      page: int = 1,
+                      per_page: int = 10,
+                      anchor: Optional[int] = None,
+                      step: int = 1,
+                      total: Optional[int] = None) -> Tuple[List[UserModel], Pagination]:
+        """Получение пользователей с постраничной навигацией
+
+        :param anchor: user_id крайнего пользователя соседней страницы (keyset-пагинация)
+        :param step: 1 - страница после якоря, -1 - до него
+        :param total: Известное общее количество пользователей, чтобы не пересчитывать его
+        """
 
         pagination = Pagination(
             page=page,
@@ -110,17 +149,22 @@ class UsersTable(BaseTable):
             total_pages=0   # -//-
         )
 
-        self.cursor.execute('''
+        # Запросы считаются подзапросом только для строк страницы: без GROUP BY страница
+        # выбирается прямо по idx_users_registration, без сортировки всей таблицы
+        rows = self._fetch_page(
+            select='''
             SELECT 
                 u.user_id, u.username, u.first_name, u.last_name, 
                 u.is_admin, u.is_banned, u.registration_date, u.contact,
-                COUNT(q.query_id) as query_count
+                (SELECT COUNT(*) FROM queries q WHERE q.user_id = u.user_id) as query_count
             FROM users u
-            LEFT JOIN queries q ON u.user_id = q.user_id
-            GROUP BY u.user_id
-            ORDER BY u.registration_date DESC
-            LIMIT ? OFFSET ?
-        ''', (pagination.per_page, pagination.offset))
+            WHERE 1''',
+            params=(),
+            seek=self.__seek,
+            pagination=pagination,
+            anchor=anchor,
+            step=step
+        )
 
         users = [UserModel(
             user_id=row['user_id'],
@@ -135,13 +179,14 @@ class UsersTable(BaseTable):
                 else None),
             contact=row['contact'],
             query_count=row['query_count']
-        ) for row in self.cursor]
+        ) for row in rows]
 
-        self.cursor.execute('SELECT COUNT(*) as total FROM users')
-        total_users = self.cursor.fetchone()['total']
+        if total is None:
+            self.cursor.execute('SELECT COUNT(*) as total FROM users')
+            total = self.cursor.fetchone()['total']
 
-        pagination.total_items = total_users
-        pagination.total_pages = (total_users + per_page - 1) // per_page
+        pagination.total_items = total
+        pagination.total_pages = (total + per_page - 1) // per_page
 
         return users, pagination
 
@@ -176,6 +221,7 @@ class UsersTable(BaseTable):
                 (int(is_admin), user_id)
             )
             self.conn.commit()
+            self._refresh(user_id)
             self._log('SET_ADMIN', user_id=user_id, is_admin=is_admin, set_by=set_by)
             return True
         except sqlite3.Error as e:
@@ -203,6 +249,7 @@ class UsersTable(BaseTable):
                 (int(ban), user_id)
             )
             self.conn.commit()
+            self._refresh(user_id)
 
             action = 'BAN' if ban else 'UNBAN'
             log_details = {'user_id': user_id, 'status': ban, 'banned_by': banned_by}
@@ -219,6 +266,8 @@ class UsersTable(BaseTable):
         """Обновляет номер телефона клиента"""
         query = f"UPDATE {self.__tablename__} SET contact = ? WHERE user_id = ?"
         self.cursor.execute(query, (contact, user_id))
+        self.conn.commit()
+        self._refresh(user_id)
         self._log('UPDATE_CLIENT_CONTACT', user_id=user_id, contact=contact)
 
 
@@ -1,6 +1,6 @@
 from aiogram.types import Message
 from phrases import PHRASES_RU
-from DB.tables.users import UsersTable
+from DB import aio
 from typing import Optional, Callable
 
 
@@ -33,9 +33,8 @@ def digit(_func: Optional[Callable] = None, *, default=None):
 def user_id(func):
     @digit
     async def wrapper(message: Message, _user_id):
-        with UsersTable() as users_db:
-            if not users_db.is_exists(_user_id):
-                await message.answer(PHRASES_RU.replace('error.user_not_exist', user_id=_user_id))
-                return
-            await func(message, _user_id)
+        if not await aio.users.is_exists(_user_id):
+            await message.answer(PHRASES_RU.replace('error.user_not_exist', user_id=_user_id))
+            return
+        await func(message, _user_id)
     return wrapper
@@ -3,27 +3,30 @@ from typing import Optional
 from aiogram.filters import BaseFilter, Filter
 from aiogram.types import Message, CallbackQuery
 
-from DB.tables.masters import MastersTable
-from DB.tables.users import UsersTable
-from DB.models import UserModel, Master
+from DB import aio
+from DB.models import UserModel
 from config import const
 
 
+async def _get_user(user_id: int, user_row: Optional[UserModel]) -> Optional[UserModel]:
+    """Пользователь, загруженный GetUserMiddleware, иначе - из кэша или БД"""
+    return user_row or aio.users_cache.get(user_id) or await aio.users.get_user(user_id)
+
+
 class AdminFilter(BaseFilter):
-    async def __call__(self, message: Message) -> bool:
-        with UsersTable() as users_db:
-            user: Optional[UserModel] = users_db.get_user(message.from_user.id)
-            if user:
-                return user.is_admin
-            return False
+    async def __call__(self, message: Message, user_row: Optional[UserModel] = None) -> bool:
+        user: Optional[UserModel] = await _get_user(message.from_user.id, user_row)
+        if user:
+            return user.is_admin
+        return False
 
 
 class MasterFilter(BaseFilter):
-    async def __call__(self, message: Message) -> bool:
-        with MastersTable() as master_db, UsersTable() as db:
-            user_master: Optional[Master] = master_db.get_master(message.from_user.id)
-            user: Optional[UserModel] = db.get_user(message.from_user.id)
-            return user.is_admin or user_master and user_master.is_master   # АДМИН ИМЕЕТ ДОСТУП К ИНТЕРФЕЙСУ МАСТЕРА
+    async def __call__(self, message: Message, user_row: Optional[UserModel] = None) -> bool:
+        user: Optional[UserModel] = await _get_user(message.from_user.id, user_row)
+        if user and user.is_admin:  # АДМИН ИМЕЕТ ДОСТУП К ИНТЕРФЕЙСУ МАСТЕРА
+            return True
+        return await aio.is_master(message.from_user.id)
 
 
 class IsCancelActionFilter(Filter):
@@ -30,6 +30,9 @@ class AdminPageCallBack(CallbackData, prefix='cut'):
     type_of_event: PageListSection
     user_id: int = 0
     page: int = 1
+    anchor: Optional[int] = None  # ID крайней строки текущей страницы, от которой ищется следующая/предыдущая
+    step: int = 1  # 1 - страница после anchor, -1 - до него
+    total: Optional[int] = None  # Количество строк, чтобы не пересчитывать его при листании
 
 
 class BookingPageCallBack(CallbackData, prefix='booking'):
@@ -38,6 +41,9 @@ class BookingPageCallBack(CallbackData, prefix='booking'):
     app_id: Optional[int] = None
     app_date: Optional[date] = None
     mode: Optional[AppListMode] = None
+    anchor: Optional[int] = None  # см. AdminPageCallBack
+    step: int = 1
+    total: Optional[int] = None
 
 
 class BookingStatusCallBack(CallbackData, prefix='status'):
@@ -4,9 +4,9 @@ from aiogram.exceptions import TelegramBadRequest
 from typing import Optional, Union, List
 from aiogram.types import InlineKeyboardMarkup, ReplyKeyboardMarkup, Message, InputMediaPhoto
 
+from DB import aio
 from DB.models import PhotoModel, AppointmentModel
-from DB.tables.appointments import AppointmentsTable
-from DB.tables.masters import MastersTable
+from bot.bot_utils.outbox import outbox
 from bot.keyboards import get_keyboard
 from config import bot
 from config.const import CANCELLED, REJECTED, CONFIRMED
@@ -35,13 +35,13 @@ async def send_or_edit_message(
     try:
         if message_id:
             try:
-                message = await bot.edit_message_text(
+                message = await outbox.call(chat_id, lambda: bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=message_id,
                     text=text,
                     reply_markup=reply_markup,
                     **kwargs
-                )
+                ), edit_of=message_id)
                 return message
             except TelegramBadRequest as e:
                 if 'message is not modified' in str(e):
@@ -52,12 +52,12 @@ async def send_or_edit_message(
                 )
                 raise
 
-        message = await bot.send_message(
+        message = await outbox.call(chat_id, lambda: bot.send_message(
             chat_id=chat_id,
             text=text,
             reply_markup=reply_markup,
             **kwargs
-        )
+        ))
         return message
 
     except TelegramBadRequest as e:
@@ -88,22 +88,20 @@ async def notify_master(app: AppointmentModel):
                                   user_id=app.client.user_id,
                                   date=app.formatted_date,
                                   slot_time=app.slot_str)
-        with MastersTable() as db:
-            masters = db.get_all_masters()
-            if len(masters) > 0:
-                master = masters[0]
-                await bot.send_message(chat_id=master.user.user_id, text=text)
-            else:
-                logger.error('No master in db')
+        masters = await aio.masters.get_all_masters()
+        if len(masters) > 0:
+            master = masters[0]
+            await outbox.call(master.user.user_id, lambda: bot.send_message(chat_id=master.user.user_id, text=text))
+        else:
+            logger.error('No master in db')
 
 
 async def notify_client(app: AppointmentModel):
-    with MastersTable() as db:
-        masters = db.get_all_masters()
-        if not masters:
-            logger.error('No master in db')
-            return
-        master = masters[0]
+    masters = await aio.masters.get_all_masters()
+    if not masters:
+        logger.error('No master in db')
+        return
+    master = masters[0]
     try:
         data = {
             'date': app.formatted_date,
@@ -111,35 +109,37 @@ async def notify_client(app: AppointmentModel):
             'master_id': master.user.user_id,
             'master_username': master.user.username or master.user.first_name or '(здесь)'
         }
+        chat_id = app.client.user_id
         if app.status == CONFIRMED:
             text = PHRASES_RU.replace('answer.notify.client.confirmed', **data)
-            await bot.send_message(chat_id=app.client.user_id, text=text)
+            await outbox.call(chat_id, lambda: bot.send_message(chat_id=chat_id, text=text))
         elif app.status == CANCELLED:
             text = PHRASES_RU.replace('answer.notify.client.cancelled', **data)
-            await bot.send_message(chat_id=app.client.user_id, text=text)
+            await outbox.call(chat_id, lambda: bot.send_message(chat_id=chat_id, text=text))
         elif app.status == REJECTED:
             text = PHRASES_RU.replace('answer.notify.client.rejected', **data)
-            await bot.send_message(chat_id=app.client.user_id, text=text)
+            await outbox.call(chat_id, lambda: bot.send_message(chat_id=chat_id, text=text))
     except Exception as e:
         logger.error(f'Unexpected error when notifying client (chat_id={app.client.user_id}): {str(e)})')
 
 
 async def send_reminder(appointment_id: int, reminder_type: str):
-    with AppointmentsTable() as db:
-        appointment = db.get_appointment_by_id(appointment_id)
-        if appointment.status != CONFIRMED:
-            return
-
-        time_left = PHRASES_RU.error.unknown
-        match reminder_type:
-            case '1h':
-                time_left = '1 ч до вашей записи!'  # TODO
-            case '24h':
-                time_left = 'завтра у Вас запланирована запись'
-        text = PHRASES_RU.replace('answer.notify.client.scheduled', time_left=time_left)
-
-        await bot.send_message(
-            chat_id=appointment.client.user_id,
-            text=text,
-            reply_markup=get_keyboard(appointment.client.user_id)
-        )
+    appointment = await aio.appointments.get_appointment_by_id(appointment_id)
+    if appointment.status != CONFIRMED:
+        return
+
+    time_left = PHRASES_RU.error.unknown
+    match reminder_type:
+        case '1h':
+            time_left = '1 ч до вашей записи!'  # TODO
+        case '24h':
+            time_left = 'завтра у Вас запланирована запись'
+    text = PHRASES_RU.replace('answer.notify.client.scheduled', time_left=time_left)
+    chat_id = appointment.client.user_id
+    reply_markup = await get_keyboard(chat_id)
+
+    await outbox.call(chat_id, lambda: bot.send_message(
+        chat_id=chat_id,
+        text=text,
+        reply_markup=reply_markup
+    ))
@@ -0,0 +1,227 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from aiogram.exceptions import TelegramRetryAfter
+
+from config.const import OUTBOX_CHAT_BURST, OUTBOX_CHAT_RATE, OUTBOX_MAX_RETRIES, OUTBOX_RATE, OUTBOX_WORKERS
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Ограничитель частоты: rate токенов в секунду, не больше capacity в запасе"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def is_idle(self) -> bool:
+        """Запас полон - состояние можно не хранить"""
+        self._refill(time.monotonic())
+        return self._tokens >= self.capacity
+
+    def try_acquire(self) -> float:
+        """Берёт токен и возвращает 0, а если токенов нет - через сколько секунд появится следующий"""
+        self._refill(time.monotonic())
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+    async def acquire(self):
+        while delay := self.try_acquire():
+            await asyncio.sleep(delay)
+
+
+@dataclass
+class _Outgoing:
+    chat_id: int
+    call: Callable[[], Awaitable[Any]]
+    future: asyncio.Future
+    edit_key: Optional[Tuple[int, int]] = None  # (chat_id, message_id) для редактирования
+    enqueued: float = field(default_factory=time.monotonic)
+    retries: int = 0
+
+
+class Outbox:
+    """Очередь исходящих запросов к Telegram.
+
+    Запросы выполняются workers обработчиками с общим ограничением частоты (rate в секунду)
+    и ограничением на чат (chat_rate в секунду, до chat_burst подряд). У каждого чата своя очередь,
+    обработчикам выдаются чаты из общей очереди готовых. Чат, у которого запрос уже выполняется,
+    в неё не попадает, поэтому порядок в пределах чата сохраняется.
+    Чат, исчерпавший свой лимит или получивший TelegramRetryAfter, возвращается в очередь готовых
+    по таймеру. Обработчик при этом не ждёт и сразу берёт другой чат.
+    Ещё не отправленное редактирование сообщения заменяется более новым редактированием того же сообщения.
+    Пока очередь не запущена, запросы выполняются сразу.
+    """
+
+    def __init__(self,
+                 workers: int = OUTBOX_WORKERS,
+                 rate: float = OUTBOX_RATE,
+                 chat_rate: float = OUTBOX_CHAT_RATE,
+                 chat_burst: int = OUTBOX_CHAT_BURST,
+                 max_retries: int = OUTBOX_MAX_RETRIES):
+        self.workers = workers
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.max_retries = max_retries
+
+        self._bucket = TokenBucket(rate, rate)
+        self._chat_buckets: Dict[int, TokenBucket] = {}
+        self._chats: Dict[int, Deque[_Outgoing]] = {}  # Неотправленные запросы по чатам
+        self._active: Set[int] = set()  # Чаты в очереди готовых, в работе или на таймере
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+        self._pending = 0
+        self._drained: Optional[asyncio.Event] = None  # Все запросы обработаны
+        self._pending_edits: Dict[Tuple[int, int], _Outgoing] = {}
+        self._ready: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def call(self, chat_id: int, call: Callable[[], Awaitable[Any]], edit_of: Optional[int] = None) -> Any:
+        """Ставит запрос в очередь и ждёт его результата.
+
+        :param call: Функция без аргументов, выполняющая запрос, например ``lambda: bot.send_message(...)``
+        :param edit_of: message_id, если запрос редактирует это сообщение
+        """
+        if self._ready is None:
+            return await call()
+
+        edit_key = (chat_id, edit_of) if edit_of else None
+        pending = self._pending_edits.get(edit_key) if edit_key else None
+        if pending is not None:
+            pending.call = call  # Старое содержимое всё равно было бы сразу перезаписано
+            metrics.inc('outbox_merged_edits')
+            return await asyncio.shield(pending.future)
+
+        item = _Outgoing(chat_id, call, asyncio.get_running_loop().create_future(), edit_key)
+        if edit_key:
+            self._pending_edits[edit_key] = item
+        self._chats.setdefault(chat_id, deque()).append(item)
+        self._pending += 1
+        self._drained.clear()
+        if chat_id not in self._active:
+            self._active.add(chat_id)
+            self._ready.put_nowait(chat_id)
+        metrics.set('outbox_queue_depth', self._pending)
+        return await asyncio.shield(item.future)
+
+    def _chat_bucket(self, chat_id: int) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            if len(self._chat_buckets) > 1000:  # Не храним состояние давно молчащих чатов
+                self._chat_buckets = {k: v for k, v in self._chat_buckets.items() if not v.is_idle()}
+            bucket = self._chat_buckets[chat_id] = TokenBucket(self.chat_rate, self.chat_burst)
+        return bucket
+
+    def _rearm(self, chat_id: int, delay: float):
+        """Возвращает чат в очередь готовых через delay секунд"""
+        def ready():
+            self._timers.pop(chat_id, None)
+            if self._ready is not None:
+                self._ready.put_nowait(chat_id)
+
+        self._timers[chat_id] = asyncio.get_running_loop().call_later(delay, ready)
+
+    def _finish(self, chat_id: int, item: _Outgoing, result: Any = None, error: Optional[BaseException] = None):
+        queue = self._chats[chat_id]
+        queue.popleft()
+        self._pending -= 1
+        if not item.future.done():
+            if error is None:
+                item.future.set_result(result)
+            else:
+                item.future.set_exception(error)
+        latency_ms = int((time.monotonic() - item.enqueued) * 1000)
+        metrics.set('outbox_latency_ms_last', latency_ms)
+        metrics.inc('outbox_latency_ms_sum', latency_ms)
+        metrics.set('outbox_queue_depth', self._pending)
+
+        if queue:
+            self._ready.put_nowait(chat_id)
+        else:
+            del self._chats[chat_id]
+            self._active.discard(chat_id)
+        if not self._pending:
+            self._drained.set()
+
+    async def _process(self, chat_id: int):
+        """Выполняет первый запрос чата"""
+        delay = self._chat_bucket(chat_id).try_acquire()
+        if delay:
+            self._rearm(chat_id, delay)
+            return
+        await self._bucket.acquire()
+
+        item = self._chats[chat_id][0]
+        if item.edit_key:
+            self._pending_edits.pop(item.edit_key, None)  # Дальнейшие правки - новым запросом
+        try:
+            result = await item.call()
+        except TelegramRetryAfter as e:
+            if item.retries < self.max_retries:
+                item.retries += 1
+                metrics.inc('outbox_retry_after')
+                logger.warning('Flood control for chat %d, retrying in %ds', chat_id, e.retry_after)
+                self._rearm(chat_id, e.retry_after)
+                return
+            metrics.inc('outbox_failed')
+            self._finish(chat_id, item, error=e)
+        except Exception as e:
+            metrics.inc('outbox_failed')
+            self._finish(chat_id, item, error=e)
+        else:
+            metrics.inc('outbox_sent')
+            self._finish(chat_id, item, result)
+
+    async def _worker(self):
+        while True:
+            chat_id = await self._ready.get()
+            await self._process(chat_id)
+
+    def start(self):
+        if self._ready is None:
+            self._ready = asyncio.Queue()
+            self._drained = asyncio.Event()
+            self._drained.set()
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self, timeout: float = 10.0):
+        """Дожидается отправки очереди (не дольше timeout секунд) и останавливает обработчики.
+
+        Запросы, не отправленные за timeout, завершаются ошибкой, чтобы ожидающие их не зависли.
+        """
+        if self._ready is None:
+            return
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning('Outbox stopped with %d unsent messages', self._pending)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for timer in self._timers.values():
+            timer.cancel()
+
+        for queue in self._chats.values():
+            for item in queue:
+                if not item.future.done():
+                    item.future.set_exception(RuntimeError('Outbox stopped before the request was sent'))
+        self._ready, self._tasks = None, []
+        self._chats, self._active, self._timers, self._pending_edits = {}, set(), {}, {}
+        self._pending = 0
+        metrics.set('outbox_queue_depth', 0)
+
+
+outbox = Outbox()
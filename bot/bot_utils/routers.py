@@ -1,5 +1,5 @@
 import inspect
-from typing import List, Union, Tuple
+from typing import Dict, List, Optional, Union, Tuple
 from aiogram import Router
 from aiogram.filters import Command
 from aiogram.types import Message
@@ -10,6 +10,7 @@ from bot.bot_utils.models import CommandUnit
 
 class BaseRouter(Router):
     available_commands: List[CommandUnit] = []
+    commands_index: Dict[str, CommandUnit] = {}  # Имя или алиас в нижнем регистре -> команда
     is_admin: bool = False  # По умолчанию не админский роутер
 
     def __init__(self, *args, **kwargs):
@@ -20,8 +21,12 @@ class BaseRouter(Router):
     def command(self, command: Union[str, Tuple[str, ...]], description: str = '', *placeholders):
         def decorator(handler):
             commands = (command,) if isinstance(command, str) else command
-            self.available_commands.append(
-                CommandUnit(commands[0], commands[1:], description, self.is_admin, placeholders if placeholders else None))
+            unit = CommandUnit(commands[0], commands[1:], description, self.is_admin, placeholders if placeholders else None)
+            self.available_commands.append(unit)
+            for name in commands:
+                known = self.commands_index.get(name.lower())
+                if known is None or not known.is_admin:  # Админская команда с тем же именем важнее
+                    self.commands_index[name.lower()] = unit
 
             @self.message(Command(*commands, ignore_case=True))
             async def wrapper(message: Message, **kwargs):
@@ -34,6 +39,14 @@ class BaseRouter(Router):
 
         return decorator
 
+    @classmethod
+    def find_command(cls, text: Optional[str]) -> Optional[CommandUnit]:
+        """Команда, которой начинается сообщение (как её разбирает фильтр Command: /name@bot args)"""
+        if not text or not text.startswith('/'):
+            return None
+        name = text.split(maxsplit=1)[0][1:].split('@', 1)[0]
+        return cls.commands_index.get(name.lower())
+
 
 class AdminRouter(BaseRouter):
     is_admin = True
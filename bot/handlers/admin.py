@@ -1,11 +1,13 @@
 import logging
+from dataclasses import asdict
 from aiogram.types import Message
 
-from DB.tables.masters import MastersTable
+from DB import aio
+from DB.tables.base import DB_PATH
+from DB.tables.pool import get_pool
 from phrases import PHRASES_RU
-from DB.tables.queries import QueriesTable
-from DB.tables.users import UsersTable
 from utils import format_list
+from utils.metrics import metrics
 from bot import pages
 from bot.bot_utils import command_arguments
 from bot.bot_utils.routers import AdminRouter, BaseRouter
@@ -38,60 +40,55 @@ async def _(message: Message, user_id):
     if message.from_user.id == int(user_id):
         await message.answer(PHRASES_RU.error.ban_yourself)
         return
-    with UsersTable() as user_db:
-        if user_db.set_ban_status(user_id, message.from_user.id, True):
-            await message.answer(PHRASES_RU.replace('success.banned', user_id=user_id))
-        else:
-            await message.answer(PHRASES_RU.error.db)
+    if await aio.users.set_ban_status(user_id, message.from_user.id, True):
+        await message.answer(PHRASES_RU.replace('success.banned', user_id=user_id))
+    else:
+        await message.answer(PHRASES_RU.error.db)
 
 
 @router.command('unban', 'разблокировать пользователя по ID', 'user_id')  # /unban
 @command_arguments.user_id
 async def _(message: Message, user_id):
-    with UsersTable() as user_db:
-        if user_db.set_ban_status(user_id, message.from_user.id, False):
-            await message.answer(PHRASES_RU.replace('success.unbanned', user_id=user_id))
-        else:
-            await message.answer(PHRASES_RU.error.db)
+    if await aio.users.set_ban_status(user_id, message.from_user.id, False):
+        await message.answer(PHRASES_RU.replace('success.unbanned', user_id=user_id))
+    else:
+        await message.answer(PHRASES_RU.error.db)
 
 
 @router.command('promote', 'повысить уровень доступа', 'user_id')  # /promote
 @command_arguments.user_id
 async def _(message: Message, user_id):
-    with UsersTable() as users_db:
-        if users_db.set_admin(user_id, message.from_user.id, True):
-            await message.answer(PHRASES_RU.replace('success.promoted_by', user_id=user_id))
-        else:
-            await message.answer(PHRASES_RU.error.db)
+    if await aio.users.set_admin(user_id, message.from_user.id, True):
+        await message.answer(PHRASES_RU.replace('success.promoted_by', user_id=user_id))
+    else:
+        await message.answer(PHRASES_RU.error.db)
 
 
 @router.command('demote', 'понизить уровень доступа', 'user_id')  # /demote
 @command_arguments.user_id
 async def _(message: Message, user_id):
-    with UsersTable() as users_db:
-        if users_db.set_admin(user_id, message.from_user.id, False):
-            await message.answer(PHRASES_RU.replace('success.demoted', user_id=user_id))
-        else:
-            await message.answer(PHRASES_RU.error.db)
+    if await aio.users.set_admin(user_id, message.from_user.id, False):
+        await message.answer(PHRASES_RU.replace('success.demoted', user_id=user_id))
+    else:
+        await message.answer(PHRASES_RU.error.db)
 
 
 @router.command(('query', 'q'), 'последние N запросов', 'N')  # /query
 @command_arguments.digit(default=5)
 async def _(message: Message, amount: int):
-    with QueriesTable() as queries_db:
-        queries = queries_db.get_last_queries(int(amount))
-        if not queries:
-            await message.answer(PHRASES_RU.info.no_query)
-            return
+    queries = await aio.queries.get_last_queries(int(amount))
+    if not queries:
+        await message.answer(PHRASES_RU.info.no_query)
+        return
 
-        txt = format_list.format_queries_text(
-            queries=queries,
-            footnote_template=PHRASES_RU.footnote.all_queries,
-            line_template=PHRASES_RU.template.all_queries
-        )
+    txt = format_list.format_queries_text(
+        queries=queries,
+        footnote_template=PHRASES_RU.footnote.all_queries,
+        line_template=PHRASES_RU.template.all_queries
+    )
 
-        if txt:
-            await message.answer(txt.replace('\t', '\n'), disable_web_page_preview=True)
+    if txt:
+        await message.answer(txt.replace('\t', '\n'), disable_web_page_preview=True)
 
 
 @router.command('clear_temp', 'очистка временных файлов')  # /clear_temp
@@ -112,21 +109,27 @@ async def _(message: Message, user_id: int):
 @router.command('master', 'назначить мастером', 'user_id')  # /master
 @command_arguments.user_id
 async def _(message: Message, user_id):
-    with MastersTable() as masters_db:
-        if masters_db.set_master_status(user_id):
-            await message.answer(PHRASES_RU.replace('success.set_master', user_id=user_id))
-        else:
-            await message.answer(PHRASES_RU.error.db)
+    if await aio.masters.set_master_status(user_id):
+        await message.answer(PHRASES_RU.replace('success.set_master', user_id=user_id))
+    else:
+        await message.answer(PHRASES_RU.error.db)
 
 
 @router.command('del_master', 'удалить мастера', 'user_id')  # /del_master
 @command_arguments.user_id
 async def _(message: Message, user_id):
-    with MastersTable() as masters_db:
-        if masters_db.set_master_status(user_id, False):
-            await message.answer(PHRASES_RU.replace('success.del_master', user_id=user_id))
-        else:
-            await message.answer(PHRASES_RU.error.db)
+    if await aio.masters.set_master_status(user_id, False):
+        await message.answer(PHRASES_RU.replace('success.del_master', user_id=user_id))
+    else:
+        await message.answer(PHRASES_RU.error.db)
+
+
+@router.command('metrics', 'метрики работы бота')  # /metrics
+async def _(message: Message):
+    values = metrics.snapshot()
+    values.update({f'db_pool_{k}': v for k, v in asdict(get_pool(DB_PATH).stats()).items()})
+    await message.answer(PHRASES_RU.title.metrics + ''.join(
+        PHRASES_RU.replace('template.metric', name=name, value=value) for name, value in values.items()))
 
 
 @router.command('test', 'отладка и тестирование функций')  # /test
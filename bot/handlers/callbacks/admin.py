@@ -13,13 +13,14 @@ async def cut_message_distributor(callback: CallbackQuery, callback_data: AdminP
     type_of_event = callback_data.type_of_event
     page = callback_data.page
     user_id = callback_data.user_id
+    seek = {'anchor': callback_data.anchor, 'step': callback_data.step, 'total': callback_data.total}
     match type_of_event:
         case PageListSection.USERS:
-            await pages.get_users(callback.from_user.id, page, callback.message.message_id)
+            await pages.get_users(callback.from_user.id, page, callback.message.message_id, **seek)
         case PageListSection.QUERY:
-            await pages.user_query(callback.from_user.id, user_id, page, callback.message.message_id)
+            await pages.user_query(callback.from_user.id, user_id, page, callback.message.message_id, **seek)
         case PageListSection.ACTION_HISTORY:
-            await pages.get_history(callback.from_user.id, page, callback.message.message_id)
+            await pages.get_history(callback.from_user.id, page, callback.message.message_id, **seek)
         case PageListSection.CLIENTS:
             await pages.get_clients(callback.from_user.id, callback.message.id, page)
         case PageListSection.NO_ACTION:
@@ -1,9 +1,7 @@
 from aiogram import Router
 from aiogram.types import CallbackQuery
 
-from DB.tables.appointments import AppointmentsTable
-from DB.tables.masters import MastersTable
-from DB.tables.slots import SlotsTable
+from DB import aio
 from bot.bot_utils import msg_sender
 from bot.bot_utils.msg_sender import get_media_from_photos
 from bot.pages import get_active_bookings, get_master_apps, get_day_range
@@ -24,12 +22,11 @@ async def booking_page_distributor(callback: CallbackQuery, callback_data: Booki
     action = callback_data.action
     mode = callback_data.mode
     if callback_data.mode == AppListMode.MASTER:
-        with MastersTable() as master_db:
-            master = master_db.get_master(callback.from_user.id)
-            if not master or not master.is_master:
-                await callback.answer(PHRASES_RU.error.no_rights)
-                await callback.message.delete()
-                return
+        master = await aio.masters.get_master(callback.from_user.id)
+        if not master or not master.is_master:
+            await callback.answer(PHRASES_RU.error.no_rights)
+            await callback.message.delete()
+            return
     await callback.answer()
     if page is None:  # пустой коллбэк
         return
@@ -44,40 +41,39 @@ async def booking_page_distributor(callback: CallbackQuery, callback_data: Booki
                         callback_data.app_date))
                 return
             case (const.AppointmentPageAction.BACK, AppListMode.USER):
-                with AppointmentsTable() as app_db:
-                    app, pagination = app_db.get_client_appointments(callback.from_user.id, page)
-                    await callback.message.edit_reply_markup(
-                        reply_markup=ikb.booking_page_keyboard(
-                            app,
-                            pagination,
-                            mode))
+                app, pagination = await aio.appointments.get_client_appointments(callback.from_user.id, page)
+                await callback.message.edit_reply_markup(
+                    reply_markup=ikb.booking_page_keyboard(
+                        app,
+                        pagination,
+                        mode))
                 return
             case (const.AppointmentPageAction.BACK, AppListMode.MASTER):
-                with AppointmentsTable() as app_db:
-                    start_of_day, end_of_day = get_day_range(callback_data.app_date)
-                    apps, pagination = app_db.get_appointments_by_status_and_time_range(const.CONFIRMED,
-                                                                                        start_of_day,
-                                                                                        end_of_day,
-                                                                                        page)
-                    await callback.message.edit_reply_markup(
-                        reply_markup=ikb.booking_page_keyboard(
-                            apps[0],
-                            pagination,
-                            mode))
+                start_of_day, end_of_day = get_day_range(callback_data.app_date)
+                apps, pagination = await aio.appointments.get_appointments_by_status_and_time_range(const.CONFIRMED,
+                                                                                                    start_of_day,
+                                                                                                    end_of_day,
+                                                                                                    page)
+                await callback.message.edit_reply_markup(
+                    reply_markup=ikb.booking_page_keyboard(
+                        apps[0],
+                        pagination,
+                        mode))
                 return
             case (const.AppointmentPageAction.BACK_TO_MAP, AppListMode.MASTER):
                 app_date = callback_data.app_date
-                text, reply_markup = ikb.create_calendar_keyboard(app_date.month,
-                                                                  app_date.year,
-                                                                  True,
-                                                                  const.CalendarMode.APPOINTMENT_MAP)
+                text, reply_markup = await ikb.create_calendar_keyboard(app_date.month,
+                                                                        app_date.year,
+                                                                        True,
+                                                                        const.CalendarMode.APPOINTMENT_MAP)
                 await callback.message.edit_text(text=text, reply_markup=reply_markup)
                 return
+    seek = {'anchor': callback_data.anchor, 'step': callback_data.step, 'total': callback_data.total}
     match mode:
         case AppListMode.USER:
-            await get_active_bookings(callback.from_user.id, page, callback.message.message_id)
+            await get_active_bookings(callback.from_user.id, page, callback.message.message_id, **seek)
         case AppListMode.MASTER:
-            await get_master_apps(callback, callback_data.app_date, page)
+            await get_master_apps(callback, callback_data.app_date, page, **seek)
 
 
 @router.callback_query(BookingStatusCallBack.filter())
@@ -87,38 +83,36 @@ async def booking_status_distributor(callback: CallbackQuery, callback_data: Boo
     if status is None or appointment_id is None:  # пустой коллбэк
         await callback.answer()
         return
-    with AppointmentsTable() as app_db, SlotsTable() as slots_db:
-        app = app_db.get_appointment_by_id(appointment_id)
+    app = await aio.appointments.get_appointment_by_id(appointment_id)
 
-        if status == const.CANCELLED:
-            if app.status == const.REJECTED:
-                await callback.message.edit_text(PHRASES_RU.answer.status.already_rejected)
+    if status == const.CANCELLED:
+        if app.status == const.REJECTED:
+            await callback.message.edit_text(PHRASES_RU.answer.status.already_rejected)
 
-            elif app.status in {const.PENDING, const.CONFIRMED}:
-                if app.status == const.CONFIRMED:
-                    app.status = status
-                    await msg_sender.notify_master(app)
-                    scheduler.cancel_scheduled_reminders(appointment_id)
-                app_db.update_appointment_status(appointment_id, status)
-                slots_db.set_slot_availability(app.slot.id, True)
-                await callback.message.edit_text(PHRASES_RU.answer.status.cancelled)
-        elif status == const.REJECTED:
-            with MastersTable() as master_db:
-                master = master_db.get_master(callback.from_user.id)
-                if not master or not master.is_master:
-                    await callback.answer(PHRASES_RU.error.no_rights)
-                    await callback.message.delete()
-                    return
-            if app.status == const.CANCELLED:
-                await callback.message.edit_text(PHRASES_RU.answer.status.already_cancelled)
-
-            elif app.status in {const.CONFIRMED}:
-                app.status = CANCELLED
-                await msg_sender.notify_client(app)
+        elif app.status in {const.PENDING, const.CONFIRMED}:
+            if app.status == const.CONFIRMED:
+                app.status = status
+                await msg_sender.notify_master(app)
                 scheduler.cancel_scheduled_reminders(appointment_id)
-                app_db.update_appointment_status(appointment_id, status)
-                slots_db.set_slot_availability(app.slot.id, True)
-                await callback.message.edit_text(PHRASES_RU.answer.status.cancelled_by_master)
+            await aio.appointments.update_appointment_status(appointment_id, status)
+            await aio.slots.set_slot_availability(app.slot.id, True)
+            await callback.message.edit_text(PHRASES_RU.answer.status.cancelled)
+    elif status == const.REJECTED:
+        master = await aio.masters.get_master(callback.from_user.id)
+        if not master or not master.is_master:
+            await callback.answer(PHRASES_RU.error.no_rights)
+            await callback.message.delete()
+            return
+        if app.status == const.CANCELLED:
+            await callback.message.edit_text(PHRASES_RU.answer.status.already_cancelled)
+
+        elif app.status in {const.CONFIRMED}:
+            app.status = CANCELLED
+            await msg_sender.notify_client(app)
+            scheduler.cancel_scheduled_reminders(appointment_id)
+            await aio.appointments.update_appointment_status(appointment_id, status)
+            await aio.slots.set_slot_availability(app.slot.id, True)
+            await callback.message.edit_text(PHRASES_RU.answer.status.cancelled_by_master)
     await callback.answer()
 
 
@@ -128,11 +122,10 @@ async def booking_photos_distributor(callback: CallbackQuery, callback_data: Pho
     appointment_id = callback_data.app_id
     if appointment_id is None:  # пустой коллбэк
         return
-    with AppointmentsTable() as app_db:
-        appointment = app_db.get_appointment_by_id(appointment_id)
-        if appointment and appointment.photos and len(appointment.photos) > 0:
-            await bot.send_media_group(chat_id=callback.from_user.id,
-                                       media=get_media_from_photos(appointment.photos),
-                                       reply_to_message_id=callback.message.message_id)
-        else:
-            await callback.message.reply(text=PHRASES_RU.error.no_photos)
+    appointment = await aio.appointments.get_appointment_by_id(appointment_id)
+    if appointment and appointment.photos and len(appointment.photos) > 0:
+        await bot.send_media_group(chat_id=callback.from_user.id,
+                                   media=get_media_from_photos(appointment.photos),
+                                   reply_to_message_id=callback.message.message_id)
+    else:
+        await callback.message.reply(text=PHRASES_RU.error.no_photos)
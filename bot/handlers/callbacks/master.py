@@ -1,3 +1,4 @@
+from dataclasses import replace
 from datetime import datetime, date
 
 from aiogram import Router, F
@@ -5,10 +6,7 @@ from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
 
-from DB.tables.appointments import AppointmentsTable
-from DB.tables.masters import MastersTable
-from DB.tables.services import ServicesTable
-from DB.tables.slots import SlotsTable
+from DB import aio
 from bot import pages, scheduler
 from bot.bot_utils import msg_sender
 from bot.bot_utils.filters import NotBookingCalendar, MasterFilter
@@ -38,7 +36,7 @@ async def handle_slot_choosing(callback: CallbackQuery, callback_data: MonthCall
 
         prev_enabled = not (month == datetime.now().month and year == datetime.now().year) \
             if mode != CalendarMode.APPOINTMENT_MAP else True
-        text, reply_markup = ikb.create_calendar_keyboard(month, year, prev_enabled, mode)
+        text, reply_markup = await ikb.create_calendar_keyboard(month, year, prev_enabled, mode)
         await callback.message.edit_text(text=text, reply_markup=reply_markup)
         return
     mode = callback_data.mode
@@ -54,7 +52,7 @@ async def handle_slot_choosing(callback: CallbackQuery, callback_data: MonthCall
         case CalendarMode.DELETE:
             await callback.message.edit_text(text=PHRASES_RU.replace('answer.master.choose_slot_to_delete',
                                                                      date=selected_date.strftime('%d.%m.%Y')),
-                                             reply_markup=inline_mkb.delete_slots_menu(selected_date))
+                                             reply_markup=await inline_mkb.delete_slots_menu(selected_date))
         case CalendarMode.APPOINTMENT_MAP:
             await pages.get_master_apps(callback, selected_date, 1)
 
@@ -66,22 +64,20 @@ async def handle_slot_deletion(callback: CallbackQuery, callback_data: DeleteSlo
     match action:
         case const.Action.slot_calendar:  # BACK
             prev_enabled = not (slot_date.month == datetime.now().month and slot_date.year == datetime.now().year)
-            text, reply_markup = ikb.create_calendar_keyboard(slot_date.month, slot_date.year, prev_enabled, CalendarMode.DELETE)
+            text, reply_markup = await ikb.create_calendar_keyboard(slot_date.month, slot_date.year, prev_enabled, CalendarMode.DELETE)
             await callback.message.edit_text(text=text, reply_markup=reply_markup)
         case const.Action.check_slot_to_delete:
             slot_id = callback_data.slot_id
-            with SlotsTable() as db:
-                slot = db.get_slot(slot_id)
-                await callback.message.edit_text(text=PHRASES_RU.replace('answer.master.slot_info',
-                                                                         date=slot.start_time.date().strftime('%d.%m.%Y'),
-                                                                         slot_str=str(slot)),
-                                                 reply_markup=inline_mkb.slot_deletion(slot))
+            slot = await aio.slots.get_slot(slot_id)
+            await callback.message.edit_text(text=PHRASES_RU.replace('answer.master.slot_info',
+                                                                     date=slot.start_time.date().strftime('%d.%m.%Y'),
+                                                                     slot_str=str(slot)),
+                                             reply_markup=inline_mkb.slot_deletion(slot))
         case const.Action.delete_slot:
             slot_id = callback_data.slot_id
-            with SlotsTable() as db:
-                success, message = db.delete_slot(slot_id)
-                await callback.answer(message)
-            reply_markup = inline_mkb.delete_slots_menu(slot_date)
+            success, message = await aio.slots.delete_slot(slot_id)
+            await callback.answer(message)
+            reply_markup = await inline_mkb.delete_slots_menu(slot_date)
             if len(reply_markup.inline_keyboard) > 1:  # проверка, что после удаления остались ещё свободные слоты на этот день
                 await callback.message.edit_text(text=PHRASES_RU.replace('answer.master.choose_slot_to_delete',
                                                                          date=slot_date.strftime('%d.%m.%Y')),
@@ -91,7 +87,7 @@ async def handle_slot_deletion(callback: CallbackQuery, callback_data: DeleteSlo
                 is_current_month = (slot_date.month == current_date.month and
                                     slot_date.year == current_date.year)
                 prev_enabled = not is_current_month
-                text, reply_markup = ikb.create_calendar_keyboard(slot_date.month, slot_date.year, prev_enabled, CalendarMode.DELETE)
+                text, reply_markup = await ikb.create_calendar_keyboard(slot_date.month, slot_date.year, prev_enabled, CalendarMode.DELETE)
                 await callback.message.edit_text(text=text, reply_markup=reply_markup)
 
 
@@ -99,42 +95,41 @@ async def handle_slot_deletion(callback: CallbackQuery, callback_data: DeleteSlo
 async def handle_navigation_actions(callback: CallbackQuery, callback_data: MasterButtonCallBack):
     status_to_set = callback_data.status
 
-    with AppointmentsTable() as app_db, MastersTable() as master_db:
-        if status_to_set not in app_db.valid_statuses:
-            return
-        app = app_db.get_appointment_by_id(callback_data.appointment_id)
-        if not app:
-            await callback.answer(PHRASES_RU.error.app_not_found)
-            return
-
-        match (app.status, status_to_set):
-            case (const.CANCELLED, _):
-                await callback.answer(PHRASES_RU.answer.status.already_cancelled)
-            case (_, const.REJECTED):
-                with SlotsTable() as slots_db:
-                    slots_db.set_slot_availability(app.slot.id, True)
-                app_db.update_appointment_status(app.appointment_id, const.REJECTED)
-                await callback.answer(PHRASES_RU.answer.status.rejected)
-                app.status = const.REJECTED
-                await msg_sender.notify_client(app)
-            case (_, const.CONFIRMED):
-                app_db.update_appointment_status(app.appointment_id, const.CONFIRMED)
-                await callback.answer(PHRASES_RU.answer.status.confirmed)
-                app.status = const.CONFIRMED
-                await msg_sender.notify_client(app)
-                scheduler.schedule_reminders(app.appointment_id, app.slot.start_time)
-
-        await callback.message.delete()
-
-        if callback_data.msg_to_delete:
-            msgs = list(map(int, callback_data.msg_to_delete.split(',')))
-            msgs_list = [i for i in range(msgs[0], msgs[-1] + 1)]
-            await bot.delete_messages(chat_id=callback.from_user.id, message_ids=msgs_list)
-
-        master_db.update_current_state(callback.from_user.id)
-
-        if next_app := app_db.get_nth_pending_appointment(0):
-            await pages.update_master_booking_ui(next_app)
+    is_valid, app = await aio.appointments.run(
+        lambda db: (status_to_set in db.valid_statuses, db.get_appointment_by_id(callback_data.appointment_id)))
+    if not is_valid:
+        return
+    if not app:
+        await callback.answer(PHRASES_RU.error.app_not_found)
+        return
+
+    match (app.status, status_to_set):
+        case (const.CANCELLED, _):
+            await callback.answer(PHRASES_RU.answer.status.already_cancelled)
+        case (_, const.REJECTED):
+            await aio.slots.set_slot_availability(app.slot.id, True)
+            await aio.appointments.update_appointment_status(app.appointment_id, const.REJECTED)
+            await callback.answer(PHRASES_RU.answer.status.rejected)
+            app.status = const.REJECTED
+            await msg_sender.notify_client(app)
+        case (_, const.CONFIRMED):
+            await aio.appointments.update_appointment_status(app.appointment_id, const.CONFIRMED)
+            await callback.answer(PHRASES_RU.answer.status.confirmed)
+            app.status = const.CONFIRMED
+            await msg_sender.notify_client(app)
+            scheduler.schedule_reminders(app.appointment_id, app.slot.start_time)
+
+    await callback.message.delete()
+
+    if callback_data.msg_to_delete:
+        msgs = list(map(int, callback_data.msg_to_delete.split(',')))
+        msgs_list = [i for i in range(msgs[0], msgs[-1] + 1)]
+        await bot.delete_messages(chat_id=callback.from_user.id, message_ids=msgs_list)
+
+    await aio.masters.update_current_state(callback.from_user.id)
+
+    if next_app := await aio.appointments.get_nth_pending_appointment(0):
+        await pages.update_master_booking_ui(next_app)
 
 
 @router.callback_query(AddSlotsMonthCallBack.filter(), MasterFilter())
@@ -143,7 +138,7 @@ async def handle_month_generation(callback: CallbackQuery, callback_data: AddSlo
     month = callback_data.month
     year = callback_data.year
 
-    slots = format_list.generate_slots_for_month(month, year)
+    slots = format_list.generate_slots_for_month(month, year, await aio.schedule.get_template())
     slots_text = format_string.slots_to_text(slots)
     match action:
         case 'check':
@@ -151,7 +146,7 @@ async def handle_month_generation(callback: CallbackQuery, callback_data: AddSlo
             await callback.message.edit_text(text=text,
                                              reply_markup=inline_mkb.master_confirm_adding_slot(month, year))
         case 'add':
-            text = db_manager.add_slots_from_list([(sl.start_time, sl.end_time) for sl in slots])
+            text = await aio.run_in_db(db_manager.add_slots_from_list, [(sl.start_time, sl.end_time) for sl in slots])
             text_chunks = format_string.split_text(text, 4096)
             for i in range(len(text_chunks)):
                 if i == 0:
@@ -165,22 +160,21 @@ async def handle_service_edit(callback: CallbackQuery, callback_data: MasterServ
     await state.clear()
     service_id = callback_data.service_id
     action = callback_data.action
-    with ServicesTable() as db:
-        service = db.get_service(service_id)
-        service_text = format_string.service_text(service)
-        text = '<i>Нажмите на соответствующую кнопку для изменения текущей услуги</i>\n\n'
-        if action:
-            match action:
-                case const.Action.set_active:
-                    db.toggle_service_active(service_id, True)
-                    service.is_active = True
-                case const.Action.set_inactive:
-                    db.toggle_service_active(service_id, False)
-                    service.is_active = False
-                case const.Action.service_update:
-                    text = '✅ Услуга обновлена и уже активна!\n\n' + text
-
-        await callback.message.edit_text(text=text + service_text, reply_markup=inline_mkb.edit_current_service(service))
+    service = await aio.services.get_service(service_id)
+    service_text = format_string.service_text(service)
+    text = '<i>Нажмите на соответствующую кнопку для изменения текущей услуги</i>\n\n'
+    if action:
+        match action:
+            case const.Action.set_active:
+                await aio.services.toggle_service_active(service_id, True)
+                service = replace(service, is_active=True)  # Модель из каталога услуг общая
+            case const.Action.set_inactive:
+                await aio.services.toggle_service_active(service_id, False)
+                service = replace(service, is_active=False)
+            case const.Action.service_update:
+                text = '✅ Услуга обновлена и уже активна!\n\n' + text
+
+    await callback.message.edit_text(text=text + service_text, reply_markup=inline_mkb.edit_current_service(service))
 
 
 @router.callback_query(EditServiceCallBack.filter(), MasterFilter())
@@ -200,7 +194,7 @@ async def _(callback: CallbackQuery, state: FSMContext):
     if not slots:
         await callback.message.edit_text(PHRASES_RU.error.slots_not_flound)
         return
-    result_text = db_manager.add_slots_from_list(slots)
+    result_text = await aio.run_in_db(db_manager.add_slots_from_list, slots)
     text_chunks = format_string.split_text(result_text, 4096)
     await state.clear()
     for i in range(len(text_chunks)):
@@ -226,8 +220,7 @@ async def _(callback: CallbackQuery, state: FSMContext):
     if not service:
         await callback.message.edit_text(PHRASES_RU.error.booking.try_again)
         return
-    with ServicesTable() as db:
-        db.update_service(service)
+    await aio.services.update_service(service)
 
     await handle_service_edit(callback, MasterServiceCallBack(service_id=service.id, action=const.Action.service_update), state)
 
@@ -248,8 +241,7 @@ async def _(callback: CallbackQuery, state: FSMContext):
     if not service:
         await callback.message.edit_text(PHRASES_RU.error.booking.try_again)
         return
-    with ServicesTable() as db:
-        db.add_service(service)
+    await aio.services.add_service(service)
     response = f"✅ Услуга добавлена\n\n"
     response += f"▪ Название: <i>{service.name}</i>\n"  # TODO
     if service.description:
@@ -283,7 +275,7 @@ async def _(callback: CallbackQuery):
 @router.callback_query(F.data == PHRASES_RU.callback_data.master.appointment_map, MasterFilter())
 async def _(callback: CallbackQuery):
     now = datetime.now()
-    text, reply_markup = ikb.create_calendar_keyboard(now.month, now.year, True, CalendarMode.APPOINTMENT_MAP)
+    text, reply_markup = await ikb.create_calendar_keyboard(now.month, now.year, True, CalendarMode.APPOINTMENT_MAP)
     await callback.message.edit_text(text=text, reply_markup=reply_markup)
 
 
@@ -302,7 +294,7 @@ async def add_menu(callback: CallbackQuery):
 
 @router.callback_query(F.data == PHRASES_RU.callback_data.master.delete_slots, MasterFilter())
 async def delete_slots_calendar_handler(callback: CallbackQuery):
-    text, reply_markup = ikb.first_page_calendar(CalendarMode.DELETE)
+    text, reply_markup = await ikb.first_page_calendar(CalendarMode.DELETE)
     if text and reply_markup:
         await callback.message.edit_text(text=text, reply_markup=reply_markup)
     else:
@@ -338,7 +330,7 @@ async def _(callback: CallbackQuery, state: FSMContext):
 @router.callback_query(F.data == PHRASES_RU.callback_data.master.edit_service, MasterFilter())
 async def edit_service_menu(callback: CallbackQuery):
     await callback.message.edit_text(text=PHRASES_RU.answer.master.edit_service,
-                                     reply_markup=inline_mkb.master_service_editor())
+                                     reply_markup=await inline_mkb.master_service_editor())
 
 
 @router.callback_query(F.data == PHRASES_RU.callback_data.master.history, MasterFilter())
@@ -8,11 +8,9 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
 
 from DB.models import PhotoModel, UserModel, AppointmentModel, SlotModel, ServiceModel
+from DB import aio
 from DB.tables.appointment_photos import AppointmentPhotosTable
-from DB.tables.appointments import AppointmentsTable
 from DB.tables.photos import PhotosTable
-from DB.tables.services import ServicesTable
-from DB.tables.slots import SlotsTable
 from bot.bot_utils.filters import IsCancelActionFilter
 from bot.bot_utils.models import MonthCallBack, ServiceCallBack, ActionButtonCallBack, SlotCallBack
 
@@ -44,15 +42,14 @@ async def handle_month_selection(callback: CallbackQuery, callback_data: MonthCa
 
 @router.callback_query(SlotCallBack.filter(), StateFilter(AppointmentStates.WAITING_FOR_SLOT))
 async def handle_slot_selection(callback: CallbackQuery, callback_data: SlotCallBack, state: FSMContext):
-    with SlotsTable() as slots_db:
-        slot = slots_db.get_slot(callback_data.slot_id)
-        await AppointmentNavigation.update_appointment_data(
-            state,
-            slot=SlotModel(id=callback_data.slot_id,
-                           start_time=slot.start_time,
-                           end_time=slot.end_time,
-                           is_available=False)
-        )
+    slot = await aio.slots.get_slot(callback_data.slot_id)
+    await AppointmentNavigation.update_appointment_data(
+        state,
+        slot=SlotModel(id=callback_data.slot_id,
+                       start_time=slot.start_time,
+                       end_time=slot.end_time,
+                       is_available=False)
+    )
 
     await AppointmentNavigation.handle_navigation(
         callback=callback,
@@ -64,14 +61,18 @@ async def handle_slot_selection(callback: CallbackQuery, callback_data: SlotCall
 
 @router.callback_query(ServiceCallBack.filter(), StateFilter(AppointmentStates.WAITING_FOR_SERVICE))
 async def handle_service_selection(callback: CallbackQuery, callback_data: ServiceCallBack, state: FSMContext):
-    with ServicesTable() as service_db:
-        await AppointmentNavigation.update_appointment_data(
-            state,
-            service=ServiceModel(
-                id=callback_data.service_id,
-                name=service_db.get_service(callback_data.service_id).name
-            )
+    service = await aio.services.get_service(callback_data.service_id)
+    if service is None or not service.is_active:  # Клавиатура устарела: услугу убрали после её показа
+        await callback.answer(PHRASES_RU.error.booking.try_again)
+        return
+    await AppointmentNavigation.update_appointment_data(
+        state,
+        service=ServiceModel(
+            id=callback_data.service_id,
+            name=service.name
         )
+    )
+    await state.update_data(services_version=aio.services_catalog.version)
 
     await AppointmentNavigation.handle_navigation(
         callback=callback,
@@ -96,6 +97,9 @@ async def handle_appointment_confirmation(callback: CallbackQuery, callback_data
         return
 
     data = await AppointmentNavigation.get_appointment_data(state)
+    if not await _service_still_available(state, data):
+        await clear_and_respond(callback, state, PHRASES_RU.error.booking.try_again)
+        return
 
     try:
         app_id = await process_appointment_creation(callback.from_user.id, data)
@@ -142,31 +146,41 @@ async def clear_and_respond(callback: CallbackQuery, state: FSMContext, message:
     await callback.message.edit_text(text=message, reply_markup=None)
 
 
+async def _service_still_available(state: FSMContext, data: AppointmentModel) -> bool:
+    """Проверяет выбранную услугу, только если каталог услуг изменился после выбора"""
+    if not data.service or (await state.get_data()).get('services_version') == aio.services_catalog.version:
+        return True
+    service = await aio.services.get_service(data.service.id)
+    return service is not None and service.is_active
+
+
 async def process_appointment_creation(user_id: int, data: AppointmentModel) -> Optional[int]:
     """Создает запись и возвращает статус успешности"""
     if not data.is_ready_for_confirmation():
         return None
 
-    with SlotsTable() as slots_db, AppointmentsTable() as app_db:
-        if not slots_db.set_slot_availability(data.slot.id, False):
-            return None
+    if not await aio.slots.set_slot_availability(data.slot.id, False):
+        return None
 
-        app_id = app_db.create_appointment(
-            client_id=user_id,
-            slot_id=data.slot.id,
-            service_id=data.service.id,
-            comment=data.comment
-        )
+    app_id = await aio.appointments.create_appointment(
+        client_id=user_id,
+        slot_id=data.slot.id,
+        service_id=data.service.id,
+        comment=data.comment
+    )
 
-        await _process_appointment_photos(app_id, data.photos)
-        return app_id
+    await _process_appointment_photos(app_id, data.photos)
+    return app_id
 
 
 async def _process_appointment_photos(app_id: int, photos: list[PhotoModel]):
     """Обрабатывает прикрепленные фото"""
     if not photos:
         return
+    await aio.run_in_db(_save_appointment_photos, app_id, photos)
+
 
+def _save_appointment_photos(app_id: int, photos: list[PhotoModel]):
     with PhotosTable() as photo_db, AppointmentPhotosTable() as app_photo_db:
         for photo in photos:
             photo_id = photo_db.add_photo(
@@ -4,7 +4,7 @@ from aiogram.types import Message
 from aiogram import Router, F
 
 from DB.models import PhotoModel
-from DB.tables.users import UsersTable
+from DB import aio
 from bot import pages
 from bot.keyboards import get_keyboard
 from bot.keyboards.default import inline as ikb
@@ -21,18 +21,17 @@ router = Router()
 
 @router.message(F.text == config.tg_bot.password)
 async def _(message: Message):
-    with UsersTable() as users_db:
-        if users_db.set_admin(message.from_user.id, message.from_user.id):
-            await message.delete()
-            await message.answer(PHRASES_RU.success.promoted, reply_markup=get_keyboard(message.from_user.id))
-            await command_getcmds(message)
-        else:
-            await message.answer(PHRASES_RU.error.db, reply_markup=get_keyboard(message.from_user.id))
+    if await aio.users.set_admin(message.from_user.id, message.from_user.id):
+        await message.delete()
+        await message.answer(PHRASES_RU.success.promoted, reply_markup=await get_keyboard(message.from_user.id))
+        await command_getcmds(message)
+    else:
+        await message.answer(PHRASES_RU.error.db, reply_markup=await get_keyboard(message.from_user.id))
 
 
 @router.message(F.text == PHRASES_RU.button.booking)
 async def booking_message(message: Message, state: FSMContext):
-    text, reply_markup = ikb.first_page_calendar()
+    text, reply_markup = await ikb.first_page_calendar()
     if text and reply_markup:
         await message.answer(text=text, reply_markup=reply_markup)
         await state.set_state(AppointmentStates.WAITING_FOR_DATE)
@@ -95,4 +94,4 @@ async def _(message: Message, state: FSMContext):
 
 @router.message()
 async def _(message: Message):
-    await message.answer(text=PHRASES_RU.answer.unknown, reply_markup=get_keyboard(message.from_user.id))
+    await message.answer(text=PHRASES_RU.answer.unknown, reply_markup=await get_keyboard(message.from_user.id))
@@ -6,8 +6,7 @@ from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
 
-from DB.tables.appointments import AppointmentsTable
-from DB.tables.masters import MastersTable
+from DB import aio
 from bot import pages
 from bot.bot_utils.filters import MasterFilter
 from bot.bot_utils.msg_sender import get_media_from_photos, send_or_edit_message
@@ -20,11 +19,10 @@ from utils import format_string
 
 
 async def send_master_menu(user_id: int, message_id: Optional[int] = None):
-    with AppointmentsTable() as db:
-        text = PHRASES_RU.replace('answer.master.menu',
-                                  clients=db.count_clients(),
-                                  appointments=db.count_completed_slots())
-        await send_or_edit_message(user_id, text, inline_mkb.menu_master_keyboard(), message_id)
+    clients, appointments = await aio.appointments.run(
+        lambda db: (db.count_clients(), db.count_completed_slots()))
+    text = PHRASES_RU.replace('answer.master.menu', clients=clients, appointments=appointments)
+    await send_or_edit_message(user_id, text, inline_mkb.menu_master_keyboard(), message_id)
 
 router = Router()
 router.message.filter(MasterFilter())
@@ -38,11 +36,13 @@ async def _(message: Message, state: FSMContext):
             if not slots:
                 await message.answer('❌ <b>Ошибка при обработке запроса: время слотов не было найдено</b>')
                 return
+            errors = await aio.slots.check_slots(slots)
             confirmation_text = "🔍 *Проверьте распознанные слоты:*\n\n"
-            for i, (start, end) in enumerate(slots, 1):
+            for i, ((start, end), error) in enumerate(zip(slots, errors), 1):
                 confirmation_text += (
                     f"{i}. *{start.strftime('%d.%m.%Y')}* "
-                    f"{start.strftime('%H:%M')}-{end.strftime('%H:%M')}\n"
+                    f"{start.strftime('%H:%M')}-{end.strftime('%H:%M')}"
+                    f"{f' ⚠️ _{error}_' if error else ''}\n"
                 )
 
             await state.update_data(parsed_slots=slots)
@@ -155,17 +155,16 @@ async def _(message: Message, state: FSMContext):
 
 @router.message(F.text == PHRASES_RU.button.master.clients_today)
 async def _(message: Message):
-    with AppointmentsTable() as app_db:
-        apps = app_db.get_appointments_by_status_and_date(datetime.now())
-        if apps:
-            for app in apps:
-                caption = format_string.master_sent_booking(app, PHRASES_RU.replace('title.booking', date=app.formatted_date))
-                if app.photos:
-                    await message.answer_media_group(media=get_media_from_photos(app.photos, caption=caption))
-                else:
-                    await message.answer(text=caption)
-        else:
-            await message.answer(text=PHRASES_RU.answer.no_apps_today, reply_markup=get_keyboard(message.from_user.id))
+    apps = await aio.appointments.get_appointments_by_status_and_date(datetime.now())
+    if apps:
+        for app in apps:
+            caption = format_string.master_sent_booking(app, PHRASES_RU.replace('title.booking', date=app.formatted_date))
+            if app.photos:
+                await message.answer_media_group(media=get_media_from_photos(app.photos, caption=caption))
+            else:
+                await message.answer(text=caption)
+    else:
+        await message.answer(text=PHRASES_RU.answer.no_apps_today, reply_markup=await get_keyboard(message.from_user.id))
 
 
 @router.message(F.text == PHRASES_RU.button.master.menu)
@@ -175,22 +174,21 @@ async def _(message: Message):
 
 @router.message(F.text == PHRASES_RU.button.master.pending_apps)
 async def _(message: Message):
-    with (MastersTable() as master_db, AppointmentsTable() as app_db):
-        master = master_db.get_master(message.from_user.id)
-        if not master or not master.is_master:
-            await message.answer(PHRASES_RU.error.no_rights, reply_markup=get_keyboard(message.from_user.id))
-            return
-        if master.current_app_id:
-            if master.message_id:
-                await bot.delete_message(chat_id=message.chat.id, message_id=master.message_id)
-            if master.msg_to_delete:
-                msgs = list(map(int, master.msg_to_delete.split(',')))
-                msgs_list = [i for i in range(msgs[0], msgs[-1] + 1)]
-                await bot.delete_messages(chat_id=message.chat.id, message_ids=msgs_list)
-            master_db.update_current_state(message.from_user.id)
-        total_items = app_db.count_appointments(const.PENDING)
-        if total_items == 0:
-            await message.answer(PHRASES_RU.answer.master.no_pending_apps)
-            return
-        if next_app := app_db.get_nth_pending_appointment(0):
-            await pages.update_master_booking_ui(next_app)
+    master = await aio.masters.get_master(message.from_user.id)
+    if not master or not master.is_master:
+        await message.answer(PHRASES_RU.error.no_rights, reply_markup=await get_keyboard(message.from_user.id))
+        return
+    if master.current_app_id:
+        if master.message_id:
+            await bot.delete_message(chat_id=message.chat.id, message_id=master.message_id)
+        if master.msg_to_delete:
+            msgs = list(map(int, master.msg_to_delete.split(',')))
+            msgs_list = [i for i in range(msgs[0], msgs[-1] + 1)]
+            await bot.delete_messages(chat_id=message.chat.id, message_ids=msgs_list)
+        await aio.masters.update_current_state(message.from_user.id)
+    total_items = await aio.appointments.count_appointments(const.PENDING)
+    if total_items == 0:
+        await message.answer(PHRASES_RU.answer.master.no_pending_apps)
+        return
+    if next_app := await aio.appointments.get_nth_pending_appointment(0):
+        await pages.update_master_booking_ui(next_app)
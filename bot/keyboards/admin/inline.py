@@ -19,14 +19,20 @@ def page_keyboard(type_of_event: PageListSection, pagination: Pagination, user_i
         text=PHRASES_RU.button.prev_page,
         callback_data=AdminPageCallBack(type_of_event=type_of_event,
                                         page=pagination.page - 1,
-                                        user_id=user_id).pack()
+                                        user_id=user_id,
+                                        anchor=pagination.first_key,
+                                        step=-1,
+                                        total=pagination.total_items).pack()
     ) if pagination.has_prev else empty_button
 
     next_button = IButton(
         text=PHRASES_RU.button.next_page,
         callback_data=AdminPageCallBack(type_of_event=type_of_event,
                                         page=pagination.page + 1,
-                                        user_id=user_id).pack()
+                                        user_id=user_id,
+                                        anchor=pagination.last_key,
+                                        step=1,
+                                        total=pagination.total_items).pack()
     ) if pagination.has_next else empty_button
 
     return IMarkup(inline_keyboard=[[
@@ -0,0 +1,106 @@
+import functools
+import inspect
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Set, Tuple
+
+from DB import aio
+from config.const import KEYBOARD_CACHE_SIZE
+from utils.cache import TTLCache
+
+SERVICES = 'services'  # Клавиатура зависит от списка услуг
+MONTH = 'month'  # Клавиатура зависит от текущего месяца
+
+
+def _current_month() -> Tuple[int, int]:
+    now = datetime.now()
+    return now.year, now.month
+
+
+class KeyboardCache:
+    """Готовые клавиатуры по функции и её аргументам.
+
+    Записи помечаются тегами. У тега есть источник версии (номер версии каталога услуг, текущий месяц):
+    когда версия меняется, клавиатуры с тегом сбрасываются при следующем обращении к ним,
+    invalidate(tag) сбрасывает их сразу. Версия кэша, как в CalendarCache, не даёт
+    сохранить клавиатуру, построенную до сброса. Выданные клавиатуры общие - их нельзя изменять.
+    Попадания и промахи считаются в метриках ``keyboards_cache_*``.
+    """
+
+    def __init__(self, sources: Dict[str, Callable[[], Hashable]], maxsize: int = KEYBOARD_CACHE_SIZE):
+        self._data: TTLCache[Hashable, Any] = TTLCache('keyboards', maxsize, ttl=float('inf'))
+        self._tags: Dict[str, Set[Hashable]] = {}
+        self._sources = sources
+        self._seen = {tag: source() for tag, source in sources.items()}  # Версии, при которых построены клавиатуры
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, tags: FrozenSet[str] = frozenset()) -> Tuple[Any, int]:
+        """Клавиатура (None - нет в кэше) и версия, которую нужно передать в set"""
+        for tag in tags:
+            current = self._sources[tag]()
+            if current != self._seen[tag]:
+                self._seen[tag] = current
+                self.invalidate(tag)
+        with self._lock:
+            version = self._version
+        return self._data.get(key), version
+
+    def set(self, key: Hashable, markup: Any, version: int, tags: FrozenSet[str] = frozenset()):
+        """Сохраняет клавиатуру, если с момента get ничего не сбрасывалось"""
+        with self._lock:
+            if version != self._version:
+                return
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            self._data.set(key, markup)
+
+    def invalidate(self, tag: str):
+        with self._lock:
+            self._version += 1
+            for key in self._tags.pop(tag, ()):
+                self._data.pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._version += 1
+            self._tags.clear()
+            self._data.clear()
+
+    def __call__(self, *tags: str) -> Callable:
+        """Декоратор функции (обычной или async), строящей клавиатуру. Аргументы функции должны быть хешируемыми"""
+        tags = frozenset(tags)
+
+        def decorator(func: Callable) -> Callable:
+            name = f'{func.__module__}.{func.__qualname__}'
+
+            def make_key(args: tuple, kwargs: dict) -> Hashable:
+                return name, args, tuple(sorted(kwargs.items()))
+
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    key = make_key(args, kwargs)
+                    markup, version = self.get(key, tags)
+                    if markup is None:
+                        markup = await func(*args, **kwargs)
+                        self.set(key, markup, version, tags)
+                    return markup
+
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                key = make_key(args, kwargs)
+                markup, version = self.get(key, tags)
+                if markup is None:
+                    markup = func(*args, **kwargs)
+                    self.set(key, markup, version, tags)
+                return markup
+
+            return wrapper
+
+        return decorator
+
+
+keyboard_cache = KeyboardCache({SERVICES: lambda: aio.services_catalog.version, MONTH: _current_month})
@@ -6,11 +6,10 @@ from aiogram.types import InlineKeyboardButton as IButton
 from aiogram.types import InlineKeyboardMarkup as IMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
-from DB.tables.appointments import AppointmentsTable
-from DB.tables.services import ServicesTable
-from DB.tables.slots import SlotsTable
+from DB import aio
 from bot.bot_utils.models import BookingPageCallBack, ActionButtonCallBack, MonthCallBack, ServiceCallBack, SlotCallBack, BookingStatusCallBack, \
     PhotoAppCallBack
+from bot.keyboards.cache import SERVICES, keyboard_cache
 from DB.models import Pagination, AppointmentModel
 from config.const import MONTHS, CANCELLED, REJECTED, CONFIRMED, CalendarMode, AppListMode, AppointmentPageAction
 from phrases import PHRASES_RU
@@ -48,12 +47,14 @@ def booking_page_keyboard(appointment: AppointmentModel, pagination: Pagination,
 
         past_button = IButton(
             text=PHRASES_RU.button.prev_page,
-            callback_data=BookingPageCallBack(page=pagination.page - 1, **page_data).pack()
+            callback_data=BookingPageCallBack(page=pagination.page - 1, anchor=pagination.first_key, step=-1,
+                                              total=pagination.total_items, **page_data).pack()
         ) if pagination.has_prev else empty_button
 
         next_button = IButton(
             text=PHRASES_RU.button.next_page,
-            callback_data=BookingPageCallBack(page=pagination.page + 1, **page_data).pack()
+            callback_data=BookingPageCallBack(page=pagination.page + 1, anchor=pagination.last_key, step=1,
+                                              total=pagination.total_items, **page_data).pack()
         ) if pagination.has_next else empty_button
         keyboard.append([
             past_button,
@@ -133,21 +134,20 @@ def _base_keyboard(
     return IMarkup(inline_keyboard=buttons)
 
 
-def first_page_calendar(mode: CalendarMode = CalendarMode.BOOKING) -> Tuple[Optional[str], Optional[IMarkup]]:
-    with SlotsTable() as slots_db:
-        first_slot = slots_db.get_first_available_slot()
-        if not first_slot:
-            return None, None
+async def first_page_calendar(mode: CalendarMode = CalendarMode.BOOKING) -> Tuple[Optional[str], Optional[IMarkup]]:
+    first_slot = await aio.slots.get_first_available_slot()
+    if not first_slot:
+        return None, None
 
-        current_date = datetime.now()
-        is_current_month = (first_slot.month == current_date.month and
-                            first_slot.year == current_date.year)
-        prev_enabled = not is_current_month
+    current_date = datetime.now()
+    is_current_month = (first_slot.month == current_date.month and
+                        first_slot.year == current_date.year)
+    prev_enabled = not is_current_month
 
-        return create_calendar_keyboard(first_slot.month, first_slot.year, prev_enabled, mode)
+    return await create_calendar_keyboard(first_slot.month, first_slot.year, prev_enabled, mode)
 
 
-def create_calendar_keyboard(month: int, year: int, prev: bool, mode: CalendarMode = CalendarMode.BOOKING) -> Tuple[str, IMarkup]:
+async def create_calendar_keyboard(month: int, year: int, prev: bool, mode: CalendarMode = CalendarMode.BOOKING) -> Tuple[str, IMarkup]:
     now = datetime.now()
     today = now.date()
     month_days = calendar.monthrange(year, month)[1]
@@ -163,10 +163,9 @@ def create_calendar_keyboard(month: int, year: int, prev: bool, mode: CalendarMo
 
     match mode:
         case CalendarMode.BOOKING | CalendarMode.DELETE:
-            available_dates, future_slots = _get_available_dates(start_date, end_date)
+            available_dates, future_slots = await _get_available_dates(year, month, start_date, end_date)
         case CalendarMode.APPOINTMENT_MAP:
-            start_of_month = datetime(year, month, 1)
-            available_dates, future_slots, booked_slots = _get_appointment_dates(start_of_month, end_date)
+            available_dates, future_slots, booked_slots = await _get_appointment_dates(year, month, end_date)
     header_text = _generate_header_text(month, future_slots, mode, booked_slots)
 
     keyboard = _build_calendar_keyboard(
@@ -183,26 +182,35 @@ def create_calendar_keyboard(month: int, year: int, prev: bool, mode: CalendarMo
     return header_text, keyboard
 
 
-def _get_available_dates(start_date: datetime, end_date: datetime) -> Tuple[Set[date], int]:
-    with SlotsTable() as slots_db:
-        slots = slots_db.get_available_slots(start_date, end_date)
-        return {s.start_time.date() for s in slots}, len(slots)
+async def _get_available_dates(year: int, month: int, start_date: datetime, end_date: datetime) -> Tuple[Set[date], int]:
+    # Слоты всего месяца из кэша, прошедшие отсекаются при каждом построении
+    key = (year, month, 'slots')
+    start_times, version = aio.calendar_cache.get(key)
+    if start_times is None:
+        slots = await aio.slots.get_available_slots(datetime(year, month, 1), end_date)
+        start_times = tuple(s.start_time for s in slots)
+        aio.calendar_cache.fill(key, start_times, version)
 
+    start_times = [t for t in start_times if t >= start_date]
+    return {t.date() for t in start_times}, len(start_times)
 
-def _get_appointment_dates(start_date: datetime, end_date: datetime) -> Tuple[Set[date], int, int]:
-    with AppointmentsTable() as db:
-        booked_slots = db.get_booked_slot_dates(CONFIRMED, start_date, end_date)
-        confirmed_slots_len = db.count_appointments_by_status_and_time(CONFIRMED, start_date, end_date)
-        now = datetime.now()
 
-        if start_date.month == now.month and start_date.year == now.year:
-            future_slots_len = db.count_appointments_by_status_and_time(CONFIRMED, now, end_date)
-        elif start_date > now:
-            future_slots_len = confirmed_slots_len
-        else:
-            future_slots_len = 0
+async def _get_appointment_dates(year: int, month: int, end_date: datetime) -> Tuple[Set[date], int, int]:
+    key = (year, month, 'appointments')
+    slot_times, version = aio.calendar_cache.get(key)
+    if slot_times is None:
+        slot_times = tuple(await aio.appointments.get_slot_times_by_status(CONFIRMED, datetime(year, month, 1), end_date))
+        aio.calendar_cache.fill(key, slot_times, version)
 
-        return booked_slots, future_slots_len, confirmed_slots_len
+    now = datetime.now()
+    if month == now.month and year == now.year:
+        future_slots_len = sum(1 for _, end in slot_times if end >= now)
+    elif datetime(year, month, 1) > now:
+        future_slots_len = len(slot_times)
+    else:
+        future_slots_len = 0
+
+    return {start.date() for start, _ in slot_times}, future_slots_len, len(slot_times)
 
 
 def _generate_header_text(month: int, future_slots_len: int, mode: CalendarMode, booked_slots_len: int = 0) -> str:
@@ -353,15 +361,15 @@ def _get_day_callback_data(day: int, month: int, year: int, is_available: bool,
     ).pack()
 
 
-def service_keyboard() -> IMarkup:
+@keyboard_cache(SERVICES)
+async def service_keyboard() -> IMarkup:
     """Клавиатура с услугами."""
     builder = InlineKeyboardBuilder()
-    with ServicesTable() as service_db:
-        for service in service_db.get_active_services():
-            builder.button(
-                text=service.name,
-                callback_data=ServiceCallBack(service_id=service.id).pack()
-            )
+    for service in await aio.services.get_active_services():
+        builder.button(
+            text=service.name,
+            callback_data=ServiceCallBack(service_id=service.id).pack()
+        )
     builder.adjust(2)  # 2 кнопки в ряд
     return _base_keyboard(
         builder.export(),  # type: ignore
@@ -370,15 +378,14 @@ def service_keyboard() -> IMarkup:
     )
 
 
-def slots_keyboard(cur_date: datetime.date) -> IMarkup:
+async def slots_keyboard(cur_date: datetime.date) -> IMarkup:
     """Клавиатура со слотами времени."""
     builder = InlineKeyboardBuilder()
-    with SlotsTable() as slots_db:
-        for slot in slots_db.get_available_slots_by_day(cur_date):
-            builder.button(
-                text=str(slot),
-                callback_data=SlotCallBack(slot_id=slot.id).pack()
-            )
+    for slot in await aio.slots.get_available_slots_by_day(cur_date):
+        builder.button(
+            text=str(slot),
+            callback_data=SlotCallBack(slot_id=slot.id).pack()
+        )
     builder.adjust(2)
     return _base_keyboard(
         builder.export(),  # type: ignore
@@ -387,6 +394,7 @@ def slots_keyboard(cur_date: datetime.date) -> IMarkup:
     )
 
 
+@keyboard_cache()
 def photo_keyboard() -> IMarkup:
     """Клавиатура для загрузки фото."""
     return _base_keyboard(
@@ -396,6 +404,7 @@ def photo_keyboard() -> IMarkup:
     )
 
 
+@keyboard_cache()
 def comment_keyboard() -> IMarkup:
     """Клавиатура для комментария."""
     return _base_keyboard(
@@ -405,6 +414,7 @@ def comment_keyboard() -> IMarkup:
     )
 
 
+@keyboard_cache()
 def confirm_keyboard() -> IMarkup:
     """Клавиатура подтверждения."""
     return _base_keyboard(
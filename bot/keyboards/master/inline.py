@@ -4,12 +4,12 @@ from aiogram.types import InlineKeyboardButton as IButton
 from aiogram.types import InlineKeyboardMarkup as IMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from DB import aio
 from DB.models import Pagination, ServiceModel, SlotModel
-from DB.tables.services import ServicesTable
-from DB.tables.slots import SlotsTable
 from bot.bot_utils.models import MasterButtonCallBack, AddSlotsMonthCallBack, MasterServiceCallBack, EditServiceCallBack, \
     DeleteSlotCallBack, MonthCallBack
 from bot.keyboards.admin import inline as admin_ikb
+from bot.keyboards.cache import MONTH, SERVICES, keyboard_cache
 from config import const
 from config.const import CalendarMode, PageListSection
 from phrases import PHRASES_RU
@@ -31,6 +31,7 @@ def action_master_keyboard(appointment_id: int, msg_to_delete: Optional[str] = N
     return IMarkup(inline_keyboard=keyboard)
 
 
+@keyboard_cache()
 def menu_master_keyboard() -> IMarkup:
     keyboard = [
         [
@@ -48,16 +49,19 @@ def menu_master_keyboard() -> IMarkup:
     return IMarkup(inline_keyboard=keyboard)
 
 
+@keyboard_cache()
 def back_to_service_menu() -> IMarkup:
     keyboard = [[IButton(text=PHRASES_RU.button.back, callback_data=PHRASES_RU.callback_data.master.back_to_service_menu)]]
     return IMarkup(inline_keyboard=keyboard)
 
 
+@keyboard_cache()
 def back_to_adding() -> IMarkup:
     keyboard = [[IButton(text=PHRASES_RU.button.back, callback_data=PHRASES_RU.callback_data.master.back_to_adding_slots)]]
     return IMarkup(inline_keyboard=keyboard)
 
 
+@keyboard_cache(MONTH)
 def add_slots_menu() -> IMarkup:
     now = datetime.now()
     current_month = now.month
@@ -85,6 +89,7 @@ def add_slots_menu() -> IMarkup:
     return IMarkup(inline_keyboard=keyboard)
 
 
+@keyboard_cache()
 def master_confirm_adding_slot(month: Optional[int] = None, year: Optional[int] = None) -> IMarkup:
     keyboard = [
         [IButton(text=PHRASES_RU.button.cancel,
@@ -96,6 +101,7 @@ def master_confirm_adding_slot(month: Optional[int] = None, year: Optional[int]
     return IMarkup(inline_keyboard=keyboard)
 
 
+@keyboard_cache()
 def master_confirm_adding_service() -> IMarkup:
     keyboard = [
         [IButton(text=PHRASES_RU.button.cancel,
@@ -106,6 +112,7 @@ def master_confirm_adding_service() -> IMarkup:
     return IMarkup(inline_keyboard=keyboard)
 
 
+@keyboard_cache()
 def master_confirm_edit_service(service_id: int) -> IMarkup:
     keyboard = [
         [IButton(text=PHRASES_RU.button.back,
@@ -116,6 +123,7 @@ def master_confirm_edit_service(service_id: int) -> IMarkup:
     return IMarkup(inline_keyboard=keyboard)
 
 
+@keyboard_cache()
 def master_service_menu() -> IMarkup:
     keyboard = [
         [IButton(text=PHRASES_RU.button.master.edit_service, callback_data=PHRASES_RU.callback_data.master.edit_service),
@@ -137,29 +145,29 @@ def master_page_keyboard(type_of_event: PageListSection, pagination: Pagination)
     return reply_markup
 
 
-def master_service_editor() -> IMarkup:
-    with ServicesTable() as db:
-        services = db.get_all_services()
+@keyboard_cache(SERVICES)
+async def master_service_editor() -> IMarkup:
+    services = await aio.services.get_all_services()
 
-        builder = InlineKeyboardBuilder()
-        for service in services:
-            is_active = '🟢' if service.is_active else '🔴'
-            builder.button(
-                text=f'{is_active} {service.name}',
-                callback_data=MasterServiceCallBack(service_id=service.id).pack()
-            )
+    builder = InlineKeyboardBuilder()
+    for service in services:
+        is_active = '🟢' if service.is_active else '🔴'
+        builder.button(
+            text=f'{is_active} {service.name}',
+            callback_data=MasterServiceCallBack(service_id=service.id).pack()
+        )
 
-        # кнопки услуг (по 2 в ряд)
-        builder.adjust(2)
-        # кнопка "Назад" в отдельный ряд
-        builder.row(
-            IButton(
-                text=PHRASES_RU.button.back,
-                callback_data=PHRASES_RU.callback_data.master.back_to_service_menu
-            )
+    # кнопки услуг (по 2 в ряд)
+    builder.adjust(2)
+    # кнопка "Назад" в отдельный ряд
+    builder.row(
+        IButton(
+            text=PHRASES_RU.button.back,
+            callback_data=PHRASES_RU.callback_data.master.back_to_service_menu
         )
+    )
 
-        return builder.as_markup()
+    return builder.as_markup()
 
 
 def edit_current_service(service: ServiceModel) -> IMarkup:
@@ -177,22 +185,22 @@ def edit_current_service(service: ServiceModel) -> IMarkup:
     return IMarkup(inline_keyboard=keyboard)
 
 
+@keyboard_cache()
 def back_to_edit_service(service_id: int) -> IMarkup:
     keyboard = [[IButton(text=PHRASES_RU.button.back,
                          callback_data=MasterServiceCallBack(service_id=service_id).pack())]]
     return IMarkup(inline_keyboard=keyboard)
 
 
-def delete_slots_menu(cur_date: datetime.date) -> IMarkup:
+async def delete_slots_menu(cur_date: datetime.date) -> IMarkup:
     builder = InlineKeyboardBuilder()
-    with SlotsTable() as slots_db:
-        for slot in slots_db.get_available_slots_by_day(cur_date):
-            builder.button(
-                text=str(slot),
-                callback_data=DeleteSlotCallBack(slot_id=slot.id,
-                                                 slot_date=slot.start_time.date(),
-                                                 action=const.Action.check_slot_to_delete).pack()
-            )
+    for slot in await aio.slots.get_available_slots_by_day(cur_date):
+        builder.button(
+            text=str(slot),
+            callback_data=DeleteSlotCallBack(slot_id=slot.id,
+                                             slot_date=slot.start_time.date(),
+                                             action=const.Action.check_slot_to_delete).pack()
+        )
     builder.adjust(2)
     builder.row(
         IButton(
@@ -3,8 +3,8 @@ from aiogram import BaseMiddleware
 from typing import Callable, Dict, Any, Awaitable, Optional
 from aiogram.types import Message, TelegramObject, InlineQuery
 
-from DB.tables.queries import QueriesTable
 from DB.models import UserModel as UserModel, QueryModel
+from DB.query_log import query_log
 from bot.bot_utils.routers import BaseRouter
 
 
@@ -27,13 +27,8 @@ class UserLoggerMiddleware(BaseMiddleware):
 
         # phasalo ON
         if isinstance(event, Message):
-            skip_commands = [
-                f'/{cmd}'
-                for command in BaseRouter.available_commands
-                if command.is_admin
-                for cmd in [command.name] + list(command.aliases)
-            ]
-            if event.text and any(event.text.startswith(cmd) for cmd in skip_commands):
+            command = BaseRouter.find_command(event.text)
+            if command and command.is_admin:  # Админские команды не логируются
                 return await handler(event, data)
         user_row: Optional[UserModel] = data.get('user_row')
         if user_row is None:
@@ -45,13 +40,11 @@ class UserLoggerMiddleware(BaseMiddleware):
 
         # Логируем текстовые сообщения
         if isinstance(event, Message) and event.text:
-            with QueriesTable() as queries_db:
-                queries_db.add_query(QueryModel(user_row.user_id, event.text))
+            query_log.add(QueryModel(user_row.user_id, event.text))
 
         # Логируем инлайн-запросы
         elif isinstance(event, InlineQuery) and event.query:
-            with QueriesTable() as queries_db:
-                queries_db.add_query(QueryModel(user_row.user_id, f'[INLINE] {event.query}'))
+            query_log.add(QueryModel(user_row.user_id, f'[INLINE] {event.query}'))
         # phasalo OFF
 
         return await handler(event, data)
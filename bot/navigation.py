@@ -5,7 +5,7 @@ from typing import Optional, Awaitable, Callable
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
 
-from DB.tables.slots import SlotsTable
+from DB import aio
 from DB.models import AppointmentModel
 from bot.states import AppointmentStates
 from phrases import PHRASES_RU
@@ -133,21 +133,20 @@ class AppointmentNavigation:
 
     @staticmethod
     async def _show_date_selection(callback: CallbackQuery, data: AppointmentModel):
-        with SlotsTable() as slots_db:
-            slot_date = data.slot_date if data.slot_date else slots_db.get_first_available_slot()
-            prev_enabled = not (slot_date.month == datetime.now().month and slot_date.year == datetime.now().year)
-            if slot_date:
-                text, reply_markup = ikb.create_calendar_keyboard(slot_date.month, slot_date.year, prev_enabled)
-                await callback.message.edit_text(text, reply_markup=reply_markup)
-            else:
-                await callback.message.edit_text(PHRASES_RU.error.no_slots)
+        slot_date = data.slot_date if data.slot_date else await aio.slots.get_first_available_slot()
+        prev_enabled = not (slot_date.month == datetime.now().month and slot_date.year == datetime.now().year)
+        if slot_date:
+            text, reply_markup = await ikb.create_calendar_keyboard(slot_date.month, slot_date.year, prev_enabled)
+            await callback.message.edit_text(text, reply_markup=reply_markup)
+        else:
+            await callback.message.edit_text(PHRASES_RU.error.no_slots)
 
     @staticmethod
     async def _show_slot_selection(callback: CallbackQuery, data: AppointmentModel):
         if data.slot_date:
             await callback.message.edit_text(
                 text=PHRASES_RU.replace('answer.choose_slot', date=data.slot_date.strftime('%d.%m.%Y')),
-                reply_markup=ikb.slots_keyboard(data.slot_date)
+                reply_markup=await ikb.slots_keyboard(data.slot_date)
             )
         else:
             logger.error(f'Appointment creation error: no slot date in state data')
@@ -157,7 +156,7 @@ class AppointmentNavigation:
     async def _show_service_selection(callback: CallbackQuery, data: AppointmentModel):
         await callback.message.edit_text(
             text=format_string.user_booking_text(data) + PHRASES_RU.answer.choose_service,
-            reply_markup=ikb.service_keyboard()
+            reply_markup=await ikb.service_keyboard()
         )
 
     @staticmethod
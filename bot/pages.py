@@ -4,13 +4,10 @@ from typing import Optional
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import InputMediaPhoto, CallbackQuery
 
+from DB import aio
 from DB.models import AppointmentModel, Pagination
-from DB.tables.appointments import AppointmentsTable
-from DB.tables.masters import MastersTable
 from bot.bot_utils.msg_sender import send_or_edit_message
 from phrases import PHRASES_RU
-from DB.tables.queries import QueriesTable
-from DB.tables.users import UsersTable
 from config import bot
 from config.const import USERS_PER_PAGE, ACTIONS_PER_PAGE, QUERIES_PER_PAGE, PENDING, AppListMode, CONFIRMED, PageListSection
 from utils import format_list, format_string
@@ -21,73 +18,70 @@ from bot.keyboards.master import inline as master_ikb
 logger = logging.getLogger(__name__)
 
 
-async def get_users(user_id: int, page: int = 1, message_id: Optional[int] = None):
-    with UsersTable() as users_db:
-        users, pagination = users_db.get_all_users(page, USERS_PER_PAGE)
+async def get_users(user_id: int, page: int = 1, message_id: Optional[int] = None, **seek):
+    users, pagination = await aio.users.get_all_users(page, USERS_PER_PAGE, **seek)
 
-        txt = format_list.format_user_list(users, pagination)
-        reply_markup = admin_ikb.page_keyboard(type_of_event=PageListSection.USERS, pagination=pagination)
+    txt = format_list.format_user_list(users, pagination)
+    reply_markup = admin_ikb.page_keyboard(type_of_event=PageListSection.USERS, pagination=pagination)
 
-        if message_id:
-            await bot.edit_message_text(chat_id=user_id, message_id=message_id, text=txt,
-                                        reply_markup=reply_markup)
-        else:
-            await bot.send_message(chat_id=user_id, text=txt, reply_markup=reply_markup)
+    if message_id:
+        await bot.edit_message_text(chat_id=user_id, message_id=message_id, text=txt,
+                                    reply_markup=reply_markup)
+    else:
+        await bot.send_message(chat_id=user_id, text=txt, reply_markup=reply_markup)
 
 
-async def user_query(user_id: int, user_id_to_find: Optional[int], page: int = 1, message_id: Optional[int] = None):
-    with QueriesTable() as queries_db, UsersTable() as users_db:
-        queries, pagination = queries_db.get_user_queries(user_id_to_find, page, QUERIES_PER_PAGE)
-        if not user_id_to_find or not queries:
-            await bot.send_message(chat_id=user_id, text=PHRASES_RU.error.no_query)
-            return
+async def user_query(user_id: int, user_id_to_find: Optional[int], page: int = 1, message_id: Optional[int] = None, **seek):
+    queries, pagination = await aio.queries.get_user_queries(user_id_to_find, page, QUERIES_PER_PAGE, **seek)
+    if not user_id_to_find or not queries:
+        await bot.send_message(chat_id=user_id, text=PHRASES_RU.error.no_query)
+        return
 
-        user = users_db.get_user(user_id_to_find)
+    user = await aio.users.get_user(user_id_to_find)
 
-        txt = format_list.format_queries_text(
-            queries=queries,
-            name=user.username or user.first_name if user else None,
-            user_id=user_id_to_find,
-            footnote_template=PHRASES_RU.footnote.user_query,
-            line_template=PHRASES_RU.template.user_query
-        )
+    txt = format_list.format_queries_text(
+        queries=queries,
+        name=user.username or user.first_name if user else None,
+        user_id=user_id_to_find,
+        footnote_template=PHRASES_RU.footnote.user_query,
+        line_template=PHRASES_RU.template.user_query
+    )
+
+    reply_markup = admin_ikb.page_keyboard(
+        type_of_event=PageListSection.QUERY,
+        pagination=pagination,
+        user_id=user_id_to_find
+    )
 
-        reply_markup = admin_ikb.page_keyboard(
-            type_of_event=PageListSection.QUERY,
-            pagination=pagination,
-            user_id=user_id_to_find
+    if message_id:
+        await bot.edit_message_text(
+            chat_id=user_id,
+            message_id=message_id,
+            text=txt,
+            reply_markup=reply_markup
+        )
+    else:
+        await bot.send_message(
+            chat_id=user_id,
+            text=txt,
+            reply_markup=reply_markup
         )
 
-        if message_id:
-            await bot.edit_message_text(
-                chat_id=user_id,
-                message_id=message_id,
-                text=txt,
-                reply_markup=reply_markup
-            )
-        else:
-            await bot.send_message(
-                chat_id=user_id,
-                text=txt,
-                reply_markup=reply_markup
-            )
-
-
-async def get_active_bookings(user_id: int, page: int = 1, message_id: Optional[int] = None):
-    with AppointmentsTable() as app_db:
-        app, pagination = app_db.get_client_appointments(user_id, page)
-        if pagination.total_items > 0:
-            if not app:
-                await send_or_edit_message(chat_id=user_id,
-                                           message_id=message_id,
-                                           text=PHRASES_RU.error.booking.try_again)
-                return
-            await _send_appointment_message(user_id, app, pagination, message_id)
-        else:
-            await send_or_edit_message(message_id=message_id,
-                                       chat_id=user_id,
-                                       text=PHRASES_RU.replace('answer.no_active_bookings',
-                                                               booking=PHRASES_RU.button.booking))
+
+async def get_active_bookings(user_id: int, page: int = 1, message_id: Optional[int] = None, **seek):
+    app, pagination = await aio.appointments.get_client_appointments(user_id, page, **seek)
+    if pagination.total_items > 0:
+        if not app:
+            await send_or_edit_message(chat_id=user_id,
+                                       message_id=message_id,
+                                       text=PHRASES_RU.error.booking.try_again)
+            return
+        await _send_appointment_message(user_id, app, pagination, message_id)
+    else:
+        await send_or_edit_message(message_id=message_id,
+                                   chat_id=user_id,
+                                   text=PHRASES_RU.replace('answer.no_active_bookings',
+                                                           booking=PHRASES_RU.button.booking))
 
 
 def get_day_range(date: datetime.date) -> tuple[datetime.datetime, datetime.datetime]:
@@ -96,15 +90,15 @@ def get_day_range(date: datetime.date) -> tuple[datetime.datetime, datetime.date
     return start_of_day, end_of_day
 
 
-async def get_master_apps(callback: CallbackQuery, date: datetime.date, page: int = 1):
+async def get_master_apps(callback: CallbackQuery, date: datetime.date, page: int = 1, **seek):
     start_of_day, end_of_day = get_day_range(date)
 
-    with AppointmentsTable() as app_db:
-        app, pagination = app_db.get_appointments_by_status_and_time_range(CONFIRMED, start_of_day, end_of_day, page)
-        if not app:
-            await callback.message.edit_text(text=PHRASES_RU.error.booking.try_again)
-            return
-        await _send_appointment_message(callback.from_user.id, app[0], pagination, callback.message.message_id, AppListMode.MASTER)
+    app, pagination = await aio.appointments.get_appointments_by_status_and_time_range(
+        CONFIRMED, start_of_day, end_of_day, page, **seek)
+    if not app:
+        await callback.message.edit_text(text=PHRASES_RU.error.booking.try_again)
+        return
+    await _send_appointment_message(callback.from_user.id, app[0], pagination, callback.message.message_id, AppListMode.MASTER)
 
 
 async def _send_appointment_message(user_id: int,
@@ -128,78 +122,75 @@ async def _send_appointment_message(user_id: int,
 
 
 async def update_master_booking_ui(data: AppointmentModel):
-    with (MastersTable() as masters_db, AppointmentsTable() as app_db):
-        total_items = app_db.count_appointments(PENDING)
-        masters = masters_db.get_all_masters()
-
-        if masters and len(masters) > 0:
-            master = masters[0]
-            if not master.message_id:
-                msg_to_delete = None
-                caption = format_string.master_booking_text(data, total_items)
-                reply_to = None
-                if data.photos and len(data.photos) > 0:
-                    media: list[InputMediaPhoto] = []
-                    for photo in data.photos:
-                        media.append(InputMediaPhoto(media=photo.telegram_file_id))
-                    msgs = await bot.send_media_group(chat_id=master.user.user_id, media=media[:9])
-                    reply_to = msgs[0].message_id
-                    msg_to_delete = f'{msgs[0].message_id},{msgs[-1].message_id}'
-
-                msg = await bot.send_message(
-                    chat_id=master.user.user_id,
-                    text=caption,
-                    reply_markup=master_ikb.action_master_keyboard(
-                        appointment_id=data.appointment_id,
-                        msg_to_delete=msg_to_delete),
-                    reply_to_message_id=reply_to)
-                masters_db.update_current_state(master.user.user_id, msg.message_id, data.appointment_id, msg_to_delete)
-            else:
-                current_app = app_db.get_appointment_by_id(master.current_app_id)
-                if current_app.status != PENDING:
-                    total_items += 1
-                caption = format_string.master_booking_text(current_app, total_items)
-                try:
-                    await bot.edit_message_text(chat_id=master.user.user_id,
-                                                message_id=master.message_id,
-                                                text=caption,
-                                                reply_markup=master_ikb.action_master_keyboard(
-                                                    appointment_id=master.current_app_id,
-                                                    msg_to_delete=master.msg_to_delete)
-                                                )
-                except TelegramBadRequest as e:
-                    if "message is not modified" in str(e):
-                        pass
-                    else:
-                        logger.error(
-                            "TelegramBadRequest while editing message: %s",
-                            e,
-                            exc_info=True
-                        )
-
-
-async def get_history(user_id: int, page: int = 1, message_id: Optional[int] = None):
-    with AppointmentsTable() as app_db:
-        appointments, pagination = app_db.get_master_actions(page, ACTIONS_PER_PAGE)
-
-        txt = format_list.format_app_actions(appointments, pagination)
-        reply_markup = master_ikb.master_page_keyboard(type_of_event=PageListSection.ACTION_HISTORY, pagination=pagination)
-        if message_id:
-            await bot.edit_message_text(chat_id=user_id, message_id=message_id, text=txt,
-                                        reply_markup=reply_markup)
+    total_items = await aio.appointments.count_appointments(PENDING)
+    masters = await aio.masters.get_all_masters()
+
+    if masters and len(masters) > 0:
+        master = masters[0]
+        if not master.message_id:
+            msg_to_delete = None
+            caption = format_string.master_booking_text(data, total_items)
+            reply_to = None
+            if data.photos and len(data.photos) > 0:
+                media: list[InputMediaPhoto] = []
+                for photo in data.photos:
+                    media.append(InputMediaPhoto(media=photo.telegram_file_id))
+                msgs = await bot.send_media_group(chat_id=master.user.user_id, media=media[:9])
+                reply_to = msgs[0].message_id
+                msg_to_delete = f'{msgs[0].message_id},{msgs[-1].message_id}'
+
+            msg = await bot.send_message(
+                chat_id=master.user.user_id,
+                text=caption,
+                reply_markup=master_ikb.action_master_keyboard(
+                    appointment_id=data.appointment_id,
+                    msg_to_delete=msg_to_delete),
+                reply_to_message_id=reply_to)
+            await aio.masters.update_current_state(master.user.user_id, msg.message_id, data.appointment_id, msg_to_delete)
         else:
-            await bot.send_message(chat_id=user_id, text=txt, reply_markup=reply_markup)
+            current_app = await aio.appointments.get_appointment_by_id(master.current_app_id)
+            if current_app.status != PENDING:
+                total_items += 1
+            caption = format_string.master_booking_text(current_app, total_items)
+            try:
+                await bot.edit_message_text(chat_id=master.user.user_id,
+                                            message_id=master.message_id,
+                                            text=caption,
+                                            reply_markup=master_ikb.action_master_keyboard(
+                                                appointment_id=master.current_app_id,
+                                                msg_to_delete=master.msg_to_delete)
+                                            )
+            except TelegramBadRequest as e:
+                if "message is not modified" in str(e):
+                    pass
+                else:
+                    logger.error(
+                        "TelegramBadRequest while editing message: %s",
+                        e,
+                        exc_info=True
+                    )
+
+
+async def get_history(user_id: int, page: int = 1, message_id: Optional[int] = None, **seek):
+    appointments, pagination = await aio.appointments.get_master_actions(page, ACTIONS_PER_PAGE, **seek)
+
+    txt = format_list.format_app_actions(appointments, pagination)
+    reply_markup = master_ikb.master_page_keyboard(type_of_event=PageListSection.ACTION_HISTORY, pagination=pagination)
+    if message_id:
+        await bot.edit_message_text(chat_id=user_id, message_id=message_id, text=txt,
+                                    reply_markup=reply_markup)
+    else:
+        await bot.send_message(chat_id=user_id, text=txt, reply_markup=reply_markup)
 
 
 async def get_clients(user_id: int, message_id: int, page: int = 1):
-    with AppointmentsTable() as db:
-        clients, pagination = db.get_clients_with_stats(page, USERS_PER_PAGE)
+    clients, pagination = await aio.appointments.get_clients_with_stats(page, USERS_PER_PAGE)
 
-        txt = format_list.format_client_list(clients, pagination)
-        reply_markup = master_ikb.master_page_keyboard(type_of_event=PageListSection.CLIENTS, pagination=pagination)
+    txt = format_list.format_client_list(clients, pagination)
+    reply_markup = master_ikb.master_page_keyboard(type_of_event=PageListSection.CLIENTS, pagination=pagination)
 
-        if message_id:
-            await bot.edit_message_text(chat_id=user_id, message_id=message_id, text=txt,
-                                        reply_markup=reply_markup)
-        else:
-            await bot.send_message(chat_id=user_id, text=txt, reply_markup=reply_markup)
+    if message_id:
+        await bot.edit_message_text(chat_id=user_id, message_id=message_id, text=txt,
+                                    reply_markup=reply_markup)
+    else:
+        await bot.send_message(chat_id=user_id, text=txt, reply_markup=reply_markup)
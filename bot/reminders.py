@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from DB import aio
+from bot.bot_utils.msg_sender import send_reminder
+from config.const import REMINDER_OFFSETS, REMINDERS_HORIZON_MINUTES, REMINDERS_MISFIRE_MINUTES
+from utils.metrics import metrics
+from utils.timing_wheel import TimingWheel
+
+logger = logging.getLogger(__name__)
+
+ReminderKey = Tuple[int, str]  # (ID записи, вид напоминания)
+
+
+class ReminderDispatcher:
+    """Отправка напоминаний о подтверждённых записях.
+
+    Раз в минуту tick() догружает из БД напоминания, наступающие в ближайшие horizon минут,
+    в колесо таймеров с шагом в минуту и пачкой отправляет сработавшие. В памяти лежат только
+    напоминания в пределах горизонта, отправленные отмечаются в reminders_log, поэтому
+    после перезапуска ничего не теряется и не повторяется.
+    """
+
+    def __init__(self,
+                 offsets: Dict[str, int] = REMINDER_OFFSETS,
+                 horizon_minutes: int = REMINDERS_HORIZON_MINUTES,
+                 misfire_minutes: int = REMINDERS_MISFIRE_MINUTES):
+        self.offsets = offsets
+        self.horizon = timedelta(minutes=horizon_minutes)
+        self.misfire = timedelta(minutes=misfire_minutes)
+
+        self._wheel: Optional[TimingWheel[ReminderKey]] = None
+        self._loaded_until: Optional[datetime] = None  # Граница уже загруженных из БД напоминаний
+        self._tombstones: Dict[int, float] = {}  # Отменённые записи -> до какого времени о них помнить
+
+    @property
+    def wheel(self) -> TimingWheel[ReminderKey]:
+        if self._wheel is None:
+            # Запас в 2 деления: всё, что загружено до _loaded_until, должно поместиться в колесо
+            self._wheel = TimingWheel(int(self.horizon.total_seconds() // 60) + 2, 60, datetime.now().timestamp())
+        return self._wheel
+
+    def schedule(self, appointment_id: int, slot_start: datetime):
+        """Добавляет напоминания о записи, если они наступают в пределах горизонта. Более дальние загрузит tick()"""
+        self._tombstones.pop(appointment_id, None)
+        now = datetime.now()
+        for kind, minutes in self.offsets.items():
+            remind_at = slot_start - timedelta(minutes=minutes)
+            if remind_at > now:
+                self.wheel.add((appointment_id, kind), remind_at.timestamp())
+
+    def cancel(self, appointment_id: int):
+        """Отменяет напоминания о записи, в том числе те, что сейчас догружаются из БД"""
+        for kind in self.offsets:
+            self.wheel.discard((appointment_id, kind))
+        self._tombstones[appointment_id] = (datetime.now() + self.horizon).timestamp()
+
+    async def _load(self, now: datetime):
+        from_time = self._loaded_until or now - self.misfire
+        to_time = now + self.horizon
+        due = await aio.reminders.get_due_reminders(self.offsets, from_time, to_time, now)
+        for appointment_id, kind, remind_at in due:
+            if appointment_id not in self._tombstones:
+                self.wheel.add((appointment_id, kind), remind_at.timestamp())
+        self._loaded_until = to_time
+
+    async def _send(self, batch: List[ReminderKey]):
+        results = await asyncio.gather(*(send_reminder(appointment_id, kind) for appointment_id, kind in batch),
+                                       return_exceptions=True)
+        failed = 0
+        for (appointment_id, kind), result in zip(batch, results):
+            if isinstance(result, Exception):
+                failed += 1
+                logger.error('Failed to send %s reminder for appointment %d: %s', kind, appointment_id, result)
+        # Неудачные тоже отмечаются: повторная отправка заблокировавшему бота клиенту бессмысленна
+        await aio.reminders.mark_sent(batch)
+        metrics.inc('reminders_sent', len(batch) - failed)
+        metrics.inc('reminders_failed', failed)
+
+    async def tick(self):
+        now = datetime.now()
+        await self._load(now)
+
+        due = [key for key in self.wheel.advance(now.timestamp()) if key[0] not in self._tombstones]
+        self._tombstones = {app_id: until for app_id, until in self._tombstones.items() if until > now.timestamp()}
+        if due:
+            await self._send(due)
+
+        metrics.set('reminders_pending', len(self.wheel))
+        metrics.set('reminders_tombstones', len(self._tombstones))
+
+
+reminders = ReminderDispatcher()
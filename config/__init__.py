@@ -33,10 +33,22 @@ class TgBot:
     message_max_symbols: int = 400
 
 
+@dataclass
+class DBConfig:
+    """PRAGMA, применяемые к каждому новому соединению SQLite"""
+    journal_mode: str = 'WAL'  # DELETE, TRUNCATE, PERSIST, MEMORY, WAL, OFF
+    synchronous: str = 'NORMAL'  # OFF, NORMAL, FULL, EXTRA
+    busy_timeout: int = 5000  # мс
+    cache_size: int = -16000  # < 0 - размер в КиБ, > 0 - в страницах
+    mmap_size: int = 64 * 1024 * 1024  # байт, 0 - выключено
+    temp_store: str = 'MEMORY'  # DEFAULT, FILE, MEMORY
+
+
 @dataclass
 class Config:
     tg_bot: TgBot
     log: LogConfig
+    db: DBConfig
 
 
 def __load_config() -> Config:
@@ -50,6 +62,14 @@ def __load_config() -> Config:
             file_path=os.getenv('LOG_FILE', 'logs/bot.log'),
             max_size=int(os.getenv('LOG_MAX_SIZE', 10)),
             backup_count=int(os.getenv('LOG_BACKUP_COUNT', 3))
+        ),
+        db=DBConfig(
+            journal_mode=os.getenv('DB_JOURNAL_MODE', 'WAL').upper(),
+            synchronous=os.getenv('DB_SYNCHRONOUS', 'NORMAL').upper(),
+            busy_timeout=int(os.getenv('DB_BUSY_TIMEOUT', 5000)),
+            cache_size=int(os.getenv('DB_CACHE_SIZE', -16000)),
+            mmap_size=int(os.getenv('DB_MMAP_SIZE', 64 * 1024 * 1024)),
+            temp_store=os.getenv('DB_TEMP_STORE', 'MEMORY').upper()
         )
     )
 
@@ -89,6 +109,8 @@ def setup_logging(cfg: LogConfig):
 
 config: Config = __load_config()
 bot = Bot(token=config.tg_bot.token, default=DefaultBotProperties(parse_mode='HTML'))
+# Хранилище задач намеренно не задаётся - задачи живут только в памяти. Периодические задачи
+# регистрируются при запуске, напоминания восстанавливаются из записей и reminders_log (bot/reminders.py)
 scheduler = AsyncIOScheduler()
 
 setup_logging(config.log)
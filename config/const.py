@@ -6,6 +6,26 @@ ADMIN_ID = 972753303
 USERS_PER_PAGE = 15
 ACTIONS_PER_PAGE = 5
 QUERIES_PER_PAGE = 6
+SLOTS_SWEEP_MINUTES = 10  # Период очистки прошедших слотов
+USER_CACHE_SIZE = 10000  # Пользователей в кэше
+USER_CACHE_TTL = 600  # Секунд жизни записи в кэше пользователей
+CALENDAR_CACHE_SIZE = 48  # Месяцев (отдельно слоты и записи) в кэше календаря
+CALENDAR_CACHE_TTL = 900  # Секунд жизни месяца в кэше календаря, если его данные не менялись
+KEYBOARD_CACHE_SIZE = 512  # Готовых клавиатур в кэше
+QUERY_LOG_BATCH_SIZE = 200  # Запросов пользователей в одной транзакции записи журнала
+QUERY_LOG_FLUSH_SECONDS = 2  # Максимальная задержка записи журнала запросов
+QUERY_LOG_MAX_QUEUE = 10000  # Запросов в буфере, сверх которых новые отбрасываются
+REMINDER_OFFSETS = {'24h': 24 * 60, '1h': 60}  # Вид напоминания -> за сколько минут до записи его отправить
+REMINDERS_HORIZON_MINUTES = 120  # На сколько вперёд напоминания загружаются из БД в память
+REMINDERS_MISFIRE_MINUTES = 30  # Насколько опоздавшее (например, из-за перезапуска) напоминание ещё отправляется
+OUTBOX_WORKERS = 4  # Обработчики очереди исходящих сообщений
+OUTBOX_RATE = 25  # Сообщений в секунду всего (лимит Telegram - 30)
+OUTBOX_CHAT_RATE = 1  # Сообщений в секунду в один чат
+OUTBOX_CHAT_BURST = 3  # Сообщений в один чат подряд без паузы
+OUTBOX_MAX_RETRIES = 3  # Повторов после TelegramRetryAfter
+BACKUP_KEEP = 14  # Сколько последних полных бэкапов хранить в backups/ (с дельтами к ним)
+BACKUP_FULL_EVERY_DAYS = 7  # Полный бэкап раз в столько дней, в остальные дни - только изменения
+BACKUP_PAGES_STEP = 256  # Страниц БД за один шаг копирования, между шагами БД доступна другим соединениям
 
 MONTHS = {
     1: 'Январь',
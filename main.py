@@ -19,16 +19,21 @@
 
 import logging
 import asyncio
+from datetime import datetime
 from aiogram import Dispatcher
 
-from config import bot, scheduler
+from config import bot, scheduler, const
 from bot.middlewares.get_user import GetUserMiddleware
 from bot.middlewares.shadow_ban import ShadowBanMiddleware
 from bot.middlewares.logging_query import UserLoggerMiddleware
-from bot.scheduler import load_scheduled_notifications
+from bot.bot_utils.outbox import outbox
+from bot.reminders import reminders
+from bot.scheduler import sweep_past_slots
 
 from bot import handlers
-from DB import init_database
+from DB import aio, init_database
+from DB.query_log import query_log
+from DB.tables.pool import close_pools
 from utils.db_manager import backup_db
 
 logger = logging.getLogger(__name__)
@@ -59,12 +64,20 @@ async def main() -> None:
     logger.info(f'{(await bot.get_me()).first_name} starting\n * Running on http://t.me/{(await bot.get_me()).username}')
 
     scheduler.add_job(backup_db, 'cron', hour=5, minute=0, args=(bot,))
-    load_scheduled_notifications()
+    scheduler.add_job(sweep_past_slots, 'interval', minutes=const.SLOTS_SWEEP_MINUTES, next_run_time=datetime.now())
+    scheduler.add_job(reminders.tick, 'interval', minutes=1, next_run_time=datetime.now())
     scheduler.start()
+    query_log.start()
+    outbox.start()
     try:
         await dp.start_polling(bot)
     except Exception as e:
         logger.exception(e)
+    finally:
+        await outbox.stop()
+        await query_log.stop()
+        aio.shutdown()
+        close_pools()
 
 
 if __name__ == '__main__':
@@ -1,31 +1,111 @@
 import yaml
 from os.path import dirname
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from random import choice
 import re
 
+_PLACEHOLDER = re.compile(r'(\{\s*(\w+)\s*})')
+
+
+class Template:
+    """Фраза, заранее разобранная на текст и плейсхолдеры вида {key}"""
+    __slots__ = ('text', '_literals', '_fields')
+
+    def __init__(self, text: Any):
+        self.text = text
+        pieces = _PLACEHOLDER.split(text) if isinstance(text, str) else [text]
+        self._literals: List[str] = pieces[::3]
+        self._fields: List[Tuple[str, str]] = list(zip(pieces[2::3], pieces[1::3]))  # (ключ, плейсхолдер как в тексте)
+
+    def render(self, replacements: Dict[str, Any]) -> Any:
+        """Подставляет значения; плейсхолдеры без значения остаются как есть"""
+        if not self._fields or not replacements:
+            return self.text
+        parts = [self._literals[0]]
+        for (key, placeholder), literal in zip(self._fields, self._literals[1:]):
+            parts.append(str(replacements[key]) if key in replacements else placeholder)
+            parts.append(literal)
+        return ''.join(parts)
+
+
+class Variants(tuple):
+    """Варианты одной фразы, при каждом чтении выбирается случайный"""
+
+    def pick(self) -> Any:
+        return choice(self)
+
 
 class Phrases:
-    """Класс для представления"""
-    def __init__(self, dictionary: Dict[str, Any]):
+    """Неизменяемое дерево фраз: PHRASES_RU.button.booking или PHRASES_RU['button.booking'].
+
+    Строки и числа лежат в обычных атрибутах, списки вариантов - свойства класса узла,
+    которые при каждом чтении возвращают случайный вариант. Все фразы дерева также
+    доступны по полному пути из общего плоского словаря корня.
+    """
+    __slots__ = ('__dict__', '_path', '_keys', '_flat', '_templates')
+
+    def __new__(cls, dictionary: Dict[str, Any], *args, **kwargs):
+        variants = {key: property(lambda self, v=Variants(value): v.pick())
+                    for key, value in dictionary.items() if isinstance(value, list)}
+        if variants:  # Свой класс для узла, чтобы варианты читались как атрибуты без переопределения __getattribute__
+            cls = type(cls.__name__, (cls,), {'__slots__': (), **variants})
+        return object.__new__(cls)
+
+    def __init__(self,
+                 dictionary: Dict[str, Any],
+                 _path: str = '',
+                 _flat: Optional[Dict[str, Any]] = None,
+                 _templates: Optional[Dict[str, Union[Template, List[Template]]]] = None):
+        flat = {} if _flat is None else _flat  # Полный путь фразы ('success.user_banned') -> значение или Variants
+        templates = {} if _templates is None else _templates  # Полный путь -> шаблон или варианты шаблона
         for key, value in dictionary.items():
+            self._validate(_path, key, value)
+            path = f'{_path}{key}'
             if isinstance(value, dict):
-                setattr(self, key, Phrases(value))
+                self.__dict__[key] = Phrases(value, f'{path}.', flat, templates)
+            elif isinstance(value, list):
+                flat[path] = Variants(value)
+                templates[path] = [Template(v) for v in value]
             else:
-                setattr(self, key, value)
+                self.__dict__[key] = flat[path] = value
+                templates[path] = Template(value)
 
-    def __getattribute__(self, name: str):
-        value = object.__getattribute__(self, name)
+        object.__setattr__(self, '_path', _path)
+        object.__setattr__(self, '_keys', tuple(dictionary))
+        object.__setattr__(self, '_flat', MappingProxyType(flat))
+        object.__setattr__(self, '_templates', MappingProxyType(templates))
 
-        if isinstance(value, list):
-            return choice(value)
-        return value
+    @staticmethod
+    def _validate(path: str, key: Any, value: Any):
+        if not isinstance(key, str) or not key or '.' in key or key.startswith('_') or hasattr(Phrases, key):
+            raise ValueError(f'Недопустимый ключ фразы «{path}{key}»')
+        if isinstance(value, list) and not value:
+            raise ValueError(f'Пустой список вариантов фразы «{path}{key}»')
 
     def __getattr__(self, name: str):
-        raise AttributeError(f'Фраза «{name}» не найдена')
+        raise AttributeError(f'Фраза «{self._path}{name}» не найдена')
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError('Фразы доступны только для чтения')
+
+    def __delattr__(self, name: str):
+        raise AttributeError('Фразы доступны только для чтения')
+
+    def __getitem__(self, phrase_name: str) -> Any:
+        """Фраза по пути относительно узла, например PHRASES_RU['success.user_banned']"""
+        try:
+            value = self._flat[self._path + phrase_name]
+        except KeyError:
+            raise KeyError(f'Фраза «{self._path}{phrase_name}» не найдена') from None
+        return value.pick() if isinstance(value, Variants) else value
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Пары (ключ, значение) узла в порядке YAML"""
+        return ((key, getattr(self, key)) for key in self._keys)
 
     def __repr__(self):
-        return str(self.__dict__)
+        return str(dict(self.items()))
 
     def replace(self, phrase_name: str, **replacements: Any) -> str:
         """
@@ -35,26 +115,12 @@ class Phrases:
         :param replacements: Параметры для замены (например user_id=123)
         :return: Готовая фраза с подставленными значениями
         """
-        parts = phrase_name.split('.')
-        current = self
-
-        try:
-            for part in parts:
-                current = getattr(current, part)
-        except AttributeError:
-            raise AttributeError(f'Фраза «{phrase_name}» не найдена')
-
-        if isinstance(current, list):
-            phrase = choice(current)
-        else:
-            phrase = current
-
-        # Заменяем все плейсхолдеры вида {key}
-        for key, value in replacements.items():
-            pattern = re.compile(r'\{\s*' + re.escape(key) + r'\s*}')
-            phrase = pattern.sub(str(value), phrase)
-
-        return phrase
+        template = self._templates.get(self._path + phrase_name)
+        if template is None:
+            raise AttributeError(f'Фраза «{self._path}{phrase_name}» не найдена')
+        if isinstance(template, list):
+            template = choice(template)
+        return template.render(replacements)
 
 
 def __load_phrases(phrases_path: str) -> Phrases:
@@ -0,0 +1,41 @@
+"""Сравнение скорости PHRASES_RU.replace с прежней подстановкой через re (не собирается pytest).
+
+    python -m tests.bench_phrases
+"""
+import re
+import timeit
+from random import choice
+
+from phrases import PHRASES_RU
+
+CASES = [
+    ('template.user_str', {'username': 'user', 'user_id': '123456789'.ljust(12), 'query_stat': '😎 5',
+                           'registration_date': '01.01.2025'}),
+    ('template.master.client_username', {'user_id': 123456789, 'username': 'user'}),
+    ('success.banned', {'user_id': 123456789}),
+    ('footnote.total', {'total': 42}),
+]
+
+
+def legacy_replace(phrase_name: str, **replacements) -> str:
+    current = PHRASES_RU
+    for part in phrase_name.split('.'):
+        current = getattr(current, part)
+    phrase = choice(current) if isinstance(current, list) else current
+    for key, value in replacements.items():
+        pattern = re.compile(r'\{\s*' + re.escape(key) + r'\s*}')
+        phrase = pattern.sub(str(value), phrase)
+    return phrase
+
+
+def main(number: int = 20000):
+    for name, replacements in CASES:
+        assert PHRASES_RU.replace(name, **replacements) == legacy_replace(name, **replacements)
+        legacy = timeit.timeit(lambda: legacy_replace(name, **replacements), number=number)
+        compiled = timeit.timeit(lambda: PHRASES_RU.replace(name, **replacements), number=number)
+        print(f'{name:35} legacy {legacy / number * 1e6:6.2f} us  compiled {compiled / number * 1e6:6.2f} us  '
+              f'x{legacy / compiled:.1f}')
+
+
+if __name__ == '__main__':
+    main()
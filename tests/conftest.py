@@ -0,0 +1,35 @@
+from typing import Callable, Iterable, Type
+
+import pytest
+
+from DB.models import ServiceModel, UserModel
+from DB.tables.base import BaseTable
+from DB.tables.services import ServicesTable
+from DB.tables.users import UsersTable
+
+
+@pytest.fixture
+def make_db(tmp_path) -> Callable[..., str]:
+    """Фабрика тестовых БД во временном каталоге.
+
+    make_db(*tables, users=..., services=...) создаёт таблицы в порядке перечисления,
+    добавляет пользователей и услуги и возвращает путь к файлу БД.
+    """
+    def make(*tables: Type[BaseTable],
+             users: Iterable[UserModel] = (),
+             services: Iterable[ServiceModel] = ()) -> str:
+        path = str(tmp_path / 'test.db')
+        for table in tables:
+            with table(path) as db:
+                db.create_table()
+        if users:
+            with UsersTable(path) as users_db:
+                for user in users:
+                    users_db.add_user(user)
+        if services:
+            with ServicesTable(path) as services_db:
+                for service in services:
+                    services_db.add_service(service)
+        return path
+
+    return make
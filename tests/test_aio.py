@@ -0,0 +1,18 @@
+import asyncio
+
+from DB.aio import AsyncTable
+from DB.models import UserModel
+from DB.tables.users import UsersTable
+
+
+def test_async_table(tmp_path):
+    users = AsyncTable(UsersTable, str(tmp_path / 'test.db'))
+
+    async def scenario():
+        await users.create_table()
+        await users.add_user(UserModel(1, 'first'))
+        return await users.get_user(1), await users.run(lambda db: db.is_exists(2))
+
+    user, exists = asyncio.run(scenario())
+    assert user.username == 'first'
+    assert exists is False
@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from DB.models import ServiceModel, UserModel
+from DB.tables.appointment_photos import AppointmentPhotosTable
+from DB.tables.appointments import AppointmentsTable
+from DB.tables.photos import PhotosTable
+from DB.tables.services import ServicesTable
+from DB.tables.slots import SlotsTable
+from DB.tables.users import UsersTable
+
+
+@pytest.fixture
+def db_path(make_db):
+    return make_db(UsersTable, ServicesTable, SlotsTable, PhotosTable, AppointmentsTable, AppointmentPhotosTable,
+                   users=[UserModel(1, 'client')], services=[ServiceModel(name='service')])
+
+
+def test_photos_loaded_in_one_query(db_path):
+    start = datetime.now() + timedelta(days=1)
+    with SlotsTable(db_path) as slots_db, AppointmentsTable(db_path) as app_db, \
+            PhotosTable(db_path) as photos_db, AppointmentPhotosTable(db_path) as app_photos_db:
+        app_ids = []
+        for i in range(3):
+            _, slot_id = slots_db.add_slot(start + timedelta(hours=i), start + timedelta(hours=i, minutes=30))
+            app_ids.append(app_db.create_appointment(client_id=1, slot_id=slot_id, service_id=1, status='confirmed'))
+        for i, app_id in enumerate(app_ids[:2]):
+            for j in range(i + 1):
+                app_photos_db.add_photo_to_appointment(app_id, photos_db.add_photo(f'file_{i}_{j}', f'unique_{i}_{j}'))
+
+        queries = []
+        app_photos_db.conn.set_trace_callback(queries.append)
+        photos = app_photos_db.get_photos_by_appointments(app_ids)
+        app_photos_db.conn.set_trace_callback(None)
+
+        assert len(queries) == 1
+        assert [len(photos.get(app_id, [])) for app_id in app_ids] == [1, 2, 0]
+
+    with AppointmentsTable(db_path) as app_db:
+        apps, _ = app_db.get_appointments_by_status_and_time_range('confirmed', start, start + timedelta(days=1), 1, 10)
+        assert [[photo.telegram_file_id for photo in app.photos] for app in apps] == [
+            ['file_0_0'], ['file_1_0', 'file_1_1'], []]
@@ -0,0 +1,29 @@
+import gzip
+import os
+import sqlite3
+
+from DB.backup import backup_database
+from DB.models import UserModel
+from DB.tables.users import UsersTable
+
+
+def test_backup_restorable_and_rotated(tmp_path, make_db):
+    db_name = make_db(UsersTable, users=[UserModel(user_id, f'user_{user_id}') for user_id in range(1, 101)])
+    backups_dir = tmp_path / 'backups'
+
+    backups_dir.mkdir()
+    for i, name in enumerate(('test_2000-01-01_00-00-00.db.gz', 'test_2000-01-02_00-00-00.sql.gz')):
+        old = backups_dir / name
+        old.write_bytes(b'')
+        os.utime(old, (i, i))
+
+    backup = backup_database(db_name, backups_dir, keep=2, pages=1)
+
+    restored = tmp_path / 'restored.db'
+    with gzip.open(backup.path, 'rb') as f:
+        restored.write_bytes(f.read())
+    assert len(restored.read_bytes()) == backup.db_size
+    with sqlite3.connect(restored) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM users').fetchone()[0] == 100
+
+    assert sorted(p.name for p in backups_dir.iterdir()) == ['test_2000-01-02_00-00-00.sql.gz', backup.path.name]
@@ -0,0 +1,76 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from DB.aio import AsyncTable
+from DB.cache import CalendarCache, get_calendar_cache
+from DB.models import ServiceModel, UserModel
+from DB.tables.appointments import AppointmentsTable
+from DB.tables.services import ServicesTable
+from DB.tables.slots import SlotsTable
+from DB.tables.users import UsersTable
+from config.const import CONFIRMED
+
+
+@pytest.fixture
+def calendar(make_db, monkeypatch):
+    from bot.keyboards.default import inline
+
+    path = make_db(UsersTable, ServicesTable, SlotsTable, AppointmentsTable,
+                   users=[UserModel(1, 'client')], services=[ServiceModel(name='service')])
+
+    calls = []
+    slots = AsyncTable(SlotsTable, path)
+
+    async def get_available_slots(*args):
+        calls.append(args)
+        return await slots.run(lambda db: db.get_available_slots(*args))
+
+    monkeypatch.setattr(inline.aio, 'slots', type('Slots', (), {'get_available_slots': staticmethod(get_available_slots)}))
+    monkeypatch.setattr(inline.aio, 'appointments', AsyncTable(AppointmentsTable, path))
+    monkeypatch.setattr(inline.aio, 'calendar_cache', get_calendar_cache(path))
+    return inline, path, calls
+
+
+def test_version_guard():
+    cache = CalendarCache(maxsize=10, ttl=60)
+    _, version = cache.get('key')
+    cache.invalidate()  # Изменение во время загрузки
+    cache.fill('key', 'stale', version)
+    assert cache.get('key')[0] is None
+
+    _, version = cache.get('key')
+    cache.fill('key', 'fresh', version)
+    assert cache.get('key') == ('fresh', version)
+
+
+def test_month_served_from_cache_until_change(calendar):
+    inline, path, calls = calendar
+    month_start = (datetime.now().replace(day=1) + timedelta(days=40)).replace(day=1, hour=10, minute=0, second=0,
+                                                                                microsecond=0)
+    end = month_start.replace(day=28)
+    with SlotsTable(path) as db:
+        _, slot_id = db.add_slot(month_start, month_start + timedelta(hours=1))
+
+    async def dates():
+        return await inline._get_available_dates(month_start.year, month_start.month, month_start, end)
+
+    assert asyncio.run(dates()) == ({month_start.date()}, 1)
+    assert asyncio.run(dates()) == ({month_start.date()}, 1)
+    assert len(calls) == 1
+
+    with SlotsTable(path) as db:
+        db.add_slot(month_start + timedelta(days=1), month_start + timedelta(days=1, hours=1))
+    assert asyncio.run(dates())[1] == 2
+    assert len(calls) == 2
+
+    with AppointmentsTable(path) as db:
+        app_id = db.create_appointment(client_id=1, slot_id=slot_id, service_id=1)
+    appointments = asyncio.run(inline._get_appointment_dates(month_start.year, month_start.month, end))
+    assert appointments == (set(), 0, 0)
+
+    with AppointmentsTable(path) as db:
+        db.update_appointment_status(app_id, CONFIRMED)
+    appointments = asyncio.run(inline._get_appointment_dates(month_start.year, month_start.month, end))
+    assert appointments == ({month_start.date()}, 1, 1)
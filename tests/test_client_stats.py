@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from DB.models import ServiceModel, UserModel
+from DB.tables.appointments import AppointmentsTable
+from DB.tables.services import ServicesTable
+from DB.tables.slots import SlotsTable
+from DB.tables.users import UsersTable
+
+
+@pytest.fixture
+def db_path(make_db):
+    path = make_db(UsersTable, ServicesTable, SlotsTable, AppointmentsTable, services=[ServiceModel(name='service')])
+
+    start = datetime.now() + timedelta(days=1)
+    # Клиент 1: 1 запись, клиент 2: 3 записи, клиент 3: 2 записи
+    statuses = {1: ['pending'], 2: ['confirmed', 'cancelled', 'rejected'], 3: ['confirmed', 'pending']}
+    with UsersTable(path) as users_db, SlotsTable(path) as slots_db, AppointmentsTable(path) as app_db:
+        hour = 0
+        for client_id, client_statuses in statuses.items():
+            users_db.add_user(UserModel(client_id, f'client_{client_id}'))
+            for status in client_statuses:
+                _, slot_id = slots_db.add_slot(start + timedelta(hours=hour), start + timedelta(hours=hour, minutes=30))
+                app_db.create_appointment(client_id=client_id, slot_id=slot_id, service_id=1, status=status)
+                hour += 1
+    return path
+
+
+def test_clients_sorted_across_pages_in_one_query(db_path):
+    with AppointmentsTable(db_path) as db:
+        queries = []
+        db.conn.set_trace_callback(queries.append)
+        first_page, pagination = db.get_clients_with_stats(page=1, per_page=2)
+        db.conn.set_trace_callback(None)
+        second_page, _ = db.get_clients_with_stats(page=2, per_page=2)
+
+    assert len(queries) == 1
+    assert pagination.total_items == 3
+    assert pagination.total_pages == 2
+    assert [client.user.user_id for client in first_page + second_page] == [2, 3, 1]
+
+    stats = first_page[0].stats
+    assert (stats.total, stats.upcoming, stats.cancelled, stats.rejected, stats.pending) == (3, 1, 1, 1, 0)
+    assert stats.by_status == {'confirmed': 1, 'cancelled': 1, 'rejected': 1}
+    assert stats.first_appointment < stats.last_appointment
+
+
+def test_page_out_of_range(db_path):
+    with AppointmentsTable(db_path) as db:
+        clients, pagination = db.get_clients_with_stats(page=5, per_page=2)
+    assert clients == []
+    assert pagination.total_items == 3
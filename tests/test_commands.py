@@ -0,0 +1,23 @@
+from bot.bot_utils.routers import AdminRouter, BaseRouter, UserRouter
+
+# Регистрация команд в обработчиках заполняет общий индекс BaseRouter
+import bot.handlers  # noqa: F401
+
+
+def test_find_command_matches_command_filter():
+    admin = next(command for command in BaseRouter.available_commands if command.is_admin)
+    user = next(command for command in BaseRouter.available_commands if not command.is_admin)
+
+    assert BaseRouter.find_command(f'/{admin.name}') is admin
+    assert BaseRouter.find_command(f'/{admin.name.upper()}@some_bot 123') is admin
+    assert BaseRouter.find_command(f'/{user.name}') is user
+    assert BaseRouter.find_command(f'/{admin.name}x') is None
+    assert BaseRouter.find_command(admin.name) is None
+    assert BaseRouter.find_command('/') is None
+
+
+def test_every_alias_indexed():
+    for command in BaseRouter.available_commands:
+        for name in (command.name, *command.aliases):
+            assert BaseRouter.find_command(f'/{name}').is_admin >= command.is_admin
+    assert AdminRouter.commands_index is UserRouter.commands_index
@@ -0,0 +1,94 @@
+import sqlite3
+from datetime import date, datetime, time, timedelta
+
+from DB.backup import backup_changes, backup_database, run_backup
+from DB.models import ServiceModel, UserModel
+from DB.restore import restore
+from DB.tables.appointment_photos import AppointmentPhotosTable
+from DB.tables.appointments import AppointmentsTable
+from DB.tables.changelog import ChangelogTable
+from DB.tables.masters import MastersTable
+from DB.tables.photos import PhotosTable
+from DB.tables.queries import QueriesTable
+from DB.tables.reminders import RemindersTable
+from DB.tables.schedule import ScheduleTable
+from DB.tables.services import ServicesTable
+from DB.tables.slots import SlotsTable
+from DB.tables.users import UsersTable
+
+TABLES = (UsersTable, QueriesTable, SlotsTable, ServicesTable, AppointmentsTable, MastersTable,
+          PhotosTable, AppointmentPhotosTable, RemindersTable, ScheduleTable, ChangelogTable)
+
+
+def _dump(path, table):
+    with sqlite3.connect(path) as conn:
+        return conn.execute(f'SELECT * FROM {table} ORDER BY rowid').fetchall()
+
+
+def test_delta_restores_changes(tmp_path, make_db):
+    db_name = make_db(*TABLES, users=[UserModel(user_id, f'user_{user_id}') for user_id in range(1, 201)],
+                      services=[ServiceModel(name='service')])
+    backups_dir = tmp_path / 'backups'
+
+    full = backup_database(db_name, backups_dir)
+    # Полный бэкап "снят" раньше, чтобы дельта гарантированно шла после него
+    full = full.path.rename(backups_dir / 'test_2000-01-01_00-00-00.db.gz')
+    with ChangelogTable(db_name) as changelog_db:
+        assert changelog_db.last_id() == 0  # Журнал очищен полным бэкапом
+
+    assert backup_changes(db_name, backups_dir) is None
+    with UsersTable(db_name) as users_db, ServicesTable(db_name) as services_db:
+        users_db.update_contact(5, '+70000000000')
+        users_db.update_contact(5, '+71111111111')
+        users_db.delete_user(7)
+        users_db.add_user(UserModel(500, 'new_user'))
+        services_db.add_service(ServiceModel(name='other'))
+    with ScheduleTable(db_name) as schedule_db:
+        schedule_db.set_weekday(1, [(time(10, 0), time(12, 0))])
+        schedule_db.set_day(date(2030, 1, 1), [])
+
+    delta = backup_changes(db_name, backups_dir)
+    assert not delta.is_full
+    assert delta.size < full.stat().st_size
+    assert backup_changes(db_name, backups_dir) is None
+
+    restored = tmp_path / 'restored.db'
+    assert restore(backups_dir, restored, prefix='test') == 1
+    for table in ('users', 'services', 'schedule_windows', 'schedule_exceptions'):
+        assert _dump(restored, table) == _dump(db_name, table)
+    assert _dump(restored, 'changelog') == []
+
+
+def test_run_backup_full_then_delta(tmp_path, make_db):
+    db_name = make_db(*TABLES)
+    backups_dir = tmp_path / 'backups'
+
+    assert run_backup(db_name, backups_dir).is_full
+    with UsersTable(db_name) as users_db:
+        users_db.add_user(UserModel(1, 'user'))
+    assert not run_backup(db_name, backups_dir, full_every=timedelta(days=7)).is_full
+    assert run_backup(db_name, backups_dir, full_every=timedelta(0)).is_full
+
+
+def test_delta_restores_appointment_photos(tmp_path, make_db):
+    db_name = make_db(*TABLES, users=[UserModel(1, 'client')], services=[ServiceModel(name='service')])
+    backups_dir = tmp_path / 'backups'
+    backup_database(db_name, backups_dir).path.rename(backups_dir / 'test_2000-01-01_00-00-00.db.gz')
+
+    start = datetime.now() + timedelta(days=1)
+    with SlotsTable(db_name) as slots_db, AppointmentsTable(db_name) as app_db, PhotosTable(db_name) as photos_db, \
+            AppointmentPhotosTable(db_name) as app_photos_db, RemindersTable(db_name) as reminders_db:
+        _, slot_id = slots_db.add_slot(start, start + timedelta(hours=1))
+        appointment_id = app_db.create_appointment(client_id=1, slot_id=slot_id, service_id=1)
+        for i in range(2):
+            app_photos_db.add_photo_to_appointment(appointment_id, photos_db.add_photo(f'file_{i}', f'unique_{i}'))
+        reminders_db.mark_sent([(appointment_id, '24h')])
+    assert backup_changes(db_name, backups_dir) is not None
+
+    restored = tmp_path / 'restored.db'
+    restore(backups_dir, restored, prefix='test')
+    for table in ('appointments', 'photos', 'appointment_photos', 'reminders_log'):
+        assert _dump(restored, table) == _dump(db_name, table)
+    with AppointmentPhotosTable(str(restored)) as app_photos_db:
+        assert [photo.telegram_file_id for photo in app_photos_db.get_appointment_photos(appointment_id)] == \
+               ['file_0', 'file_1']
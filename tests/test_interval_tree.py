@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from utils.interval_tree import IntervalTree
+
+
+def test_matches_brute_force():
+    rng = random.Random(1)
+    tree = IntervalTree()
+    intervals = {}
+    for key in range(2000):
+        if intervals and rng.random() < 0.3:
+            removed = rng.choice(list(intervals))
+            assert tree.remove(removed)
+            del intervals[removed]
+        start = rng.randrange(10000)
+        end = start + rng.randrange(1, 50)
+        tree.add(start, end, key)
+        intervals[key] = (start, end)
+
+        q_start = rng.randrange(10000)
+        q_end = q_start + rng.randrange(1, 50)
+        expected = sorted(((s, e, k) for k, (s, e) in intervals.items() if s < q_end and q_start < e),
+                          key=lambda interval: (interval[0], interval[2]))
+        assert list(tree.overlapping(q_start, q_end)) == expected
+        assert tree.find_overlap(q_start, q_end) == (expected[0] if expected else None)
+
+    assert len(tree) == len(intervals)
+    assert list(tree) == sorted(((s, e, k) for k, (s, e) in intervals.items()), key=lambda interval: (interval[0], interval[2]))
+
+
+def test_touching_intervals_do_not_overlap():
+    tree = IntervalTree([(10, 20, 'a')])
+    assert tree.find_overlap(20, 30) is None
+    assert tree.find_overlap(0, 10) is None
+    assert tree.find_overlap(19, 30) == (10, 20, 'a')
+    assert not tree.remove('b')
+    with pytest.raises(KeyError):
+        tree.add(0, 5, 'a')
+    with pytest.raises(ValueError):
+        tree.add(5, 5, 'b')
@@ -0,0 +1,68 @@
+import asyncio
+
+from bot.keyboards.cache import MONTH, SERVICES, KeyboardCache
+from utils.metrics import metrics
+
+
+def test_memoized_by_arguments():
+    cache = KeyboardCache({})
+    calls = []
+
+    @cache()
+    def keyboard(page, mode=None):
+        calls.append((page, mode))
+        return object()
+
+    hits = metrics.get('keyboards_cache_hits')
+    assert keyboard(1) is keyboard(1)
+    assert keyboard(1, mode='a') is keyboard(1, mode='a')
+    assert keyboard(2) is not keyboard(1)
+    assert calls == [(1, None), (1, 'a'), (2, None)]
+    assert metrics.get('keyboards_cache_hits') - hits == 3
+
+
+def test_invalidated_by_tag():
+    services = ['one']
+    cache = KeyboardCache({SERVICES: lambda: len(services)})
+
+    @cache(SERVICES)
+    async def service_keyboard():
+        return list(services)
+
+    @cache()
+    def static_keyboard():
+        return object()
+
+    static = static_keyboard()
+    assert asyncio.run(service_keyboard()) == ['one']
+    services.append('two')  # Версия каталога изменилась
+    assert asyncio.run(service_keyboard()) == ['one', 'two']
+    assert static_keyboard() is static
+
+    built = asyncio.run(service_keyboard())
+    cache.invalidate(SERVICES)
+    assert asyncio.run(service_keyboard()) is not built
+
+
+def test_month_rollover():
+    month = [(2025, 1)]
+    cache = KeyboardCache({MONTH: lambda: month[0]})
+
+    @cache(MONTH)
+    def add_slots_menu():
+        return month[0]
+
+    assert add_slots_menu() == (2025, 1)
+    month[0] = (2025, 2)
+    assert add_slots_menu() == (2025, 2)
+
+
+def test_stale_build_not_stored():
+    cache = KeyboardCache({SERVICES: lambda: 0})
+
+    @cache(SERVICES)
+    def keyboard():
+        cache.invalidate(SERVICES)  # Услуги изменились, пока клавиатура строилась
+        return object()
+
+    assert keyboard() is not keyboard()
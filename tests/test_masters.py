@@ -0,0 +1,46 @@
+import pytest
+
+from DB.models import UserModel
+from DB.tables.masters import MastersTable
+from DB.tables.queries import QueriesTable
+from DB.tables.users import UsersTable
+
+
+@pytest.fixture
+def db_path(make_db):
+    path = make_db(UsersTable, QueriesTable, MastersTable, users=[UserModel(1, 'master'), UserModel(2, 'client')])
+    with MastersTable(path) as masters_db:
+        masters_db.set_master_status(1)
+    return path
+
+
+def test_roster_served_from_memory(db_path):
+    with MastersTable(db_path) as db:
+        assert [m.user.user_id for m in db.get_all_masters()] == [1]
+
+        queries = []
+        db.conn.set_trace_callback(queries.append)
+        assert db.get_master(1).user.username == 'master'
+        assert db.get_master(2) is None
+        assert db.is_master(1) and not db.is_master(2)
+        db.conn.set_trace_callback(None)
+    assert queries == []
+
+
+def test_roster_follows_changes(db_path):
+    with MastersTable(db_path) as db:
+        db.get_all_masters()
+        db.set_master_status(2)
+        assert db.is_master(2)
+
+        db.update_current_state(1, message_id=10, current_app_id=5)
+        db.conn.set_trace_callback(pytest.fail)
+        assert (db.get_master(1).message_id, db.get_master(1).current_app_id) == (10, 5)
+        db.conn.set_trace_callback(None)
+
+    with UsersTable(db_path) as users_db:
+        users_db.add_user(UserModel(1, 'renamed'))
+    with MastersTable(db_path) as db:
+        assert db.get_master(1).user.username == 'renamed'
+        db.set_master_status(1, False)
+        assert db.get_master(1) is None
@@ -0,0 +1,123 @@
+import asyncio
+
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMessage
+
+from bot.bot_utils.outbox import Outbox
+
+
+def _run(scenario, **kwargs):
+    async def main():
+        outbox = Outbox(**kwargs)
+        outbox.start()
+        try:
+            return await scenario(outbox)
+        finally:
+            await outbox.stop()
+
+    return asyncio.run(main())
+
+
+def test_order_kept_within_chat():
+    sent = []
+
+    async def scenario(outbox):
+        def send(chat_id, text):
+            async def call():
+                await asyncio.sleep(0.01 if text == 'first' else 0)
+                sent.append((chat_id, text))
+                return text
+            return outbox.call(chat_id, call)
+
+        return await asyncio.gather(send(1, 'first'), send(1, 'second'), send(2, 'other'))
+
+    assert _run(scenario, workers=3, rate=100, chat_rate=100, chat_burst=10) == ['first', 'second', 'other']
+    assert [text for chat_id, text in sent if chat_id == 1] == ['first', 'second']
+
+
+def test_pending_edits_merged():
+    calls = []
+
+    async def scenario(outbox):
+        def edit(text):
+            async def call():
+                calls.append(text)
+                return text
+            return outbox.call(1, call, edit_of=10)
+
+        blocker = outbox.call(1, lambda: asyncio.sleep(0.05))  # Занимает чат, пока правки копятся в очереди
+        return await asyncio.gather(blocker, edit('v1'), edit('v2'), edit('v3'))
+
+    assert _run(scenario, workers=2, rate=100, chat_rate=100, chat_burst=10)[1:] == ['v3', 'v3', 'v3']
+    assert calls == ['v3']
+
+
+def test_retry_after_respected():
+    attempts = []
+
+    async def scenario(outbox):
+        async def call():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise TelegramRetryAfter(SendMessage(chat_id=1, text='x'), 'Flood control', retry_after=0)
+            return 'ok'
+
+        return await outbox.call(1, call)
+
+    assert _run(scenario, workers=1, rate=100, chat_rate=100, chat_burst=10) == 'ok'
+    assert len(attempts) == 2
+
+
+def test_busy_chat_does_not_block_others():
+    async def scenario(outbox):
+        loop = asyncio.get_running_loop()
+
+        async def send():
+            return loop.time()
+
+        started = loop.time()
+        burst = [asyncio.ensure_future(outbox.call(1, send)) for _ in range(8)]
+        other = await outbox.call(2, send)
+        await outbox.stop(timeout=0)  # Не ждём, пока чат 1 отправит всё с частотой 1 в секунду
+        await asyncio.gather(*burst, return_exceptions=True)
+        return other - started
+
+    assert _run(scenario, workers=4, rate=30, chat_rate=1, chat_burst=3) < 0.5
+
+
+def test_retry_after_does_not_hold_worker():
+    async def scenario(outbox):
+        loop = asyncio.get_running_loop()
+        attempts = []
+
+        async def flooded():
+            attempts.append(loop.time())
+            if len(attempts) == 1:
+                raise TelegramRetryAfter(SendMessage(chat_id=1, text='x'), 'Flood control', retry_after=1)
+            return 'ok'
+
+        async def send():
+            return loop.time()
+
+        started = loop.time()
+        first = asyncio.ensure_future(outbox.call(1, flooded))
+        await asyncio.sleep(0.05)
+        other = await outbox.call(2, send)
+        assert await first == 'ok'
+        return other - started, attempts[1] - attempts[0]
+
+    other, retried = _run(scenario, workers=1, rate=100, chat_rate=100, chat_burst=10)
+    assert other < 0.5
+    assert retried >= 1
+
+
+def test_stop_fails_unsent():
+    async def scenario(outbox):
+        futures = [asyncio.ensure_future(outbox.call(1, lambda: asyncio.sleep(0))) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        await outbox.stop(timeout=0.1)
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    results = _run(scenario, workers=1, rate=100, chat_rate=1, chat_burst=1)
+    assert results[0] is None
+    assert all(isinstance(result, RuntimeError) for result in results[1:])
@@ -0,0 +1,60 @@
+import pytest
+
+from DB.models import UserModel
+from DB.tables.queries import QueriesTable
+from DB.tables.users import UsersTable
+
+
+@pytest.fixture
+def db_path(make_db):
+    path = make_db(UsersTable, QueriesTable, users=[UserModel(user_id, f'user_{user_id}') for user_id in range(1, 12)])
+    with UsersTable(path) as users_db:
+        # Часть пользователей с одинаковой датой регистрации - порядок внутри неё задаёт user_id
+        users_db.cursor.execute("UPDATE users SET registration_date = '2024-01-01 10:00:00' WHERE user_id % 3 = 0")
+    return path
+
+
+def _ids(users):
+    return [user.user_id for user in users]
+
+
+def test_keyset_pages_match_offset_pages(db_path):
+    with UsersTable(db_path) as db:
+        expected = [_ids(db.get_all_users(page, 3)[0]) for page in range(1, 5)]
+
+        users, pagination = db.get_all_users(1, 3)
+        walked = [_ids(users)]
+        for page in range(2, 5):
+            users, pagination = db.get_all_users(page, 3, anchor=pagination.last_key, total=pagination.total_items)
+            walked.append(_ids(users))
+        assert walked == expected
+
+        for page in range(3, 0, -1):
+            users, pagination = db.get_all_users(page, 3, anchor=pagination.first_key, step=-1,
+                                                 total=pagination.total_items)
+            assert _ids(users) == expected[page - 1]
+
+
+def test_known_total_skips_count_and_offset(db_path):
+    with UsersTable(db_path) as db:
+        _, pagination = db.get_all_users(1, 3)
+
+        queries = []
+        db.conn.set_trace_callback(queries.append)
+        _, next_page = db.get_all_users(2, 3, anchor=pagination.last_key, total=pagination.total_items)
+        db.conn.set_trace_callback(None)
+
+    assert len(queries) == 1
+    assert 'OFFSET' not in queries[0]
+    assert next_page.total_items == 11
+    assert next_page.total_pages == 4
+
+
+def test_deleted_anchor_falls_back_to_offset(db_path):
+    with UsersTable(db_path) as db:
+        users, pagination = db.get_all_users(1, 3)
+        db.delete_user(pagination.last_key)
+        expected, _ = db.get_all_users(2, 3)
+
+        users, _ = db.get_all_users(2, 3, anchor=pagination.last_key)
+    assert _ids(users) == _ids(expected)
@@ -0,0 +1,41 @@
+import pytest
+
+from phrases import PHRASES_RU, Phrases, Template
+
+
+def test_template_render():
+    template = Template('<a href="tg://user?id={user_id}">{ user_id }</a> {username} {unknown}')
+    assert template.render({'user_id': 7, 'username': '{user_id}'}) == '<a href="tg://user?id=7">7</a> {user_id} {unknown}'
+    assert template.render({}) == template.text
+    assert Template(100).render({'x': 1}) == 100
+
+
+def test_replace_by_path():
+    phrases = Phrases({'success': {'banned': 'Пользователь {user_id} заблокирован'}, 'variants': ['a {x}', 'b {x}']})
+    assert phrases.replace('success.banned', user_id=5) == 'Пользователь 5 заблокирован'
+    assert phrases.replace('variants', x=1) in ('a 1', 'b 1')
+    assert phrases.success.banned == 'Пользователь {user_id} заблокирован'
+    with pytest.raises(AttributeError):
+        phrases.replace('success.missing')
+
+
+def test_real_phrases_compiled():
+    assert PHRASES_RU.replace('success.banned', user_id=42).count('42') == 2
+
+
+def test_registry_lookup_and_variants():
+    phrases = Phrases({'icon': {'ok': '✅', 'limits': {'🔥': 50, '😎': 5}}, 'answer': {'unknown': ['a', 'b']}})
+    assert phrases['icon.ok'] == phrases.icon.ok == phrases.icon['ok'] == '✅'
+    assert {phrases.answer.unknown for _ in range(50)} == {'a', 'b'}
+    assert phrases['answer.unknown'] in ('a', 'b')
+    assert list(phrases.icon.limits.items()) == [('🔥', 50), ('😎', 5)]
+    with pytest.raises(KeyError):
+        phrases['icon.missing']
+    with pytest.raises(AttributeError):
+        phrases.icon.ok = '❌'
+
+
+@pytest.mark.parametrize('data', [{'_private': 'x'}, {'replace': 'x'}, {'a.b': 'x'}, {'variants': []}])
+def test_invalid_keys_rejected(data):
+    with pytest.raises(ValueError):
+        Phrases(data)
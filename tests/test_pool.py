@@ -0,0 +1,96 @@
+import threading
+import time
+
+import pytest
+
+from config import DBConfig
+from DB.models import UserModel
+from DB.tables.pool import ConnectionPool, PoolTimeoutError, apply_pragmas, read_pragmas
+from DB.tables.users import UsersTable
+
+
+@pytest.fixture
+def db_path(make_db):
+    return make_db(UsersTable)
+
+
+def test_connection_reused(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'pool.db'), pool_size=2, max_overflow=0)
+    conn = pool.acquire()
+    pool.release(conn)
+    assert pool.acquire() is conn
+
+    stats = pool.stats()
+    assert stats.created == 1
+    assert stats.reused == 1
+    assert stats.in_use == 1
+
+
+def test_overflow_closed_on_release(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'pool.db'), pool_size=1, max_overflow=1)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+
+    stats = pool.stats()
+    assert stats.overflow == 1
+    assert stats.idle == 1
+    assert stats.closed == 1
+
+
+def test_timeout_when_exhausted(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'pool.db'), pool_size=1, max_overflow=0, timeout=0.05)
+    pool.acquire()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+    assert pool.stats().timeouts == 1
+
+
+def test_waiter_gets_released_connection(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'pool.db'), pool_size=1, max_overflow=0, timeout=5)
+    conn = pool.acquire()
+    acquired = []
+
+    worker = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    worker.start()
+    time.sleep(0.1)
+    pool.release(conn)
+    worker.join(timeout=5)
+
+    assert acquired == [conn]
+    assert pool.stats().waits == 1
+
+
+def test_table_commit_and_rollback(db_path):
+    with UsersTable(db_path) as users_db:
+        users_db.add_user(UserModel(1, 'first'))
+
+    with pytest.raises(RuntimeError):
+        with UsersTable(db_path) as users_db:
+            users_db.cursor.execute("INSERT INTO users (user_id, username) VALUES (2, 'second')")
+            raise RuntimeError
+
+    with UsersTable(db_path) as users_db:
+        assert users_db.get_user(1).username == 'first'
+        assert users_db.get_user(2) is None
+
+
+def test_pragmas_applied_on_connect(tmp_path):
+    cfg = DBConfig(journal_mode='WAL', synchronous='NORMAL', busy_timeout=1234,
+                   cache_size=-2000, mmap_size=0, temp_store='MEMORY')
+    pool = ConnectionPool(str(tmp_path / 'pool.db'), on_connect=lambda conn: apply_pragmas(conn, cfg))
+    settings = read_pragmas(pool.acquire())
+
+    assert settings['journal_mode'] == 'wal'
+    assert settings['synchronous'] == 1  # NORMAL
+    assert settings['busy_timeout'] == 1234
+    assert settings['cache_size'] == -2000
+    assert settings['temp_store'] == 2  # MEMORY
+
+
+def test_invalid_pragma_rejected(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'pool.db'),
+                          on_connect=lambda conn: apply_pragmas(conn, DBConfig(journal_mode='WAL; DROP')))
+    with pytest.raises(ValueError):
+        pool.acquire()
+    assert pool.stats().size == 0
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from DB.models import QueryModel, UserModel
+from DB.query_log import QueryLogWriter
+from DB.tables.queries import QueriesTable
+from DB.tables.users import UsersTable
+from utils.metrics import metrics
+
+
+@pytest.fixture
+def db_path(make_db):
+    return make_db(UsersTable, QueriesTable, users=[UserModel(1, 'first')])
+
+
+def _count(db_path):
+    with QueriesTable(db_path) as db:
+        return db.cursor.execute('SELECT COUNT(*) FROM queries').fetchone()[0]
+
+
+def test_batches_written_on_size_and_stop(db_path):
+    writer = QueryLogWriter(db_path, batch_size=3, flush_interval=60)
+
+    async def scenario():
+        writer.start()
+        written = []
+        for i in range(4):
+            writer.add(QueryModel(1, f'query {i}'))
+            await asyncio.sleep(0.1)
+            written.append(_count(db_path))
+        await writer.stop()
+        return written
+
+    assert asyncio.run(scenario()) == [0, 0, 3, 3]  # Сброс, когда набралась пачка
+    assert _count(db_path) == 4  # Остаток - при остановке
+
+    with QueriesTable(db_path) as db:
+        queries, _ = db.get_user_queries(1, 1, 10)
+    assert [q.query_text for q in queries][::-1] == [f'query {i}' for i in range(4)]
+
+
+def test_overflow_dropped(db_path):
+    writer = QueryLogWriter(db_path, batch_size=10, max_queue=2)
+    dropped = metrics.get('query_log_dropped')
+    for i in range(3):
+        writer.add(QueryModel(1, f'query {i}'))
+
+    asyncio.run(writer.stop())
+    assert metrics.get('query_log_dropped') == dropped + 1
+    assert _count(db_path) == 2
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+import pytest
+
+from DB.tables.appointments import AppointmentsTable
+from DB.tables.queries import QueriesTable
+from DB.tables.slots import SlotsTable
+from DB.tables.users import UsersTable
+
+
+@pytest.fixture
+def db_path(make_db):
+    path = make_db(SlotsTable, AppointmentsTable)
+    with SlotsTable(path) as slots_db:
+        start = datetime.now() - timedelta(days=700)
+        slots_db.cursor.executemany(
+            'INSERT INTO slots (start_time, end_time, is_available) VALUES (?, ?, 0)',
+            [(start + timedelta(hours=8 * i), start + timedelta(hours=8 * i + 2)) for i in range(3000)])
+        slots_db.cursor.executemany(
+            "INSERT INTO appointments (client_id, slot_id, service_id, status) VALUES (?, ?, 1, ?)",
+            [(i % 300, i, 'cancelled' if i % 10 == 0 else 'confirmed') for i in range(1, 3001)])
+        slots_db.conn.commit()
+        slots_db.cursor.execute('ANALYZE')
+    return path
+
+
+def _plans(table, call: Callable[[], object]) -> List[str]:
+    """Выполняет метод таблицы и возвращает EXPLAIN QUERY PLAN всех его SELECT-запросов"""
+    queries = []
+    table.conn.set_trace_callback(queries.append)
+    try:
+        call()
+    finally:
+        table.conn.set_trace_callback(None)
+    return [
+        ' | '.join(row['detail'] for row in table.conn.execute(f'EXPLAIN QUERY PLAN {query}'))
+        for query in queries if query.lstrip().upper().startswith('SELECT')
+    ]
+
+
+def test_slots_queries_use_indexes(db_path):
+    now = datetime.now()
+    with SlotsTable(db_path) as db:
+        plans = _plans(db, lambda: db.get_available_slots(now, now + timedelta(days=30)))
+        assert plans
+        for plan in plans:
+            assert 'USING COVERING INDEX idx_slots_availability' in plan
+        plans = _plans(db, db.get_first_available_slot)
+        assert plans
+        for plan in plans:
+            assert 'USING COVERING INDEX idx_slots_availability' in plan
+        # Пересечения проверяются по индексу в памяти: таблица читается один раз при его загрузке
+        assert len(_plans(db, lambda: db.add_slot(now + timedelta(hours=1), now + timedelta(hours=2)))) == 1
+        assert _plans(db, lambda: db.add_slot(now + timedelta(hours=3), now + timedelta(hours=4))) == []
+
+
+@pytest.mark.parametrize('method', [
+    lambda db, now: db.count_appointments(),
+    lambda db, now: db.get_slot_times_by_status('confirmed', now, now + timedelta(days=30)),
+])
+def test_appointments_time_range_uses_slots_index(db_path, method):
+    with AppointmentsTable(db_path) as db:
+        plans = _plans(db, lambda: method(db, datetime.now()))
+        assert plans
+        for plan in plans:
+            assert 'idx_slots_start_time' in plan
+            assert 'SCAN' not in plan
+
+
+@pytest.fixture
+def users_db_path(make_db):
+    path = make_db(UsersTable, QueriesTable)
+    with UsersTable(path) as users_db:
+        start = datetime.now() - timedelta(days=700)
+        users_db.cursor.executemany(
+            'INSERT INTO users (user_id, username, registration_date) VALUES (?, ?, ?)',
+            [(i, f'user_{i}', start + timedelta(hours=i // 3)) for i in range(1, 3001)])
+        users_db.cursor.executemany(
+            'INSERT INTO queries (user_id, query_text) VALUES (?, ?)',
+            [(i % 3000 + 1, 'text') for i in range(20000)])
+        users_db.conn.commit()
+        users_db.cursor.execute('ANALYZE')
+    return path
+
+
+def test_users_page_walks_registration_index(users_db_path):
+    with UsersTable(users_db_path) as db:
+        # Первая страница (OFFSET) - обход индекса по порядку, без сортировки всей таблицы
+        plans = _plans(db, lambda: db.get_all_users(1, 10))
+        assert plans
+        assert 'SCAN u USING INDEX idx_users_registration' in plans[0]
+        assert 'TEMP B-TREE' not in plans[0]
+
+        _, pagination = db.get_all_users(2, 10)
+        for step, anchor in ((1, pagination.last_key), (-1, pagination.first_key)):
+            plans = _plans(db, lambda: db.get_all_users(2 + step, 10, anchor=anchor, step=step,
+                                                        total=pagination.total_items))
+            assert len(plans) == 1  # Без отката к OFFSET
+            assert 'SEARCH u USING INDEX idx_users_registration' in plans[0]
+            assert 'SCAN u' not in plans[0]
+            assert 'TEMP B-TREE' not in plans[0]
@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from DB.aio import AsyncTable
+from DB.models import ServiceModel, UserModel
+from DB.tables.appointments import AppointmentsTable
+from DB.tables.reminders import RemindersTable
+from DB.tables.services import ServicesTable
+from DB.tables.slots import SlotsTable
+from DB.tables.users import UsersTable
+from utils.timing_wheel import TimingWheel
+
+OFFSETS = {'24h': 24 * 60, '1h': 60}
+
+
+@pytest.fixture
+def db_path(make_db):
+    path = make_db(UsersTable, ServicesTable, SlotsTable, AppointmentsTable, RemindersTable,
+                   users=[UserModel(1, 'client')], services=[ServiceModel(name='service')])
+
+    start = datetime.now().replace(second=0, microsecond=0)
+    with SlotsTable(path) as slots_db, AppointmentsTable(path) as app_db:
+        # Запись 1 - через 90 минут, 2 - через 25 часов, 3 - через 105 минут, но не подтверждена
+        for hours, status in ((1.5, 'confirmed'), (25, 'confirmed'), (1.75, 'pending')):
+            _, slot_id = slots_db.add_slot(start + timedelta(hours=hours), start + timedelta(hours=hours + 0.25))
+            app_db.create_appointment(client_id=1, slot_id=slot_id, service_id=1, status=status)
+    return path
+
+
+def test_timing_wheel():
+    wheel = TimingWheel(slots=10, resolution=60, start=0)
+    assert wheel.add('a', 120)
+    assert wheel.add('b', 300)
+    assert wheel.add('late', -500)  # Просроченный - на следующем шаге
+    assert not wheel.add('far', 60 * 10)  # За горизонтом
+    wheel.add('b', 130)  # Перенос
+    wheel.discard('a')
+
+    assert wheel.advance(60) == ['late']
+    assert wheel.advance(200) == ['b']
+    assert len(wheel) == 0
+    assert wheel.add('far', 60 * 10)
+
+
+def test_due_reminders_skip_sent(db_path):
+    now = datetime.now()
+    with RemindersTable(db_path) as db:
+        due = db.get_due_reminders(OFFSETS, now - timedelta(minutes=30), now + timedelta(hours=2), now)
+        assert sorted((app_id, kind) for app_id, kind, _ in due) == [(1, '1h'), (2, '24h')]
+
+        db.mark_sent([(1, '1h')])
+        due = db.get_due_reminders(OFFSETS, now - timedelta(minutes=30), now + timedelta(hours=2), now)
+        assert [(app_id, kind) for app_id, kind, _ in due] == [(2, '24h')]
+
+
+def test_dispatcher_sends_batch_once(db_path, monkeypatch):
+    from bot import reminders as module
+
+    sent = []
+
+    async def send_reminder(appointment_id, kind):
+        sent.append((appointment_id, kind))
+
+    monkeypatch.setattr(module, 'send_reminder', send_reminder)
+    monkeypatch.setattr(module.aio, 'reminders', AsyncTable(RemindersTable, db_path))
+
+    dispatcher = module.ReminderDispatcher(OFFSETS, horizon_minutes=120)
+    dispatcher.cancel(2)
+
+    async def scenario():
+        await dispatcher.tick()
+        assert len(dispatcher.wheel) == 1  # Отменённая запись 2 не загружена
+        await dispatcher.tick()
+        # Сдвигаем колесо на час вперёд вместо ожидания
+        monkeypatch.setattr(module, 'datetime', type('Later', (datetime,), {
+            'now': classmethod(lambda cls: datetime.now() + timedelta(hours=1))}))
+        await dispatcher.tick()
+        await dispatcher.tick()
+
+    asyncio.run(scenario())
+    assert sent == [(1, '1h')]
+
+
+def test_purge_past_reminders(db_path):
+    now = datetime.now()
+    with RemindersTable(db_path) as db:
+        db.mark_sent([(1, '1h'), (2, '24h'), (404, '1h')])  # Запись 404 не существует
+        assert db.purge_past(now) == 1
+        assert db.purge_past(now + timedelta(hours=2)) == 1  # Запись 1 началась
+        db.cursor.execute('SELECT appointment_id FROM reminders_log')
+        assert [row['appointment_id'] for row in db.cursor.fetchall()] == [2]
@@ -0,0 +1,61 @@
+import time as timer
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from DB.tables.schedule import ScheduleTable
+from utils import format_list
+
+
+@pytest.fixture
+def db_path(make_db):
+    return make_db(ScheduleTable)
+
+
+def _legacy_slots(start: date, end: date):
+    """Слоты, которые генерировались до появления шаблона"""
+    windows = [(time(11, 0), time(14, 0)), (time(14, 30), time(17, 30)), (time(18, 0), time(21, 0))]
+    day = start
+    while day <= end:
+        if day.weekday() not in (1, 5):
+            for s, e in windows:
+                yield datetime.combine(day, s), datetime.combine(day, e)
+        day += timedelta(days=1)
+
+
+def test_default_template_matches_legacy_schedule(db_path):
+    with ScheduleTable(db_path) as schedule_db:
+        template = schedule_db.get_template()
+    start, end = date(2030, 1, 1), date(2030, 12, 31)
+    assert list(template.expand(start, end)) == list(_legacy_slots(start, end))
+
+    slots = format_list.generate_slots_for_month(2, 2030, template)
+    assert [(slot.start_time, slot.end_time) for slot in slots] == list(_legacy_slots(date(2030, 2, 1), date(2030, 2, 28)))
+
+
+def test_exceptions_and_weekday_windows(db_path):
+    holiday, short_day = date(2030, 1, 7), date(2030, 1, 8)  # Понедельник и вторник (выходной по шаблону)
+    with ScheduleTable(db_path) as schedule_db:
+        schedule_db.set_weekday(2, [(time(10, 0), time(12, 0))])
+        schedule_db.set_day(holiday, [])
+        schedule_db.set_day(short_day, [(time(12, 0), time(13, 0))])
+        with pytest.raises(ValueError):
+            schedule_db.set_day(short_day, [(time(12, 0), time(14, 0)), (time(13, 0), time(15, 0))])
+        template = schedule_db.get_template()
+
+    slots = list(template.expand(holiday, date(2030, 1, 9)))
+    assert slots == [(datetime(2030, 1, 8, 12), datetime(2030, 1, 8, 13)),
+                     (datetime(2030, 1, 9, 10), datetime(2030, 1, 9, 12))]
+
+    with ScheduleTable(db_path) as schedule_db:
+        assert schedule_db.clear_day(holiday)
+        assert len(list(schedule_db.get_template().expand(holiday, holiday))) == 3
+
+
+def test_expand_year_is_fast(db_path):
+    with ScheduleTable(db_path) as schedule_db:
+        template = schedule_db.get_template()
+    started = timer.perf_counter()
+    slots = sum(1 for _ in template.expand(date(2030, 1, 1), date(2039, 12, 31)))
+    assert slots > 5000
+    assert timer.perf_counter() - started < 1
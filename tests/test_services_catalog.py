@@ -0,0 +1,49 @@
+import pytest
+
+from DB.cache import get_services_catalog
+from DB.models import ServiceModel
+from DB.tables.services import ServicesTable
+
+
+@pytest.fixture
+def db_path(make_db):
+    return make_db(ServicesTable,
+                   services=[ServiceModel(name='однотон', price=1000), ServiceModel(name='дизайн', price=1500)])
+
+
+def test_reads_served_from_snapshot(db_path):
+    catalog = get_services_catalog(db_path)
+    with ServicesTable(db_path) as db:
+        snapshot = db.get_snapshot()
+        assert [s.name for s in db.get_all_services()] == ['однотон', 'дизайн']
+        # Запись в обход таблицы не видна - чтение идёт из памяти
+        db.cursor.execute("UPDATE services SET name = 'x'")
+        assert db.get_service(1) is snapshot.by_id[1]
+        assert db.get_service(1).name == 'однотон'
+        assert db.get_service(99) is None
+    assert catalog.version == snapshot.version
+
+
+def test_rebuilt_on_change(db_path):
+    catalog = get_services_catalog(db_path)
+    with ServicesTable(db_path) as db:
+        before = db.get_snapshot()
+        db.toggle_service_active(1, False)
+        after, version = catalog.snapshot()  # Перестроен сразу, без ожидания следующего чтения
+        assert after is not None and after.version == version > before.version
+        assert [s.id for s in after.active] == [2]
+        assert before.by_id[1].is_active  # Старый снимок не изменился
+
+        db.update_service(ServiceModel(id=2, name='дизайн+', price=2000))
+        db.add_service(ServiceModel(name='снятие'))
+        assert [s.name for s in db.get_active_services()] == ['дизайн+', 'снятие']
+        assert catalog.version == db.get_snapshot().version
+
+
+def test_stale_load_not_published(db_path):
+    catalog = get_services_catalog(db_path)
+    catalog.invalidate()
+    _, version = catalog.snapshot()
+    catalog.invalidate()  # Изменение во время загрузки
+    catalog.fill([ServiceModel(name='stale', id=1)], version)
+    assert catalog.snapshot()[0] is None
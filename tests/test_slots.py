@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from DB import cache
+from DB.tables.slots import SlotsTable
+
+
+@pytest.fixture
+def db_path(make_db):
+    return make_db(SlotsTable)
+
+
+def _msk_now() -> datetime:
+    return datetime.utcnow() + timedelta(hours=3)
+
+
+def test_reads_do_not_write(db_path):
+    now = _msk_now()
+    with SlotsTable(db_path) as slots_db:
+        _, future_id = slots_db.add_slot(now + timedelta(days=1), now + timedelta(days=1, hours=2))
+        _, past_id = slots_db.add_slot(now - timedelta(hours=1), now + timedelta(hours=1))
+        # Слот стал прошедшим, но очистка ещё не выполнялась
+        slots_db.cursor.execute('UPDATE slots SET is_available = 1 WHERE id = ?', (past_id,))
+        slots_db.conn.commit()
+
+        changes = slots_db.conn.total_changes
+        assert [slot.id for slot in slots_db.get_available_slots()] == [future_id]
+        assert slots_db.get_first_available_slot() == slots_db.get_slot(future_id).start_time
+        assert slots_db.is_available(past_id) is False
+        assert slots_db.get_slot(past_id).is_available is False
+        assert slots_db.conn.total_changes == changes
+
+
+def test_sweep_past_slots(db_path):
+    now = _msk_now()
+    with SlotsTable(db_path) as slots_db:
+        _, slot_id = slots_db.add_slot(now - timedelta(hours=1), now + timedelta(hours=1))
+        slots_db.cursor.execute('UPDATE slots SET is_available = 1 WHERE id = ?', (slot_id,))
+        slots_db.conn.commit()
+
+        assert slots_db.sweep_past_slots() == 1
+        assert slots_db.sweep_past_slots() == 0
+
+
+def test_add_slots_bulk(db_path):
+    start = _msk_now().replace(second=0, microsecond=0) + timedelta(days=1)
+    hour = timedelta(hours=1)
+    with SlotsTable(db_path) as slots_db:
+        _, existing_id = slots_db.add_slot(start, start + hour)
+        results = slots_db.add_slots([
+            (start + hour, start + 2 * hour),
+            (start, start + hour),  # Уже есть в БД
+            (start + 2 * hour, start + hour),  # Конец раньше начала
+            (start + 3 * hour, start + 4 * hour),
+            (start + hour, start + 2 * hour),  # Повтор в списке
+        ])
+
+        assert [(ok, start_time) for ok, _, start_time, _ in results] == [
+            (True, start + hour), (False, start), (False, start + 2 * hour), (True, start + 3 * hour), (False, start + hour)]
+        for ok, slot_id, start_time, _ in results:
+            if ok:
+                assert slots_db.get_slot(slot_id).start_time == start_time
+        assert len({slot_id for ok, slot_id, *_ in results if ok} | {existing_id}) == 3
+        assert len(slots_db.get_available_slots()) == 3
+
+
+def test_overlapping_slots_rejected(db_path):
+    start = _msk_now().replace(second=0, microsecond=0) + timedelta(days=1)
+    hour = timedelta(hours=1)
+    with SlotsTable(db_path) as slots_db:
+        _, slot_id = slots_db.add_slot(start, start + 3 * hour)
+        ok, error = slots_db.add_slot(start + hour, start + 4 * hour)
+        assert not ok and 'пересекается' in error
+        assert slots_db.add_slot(start + 3 * hour, start + 4 * hour)[0]  # Касание концами - не пересечение
+
+        errors = slots_db.check_slots([
+            (start - hour, start),
+            (start - 2 * hour, start + hour),  # С существующим слотом
+            (start + 5 * hour, start + 7 * hour),
+            (start + 6 * hour, start + 8 * hour),  # Со слотом выше в списке
+        ])
+        assert errors[0] is None and errors[2] is None
+        assert errors[1].endswith(f"{start.strftime('%d.%m.%Y %H:%M')}-{(start + 3 * hour).strftime('%H:%M')}")
+        assert errors[3].endswith(f"{(start + 5 * hour).strftime('%d.%m.%Y %H:%M')}-{(start + 7 * hour).strftime('%H:%M')}")
+        results = slots_db.add_slots([(start + hour, start + 2 * hour), (start + 5 * hour, start + 6 * hour)])
+        assert [ok for ok, *_ in results] == [False, True]
+
+        assert slots_db.delete_slot(slot_id)[0]
+        assert slots_db.add_slot(start + hour, start + 2 * hour)[0]
+
+    cache._slot_indexes.pop(db_path)  # Как после перезапуска: индекс читается из БД
+    with SlotsTable(db_path) as slots_db:
+        assert slots_db.load_slot_index() == 3
+        assert not slots_db.add_slot(start + hour + timedelta(minutes=30), start + 4 * hour)[0]
@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+from DB.models import UserModel
+from DB.tables.queries import QueriesTable
+from DB.tables.users import UsersTable
+from utils.cache import TTLCache
+
+
+@pytest.fixture
+def db_path(make_db):
+    return make_db(UsersTable, QueriesTable, users=[UserModel(1, 'first')])
+
+
+def test_returning_user_read_from_cache(db_path):
+    with UsersTable(db_path) as db:
+        queries = []
+        db.conn.set_trace_callback(queries.append)
+        user = db.get_user(1)
+        same = db.add_user(UserModel(1, 'first'))
+        db.conn.set_trace_callback(None)
+
+    assert user.username == 'first'
+    assert same is user
+    assert queries == []
+
+
+def test_writes_update_cache(db_path):
+    with UsersTable(db_path) as db:
+        db.get_user(1)
+        db.set_ban_status(1, banned_by=2)
+        db.set_admin(1, set_by=2)
+        db.update_contact(1, '+70000000000')
+        db.add_user(UserModel(1, 'renamed'))
+
+    with UsersTable(db_path) as db:
+        db.conn.set_trace_callback(pytest.fail)
+        user = db.get_user(1)
+        db.conn.set_trace_callback(None)
+    assert (user.username, user.is_banned, user.is_admin, user.contact) == ('renamed', True, True, '+70000000000')
+
+    with UsersTable(db_path) as db:
+        db.delete_user(1)
+        assert db.get_user(1) is None
+
+
+def test_lru_eviction_and_ttl():
+    cache = TTLCache('test', maxsize=2, ttl=0.05)
+    cache.set(1, 'a')
+    cache.set(2, 'b')
+    cache.get(1)
+    cache.set(3, 'c')
+    assert cache.get(2) is None
+    assert cache.get(1) == 'a'
+
+    time.sleep(0.06)
+    assert cache.get(1) is None
+    assert len(cache) == 1
@@ -0,0 +1,55 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+from utils.metrics import metrics
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class TTLCache(Generic[K, V]):
+    """Потокобезопасный LRU-кэш с ограниченным размером и временем жизни записей.
+
+    При переполнении вытесняется давно не использовавшаяся запись, устаревшая запись
+    удаляется при обращении к ней. Попадания и промахи считаются в метриках ``<name>_cache_*``.
+    """
+
+    def __init__(self, name: str, maxsize: int = 1024, ttl: float = 300.0):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: 'OrderedDict[K, Tuple[float, V]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[0] > time.monotonic():
+                self._data.move_to_end(key)
+                metrics.inc(f'{self.name}_cache_hits')
+                return item[1]
+            if item is not None:
+                del self._data[key]
+        metrics.inc(f'{self.name}_cache_misses')
+        return None
+
+    def set(self, key: K, value: V):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                metrics.inc(f'{self.name}_cache_evictions')
+
+    def pop(self, key: K):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,19 +1,23 @@
+import asyncio
+import logging
 from datetime import datetime
-from typing import List, Tuple
-import subprocess
+from typing import Iterable, Tuple
 from aiogram import Bot
 from aiogram.types import FSInputFile
 
+from DB.backup import run_backup
 from DB.tables.slots import SlotsTable
 from config import const
+from utils.metrics import metrics
 
+logger = logging.getLogger(__name__)
 
-def add_slots_from_list(slots: List[Tuple[datetime, datetime]]):
+
+def add_slots_from_list(slots: Iterable[Tuple[datetime, datetime]]):
     added_slots = []
     not_added_slots = []
     with SlotsTable() as db:
-        for start, end in slots:
-            success, result = db.add_slot(start, end)
+        for success, result, start, end in db.add_slots(list(slots)):
             if success:
                 added_slots.append((result, start, end))
             else:
@@ -40,35 +44,23 @@ def add_slots_from_list(slots: List[Tuple[datetime, datetime]]):
 
 async def backup_db(bot: Bot):
     try:
-        backups_dir = const.BASE_DIR / "backups"
-        backups_dir.mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-        backup_path = backups_dir / f"z_users_{timestamp}.sql"
-        db_path = const.BASE_DIR / "DB/tables/z_users.db"
-
-        if not db_path.exists():
-            raise FileNotFoundError(f"Database file not found: {db_path}")
-
-        integrity_check = subprocess.run(
-            ["sqlite3", str(db_path), "PRAGMA integrity_check;"],
-            capture_output=True, text=True
-        )
-        if "ok" not in integrity_check.stdout.lower():
-            raise ValueError(f"Database integrity check failed: {integrity_check.stdout}")
-
-        with open(backup_path, 'w') as f:
-            subprocess.run(["sqlite3", str(db_path), ".dump"], stdout=f, check=True)
-
-        subprocess.run(["gzip", str(backup_path)], check=True)
-        if backup_path.exists():
-            backup_path.unlink()
+        backup = await asyncio.to_thread(run_backup)  # Отдельный поток, чтобы не занимать потоки БД
+        if backup is None:
+            logger.info('No changes since last backup')
+            return
+        kind = 'full' if backup.is_full else 'delta'
+        metrics.set(f'backup_{kind}_size_bytes', backup.size)
+        metrics.set('backup_duration_ms', int(backup.duration * 1000))
+        metrics.set('backup_last_ts', int(datetime.now().timestamp()))
 
         await bot.send_document(
             const.ADMIN_ID,
-            document=FSInputFile(f"{backup_path}.gz"),
-            caption="🔧 Бэкап БД",
+            document=FSInputFile(backup.path),
+            caption=f"🔧 {'Бэкап БД' if backup.is_full else 'Изменения БД'}: {backup.size / 1024:.0f} КБ (без сжатия {backup.db_size / 1024:.0f} КБ), "
+                    f"{backup.duration:.1f} с",
             disable_notification=True
         )
 
     except Exception as e:
+        metrics.inc('backup_failures')
         await bot.send_message(const.ADMIN_ID, f"❌ Ошибка бэкапа: {str(e)}")
@@ -40,7 +40,7 @@ def clear_string(text: str):
 
 
 def get_query_count_emoji(count: int) -> str:
-    for emoji, threshold in PHRASES_RU.icon.query.thresholds.__dict__.items():
+    for emoji, threshold in PHRASES_RU.icon.query.thresholds.items():
         if count > threshold:
             return emoji
     return PHRASES_RU.icon.query.default
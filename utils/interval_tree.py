@@ -0,0 +1,147 @@
+import random
+from typing import Any, Dict, Generic, Hashable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+Interval = Tuple[Any, Any, K]  # Начало, конец, ключ
+
+
+class _Node:
+    __slots__ = ('start', 'end', 'key', 'priority', 'max_end', 'left', 'right')
+
+    def __init__(self, start: Any, end: Any, key: Any):
+        self.start = start
+        self.end = end
+        self.key = key
+        self.priority = random.random()
+        self.max_end = end  # Наибольший конец в поддереве
+        self.left: Optional['_Node'] = None
+        self.right: Optional['_Node'] = None
+
+
+def _update(node: _Node) -> _Node:
+    node.max_end = node.end
+    if node.left is not None and node.left.max_end > node.max_end:
+        node.max_end = node.left.max_end
+    if node.right is not None and node.right.max_end > node.max_end:
+        node.max_end = node.right.max_end
+    return node
+
+
+def _split(node: Optional[_Node], order: tuple) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """Делит дерево на узлы меньше order и остальные"""
+    if node is None:
+        return None, None
+    if (node.start, node.key) < order:
+        node.right, right = _split(node.right, order)
+        return _update(node), right
+    left, node.left = _split(node.left, order)
+    return left, _update(node)
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    """Сливает деревья, все узлы left меньше узлов right"""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return _update(left)
+    right.left = _merge(left, right.left)
+    return _update(right)
+
+
+def _remove(node: Optional[_Node], order: tuple) -> Optional[_Node]:
+    if node is None:
+        return None
+    current = (node.start, node.key)
+    if current == order:
+        return _merge(node.left, node.right)
+    if order < current:
+        node.left = _remove(node.left, order)
+    else:
+        node.right = _remove(node.right, order)
+    return _update(node)
+
+
+class IntervalTree(Generic[K]):
+    """Интервальное дерево на декартовом дереве (treap) с полуинтервалами [start, end).
+
+    Узлы упорядочены по (start, key) и хранят наибольший конец поддерева, поэтому добавление,
+    удаление и поиск пересечения занимают O(log n) в среднем. Интервалы, которые только касаются
+    друг друга (конец одного равен началу другого), не пересекаются. Ключи уникальны и сравнимы
+    между собой. Не потокобезопасно.
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        self._root: Optional[_Node] = None
+        self._intervals: Dict[K, Tuple[Any, Any]] = {}
+        for start, end, key in intervals:
+            self.add(start, end, key)
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._intervals
+
+    def __iter__(self) -> Iterator[Interval]:
+        """Интервалы по возрастанию начала"""
+        stack, node = [], self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.start, node.end, node.key
+            node = node.right
+
+    def add(self, start: Any, end: Any, key: K):
+        if not start < end:
+            raise ValueError(f'Interval end {end} must be later than start {start}')
+        if key in self._intervals:
+            raise KeyError(f'Key {key!r} is already in the tree')
+        node = _Node(start, end, key)
+        left, right = _split(self._root, (start, key))
+        self._root = _merge(_merge(left, node), right)
+        self._intervals[key] = start, end
+
+    def remove(self, key: K) -> bool:
+        """Удаляет интервал по ключу. False - такого ключа нет"""
+        interval = self._intervals.pop(key, None)
+        if interval is None:
+            return False
+        self._root = _remove(self._root, (interval[0], key))
+        return True
+
+    def find_overlap(self, start: Any, end: Any) -> Optional[Interval]:
+        """Пересекающийся интервал с наименьшим началом или None"""
+        node = self._root
+        while node is not None:
+            # Если в левом поддереве есть интервал, заканчивающийся после start, то либо он пересекается
+            # с запросом, либо он и все интервалы правее начинаются не раньше end
+            if node.left is not None and node.left.max_end > start:
+                node = node.left
+                continue
+            if node.start >= end:
+                return None
+            if node.end > start:
+                return node.start, node.end, node.key
+            node = node.right
+        return None
+
+    def overlapping(self, start: Any, end: Any) -> Iterator[Interval]:
+        """Все пересекающиеся интервалы по возрастанию начала"""
+        stack, node = [], self._root
+        while stack or node is not None:
+            while node is not None and node.max_end > start:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.start >= end:
+                return
+            if node.end > start:
+                yield node.start, node.end, node.key
+            node = node.right
@@ -0,0 +1,33 @@
+import threading
+from typing import Dict, Union
+
+Number = Union[int, float]
+
+
+class Metrics:
+    """Потокобезопасный реестр счётчиков и текущих значений, выводится командой /metrics"""
+
+    def __init__(self):
+        self._values: Dict[str, Number] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: Number = 1):
+        """Увеличивает счётчик"""
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + value
+
+    def set(self, name: str, value: Number):
+        """Устанавливает текущее значение"""
+        with self._lock:
+            self._values[name] = value
+
+    def get(self, name: str, default: Number = 0) -> Number:
+        with self._lock:
+            return self._values.get(name, default)
+
+    def snapshot(self) -> Dict[str, Number]:
+        with self._lock:
+            return dict(sorted(self._values.items()))
+
+
+metrics = Metrics()
@@ -0,0 +1,61 @@
+from typing import Dict, Generic, Hashable, List, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+
+
+class TimingWheel(Generic[K]):
+    """Колесо таймеров: slots делений по resolution секунд.
+
+    add() и discard() выполняются за O(1), advance() обходит только деления, пройденные с прошлого вызова.
+    В колесе хранятся лишь таймеры в пределах горизонта slots * resolution секунд от текущего деления,
+    более дальние add() не принимает - их нужно добавить позже, когда они приблизятся.
+    """
+
+    def __init__(self, slots: int, resolution: float, start: float):
+        self.slots = slots
+        self.resolution = resolution
+        self._buckets: List[Dict[K, int]] = [{} for _ in range(slots)]
+        self._ticks: Dict[K, int] = {}  # Ключ -> деление, в котором он лежит
+        self._current = self._tick(start)  # Последнее обработанное деление
+
+    def _tick(self, when: float) -> int:
+        return int(when // self.resolution)
+
+    @property
+    def horizon(self) -> float:
+        """Время (timestamp), до которого колесо принимает таймеры"""
+        return (self._current + self.slots) * self.resolution
+
+    def add(self, key: K, when: float) -> bool:
+        """Добавляет или переносит таймер. Просроченный сработает при следующем advance()"""
+        tick = max(self._tick(when), self._current + 1)
+        if tick - self._current >= self.slots:
+            return False
+        self.discard(key)
+        self._buckets[tick % self.slots][key] = tick
+        self._ticks[key] = tick
+        return True
+
+    def discard(self, key: K):
+        tick = self._ticks.pop(key, None)
+        if tick is not None:
+            del self._buckets[tick % self.slots][key]
+
+    def advance(self, now: float) -> List[K]:
+        """Сдвигает колесо до момента now и возвращает сработавшие таймеры"""
+        target = self._tick(now)
+        due: List[K] = []
+        for tick in range(self._current + 1, min(target, self._current + self.slots) + 1):
+            bucket = self._buckets[tick % self.slots]
+            due.extend(bucket)
+            for key in bucket:
+                del self._ticks[key]
+            bucket.clear()
+        self._current = max(self._current, target)
+        return due
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._ticks
+
+    def __len__(self) -> int:
+        return len(self._ticks)